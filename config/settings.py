@@ -22,6 +22,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "src.application.shared.middleware.plot_context_middleware.PlotContextMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -71,3 +72,68 @@ STATICFILES_DIRS = [
 
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Caché en disco (SQLite) de las derivadas simbólicas, compartida entre procesos de gunicorn.
+SYMBOLIC_DISK_CACHE = os.environ.get("SYMBOLIC_DISK_CACHE", "False").lower() == "true"
+
+SYMBOLIC_DISK_CACHE_PATH = Path(
+    os.environ.get("SYMBOLIC_DISK_CACHE_PATH", BASE_DIR / "symbolic_cache.sqlite3")
+)
+
+SYMBOLIC_DISK_CACHE_MAX_ENTRIES = int(os.environ.get("SYMBOLIC_DISK_CACHE_MAX_ENTRIES", "1000"))
+
+
+# Almacén de gráficas SVG: cada gráfica se guarda con un nombre derivado de sus datos de entrada.
+PLOT_STORE_DIR = Path(
+    os.environ.get("PLOT_STORE_DIR", BASE_DIR / "static/img/numerical_method/plots")
+)
+
+PLOT_STORE_MAX_BYTES = int(os.environ.get("PLOT_STORE_MAX_BYTES", str(200 * 1024 * 1024)))
+
+PLOT_STORE_MAX_AGE = int(os.environ.get("PLOT_STORE_MAX_AGE", str(24 * 60 * 60)))
+
+# Bytes máximos de SVG que se conservan en memoria para no volver a leer ni dibujar gráficas repetidas.
+PLOT_RENDER_CACHE_MAX_BYTES = int(
+    os.environ.get("PLOT_RENDER_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+)
+
+# Número máximo de puntos en los que se evalúa la función al graficarla (muestreo adaptativo).
+PLOT_SAMPLE_BUDGET = int(os.environ.get("PLOT_SAMPLE_BUDGET", "2000"))
+
+# Dibujar las gráficas en segundo plano: la página se responde sin esperar a matplotlib y el
+# endpoint de la imagen espera hasta PLOT_RENDER_WAIT segundos a que la gráfica esté lista.
+PLOT_BACKGROUND_RENDERING = os.environ.get("PLOT_BACKGROUND_RENDERING", "True").lower() == "true"
+
+PLOT_RENDER_WAIT = float(os.environ.get("PLOT_RENDER_WAIT", "10"))
+
+# Cómo se dibujan las gráficas sencillas: "svg" (escritor nativo, sin matplotlib) o "matplotlib".
+PLOT_RENDERER = os.environ.get("PLOT_RENDERER", "svg").lower()
+
+# Distancia máxima, en píxeles, entre una curva y su versión simplificada antes de escribirla en
+# el SVG (Ramer-Douglas-Peucker). Con 0 no se simplifica.
+PLOT_SIMPLIFY_TOLERANCE = float(os.environ.get("PLOT_SIMPLIFY_TOLERANCE", "0.25"))
+
+# Comparación de métodos (reportes CSV): cada método se ejecuta en su propio proceso, hasta
+# COMPARISON_WORKERS a la vez entre todas las solicitudes, y se cancela si tarda (o espera un
+# proceso libre) más de COMPARISON_METHOD_TIMEOUT segundos.
+COMPARISON_PARALLEL = os.environ.get("COMPARISON_PARALLEL", "True").lower() == "true"
+
+COMPARISON_WORKERS = int(os.environ.get("COMPARISON_WORKERS", str(os.cpu_count() or 1)))
+
+COMPARISON_METHOD_TIMEOUT = float(os.environ.get("COMPARISON_METHOD_TIMEOUT", "10"))
+
+# Resultados de las comparaciones que se conservan en memoria (0 para no guardar ninguno) y
+# segundos que dura cada uno.
+COMPARISON_CACHE_SIZE = int(os.environ.get("COMPARISON_CACHE_SIZE", "128"))
+
+COMPARISON_CACHE_TTL = float(os.environ.get("COMPARISON_CACHE_TTL", "600"))
+
+# Segundos que una solicitud espera el resultado que otra ya está calculando antes de calcularlo
+# ella misma (por ejemplo, si el cliente de la primera descarga el reporte muy despacio).
+COMPARISON_CACHE_WAIT = float(os.environ.get("COMPARISON_CACHE_WAIT", "15"))
+
+# Pesos con los que se elige el mejor método de los reportes de comparación, por ejemplo
+# "iterations=1,time=0.5,memory=0.1" (ver RANKING_COLUMNS en method_comparison). Vacío conserva
+# el criterio de siempre: menos iteraciones (o menor error en los métodos matriciales).
+COMPARISON_RANKING_WEIGHTS = os.environ.get("COMPARISON_RANKING_WEIGHTS", "")
@@ -25,5 +25,6 @@ class NumericalMethodConfig(AppConfig):
                 "src.application.numerical_method.views.spline_cubic_view",
                 "src.application.numerical_method.views.lagrange_view",
                 "src.application.numerical_method.views.newton_interpol_view",
+                "src.application.numerical_method.views.plot_data_view",
             ]
         )
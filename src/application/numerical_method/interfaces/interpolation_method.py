@@ -7,9 +7,18 @@ class InterpolationMethod(ABC):
         self,
         x: list[float],
         y: list[float],
+        model=None,
     ) -> dict:
         pass
 
+    @abstractmethod
+    def fit(
+        self,
+        x: list[float],
+        y: list[float],
+    ):
+        pass
+
     @abstractmethod
     def validate_input(
         self,
@@ -1,4 +1,6 @@
 import math
+from src.application.shared.utils.expression_parser import parse_expression
+from src.application.shared.utils.method_metrics import counted
 from src.application.shared.utils.plot_function import plot_function
 from src.application.numerical_method.interfaces.interval_method import (
     IntervalMethod,
@@ -34,11 +36,12 @@ class BisectionService(IntervalMethod):
         # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
         current_error = math.inf
 
+        # Interpretamos la función una sola vez para reutilizarla en todas las evaluaciones.
+        compiled_f = counted(parse_expression(function_f).scalar)
+
         # Evaluamos la función en los extremos del intervalo para verificar si alguno de ellos es una raíz exacta.
-        x = interval[0]
-        fa = eval(function_f)
-        x = interval[1]
-        fb = eval(function_f)
+        fa = compiled_f(interval[0])
+        fb = compiled_f(interval[1])
 
         # Si el valor en el extremo inferior es cero, ese punto es una raíz.
         if fa == 0:
@@ -74,8 +77,7 @@ class BisectionService(IntervalMethod):
 
             # Evaluamos la función en el punto medio.
             try:
-                x = Xn
-                f = eval(function_f)
+                f = compiled_f(Xn)
             except Exception as e:
                 return {
                     "message_method": f"Error al evaluar la función en el punto medio: {str(e)}.",
@@ -143,10 +145,8 @@ class BisectionService(IntervalMethod):
                 interval = [Xn, interval[1]]
 
             # Se evalua la función en el nuevo intervalo
-            x = interval[0]
-            fa = eval(function_f)
-            x = interval[1]
-            fb = eval(function_f)
+            fa = compiled_f(interval[0])
+            fb = compiled_f(interval[1])
 
             # Incrementamos el contador de iteraciones.
             current_iteration += 1
@@ -183,10 +183,9 @@ class BisectionService(IntervalMethod):
 
         # Validación de la función ingresada
         try:
-            x = interval_a
-            fa = eval(function_f)
-            x = interval_b
-            fb = eval(function_f)
+            compiled_f = parse_expression(function_f).scalar
+            fa = compiled_f(interval_a)
+            fb = compiled_f(interval_b)
         except ValueError:
             plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]);
             return "Error: Valor fuera del dominio permitido para la función. Verifique que los valores de 'x' sean válidos en el dominio de la función."
@@ -1,4 +1,6 @@
 import math
+from src.application.shared.utils.expression_parser import parse_expression
+from src.application.shared.utils.method_metrics import counted
 from src.application.shared.utils.plot_function import plot_function
 from src.application.numerical_method.interfaces.iterative_method import (
     IterativeMethod,
@@ -32,6 +34,10 @@ class FixedPointService(IterativeMethod):
         # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
         current_error = math.inf
 
+        # Interpretamos las funciones una sola vez para reutilizarlas en todas las iteraciones.
+        compiled_f = counted(parse_expression(function_f).scalar)
+        compiled_g = counted(parse_expression(function_g).scalar)
+
         # Ejecutamos el proceso de punto fijo mientras no se exceda el número máximo de iteraciones.
         while current_iteration <= max_iterations:
             # Almacenamos la información de la iteración actual en la tabla.
@@ -39,12 +45,10 @@ class FixedPointService(IterativeMethod):
 
             try:
                 # Evaluamos el punto inicial en la función g(x) que es equivalente a f(x)
-                x = x0
-                g = eval(function_g)
+                g = compiled_g(x0)
 
                 # El resultado de la función g evaluada en el x0 lo evaluamos en f(x)
-                x = g
-                f = eval(function_f)
+                f = compiled_f(g)
             except Exception as e:
                 return {
                     "message_method": f"El x evaluado en g(x) no pertenece al dominio de la función, la descripción de este error fué: {str(e)}.",
@@ -142,11 +146,12 @@ class FixedPointService(IterativeMethod):
 
         # Validación de las funciones ingresadas
         try:
-            x = x0
-            g = eval(function_g)
+            compiled_f = parse_expression(function_f).scalar
+            compiled_g = parse_expression(function_g).scalar
+
+            g = compiled_g(x0)
 
-            x = g
-            f = eval(function_f)
+            f = compiled_f(g)
         except ValueError:
             plot_function(function_f, False, [(x0, 0)]);
             return "Error: Valor fuera del dominio permitido para la función (f(x) o g(x)). Verifique que los valores de 'x' sean válidos en el dominio de la función."
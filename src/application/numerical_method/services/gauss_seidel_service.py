@@ -1,5 +1,7 @@
 import numpy as np
 from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.shared.utils.method_metrics import count_matrix_vector_products
+from src.application.shared.utils.prepared_system import GAUSS_SEIDEL, PreparedSystem
 from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
 
 
@@ -12,11 +14,14 @@ class GaussSeidelService(MatrixMethod):
         tolerance: float,  # Tolerancia para el error
         max_iterations: int,  # Número máximo de iteraciones
         precision: int,  # Tipo de precisión (1 para decimales correctos, 0 para cifras significativas)
+        prepared: PreparedSystem | None = None,  # Sistema ya preparado (se reutiliza si se pasa)
         **kwargs,
     ) -> dict:
 
-        A = np.array(A)
-        b = np.array(b)
+        if prepared is None:
+            prepared = PreparedSystem(A, b)
+        A = prepared.A
+        b = prepared.b
         x0 = np.array(x0)
 
         n = len(b)
@@ -25,20 +30,15 @@ class GaussSeidelService(MatrixMethod):
         current_iteration = 0
         table = {}
 
-        # Inicialización de matrices para el cálculo de T y C
-        D = np.diag(np.diag(A))
-        L = np.tril(A, -1)
-        U = np.triu(A, 1)
-
-        # Cálculo de la matriz de iteración T para el método Gauss-Seidel
-        T = np.linalg.inv(D - L).dot(U)
-        spectral_radius = max(abs(np.linalg.eigvals(T)))
+        # Radio espectral de la matriz de iteración T para el método Gauss-Seidel
+        spectral_radius = prepared.spectral_radius(GAUSS_SEIDEL)
 
         while current_error > tolerance and current_iteration < max_iterations:
             # Iteración de Gauss-Seidel
             for i in range(n):
                 sum_others = np.dot(A[i, :i], x1[:i]) + np.dot(A[i, i + 1:], x1[i + 1:])
                 x1[i] = (b[i] - sum_others) / A[i, i]
+            count_matrix_vector_products()
 
             current_error = np.linalg.norm(x1 - x0, ord=np.inf)
 
@@ -103,8 +103,8 @@ class GaussSeidelService(MatrixMethod):
 
         # Generar gráficas si la matriz es 2x2 (independientemente de convergencia)
         if len(A) == 2:
-            plot_matrix_solution(table, x1_rounded, spectral_radius)
-            plot_system_equations(A.tolist(), b.tolist(), x1_rounded)
+            result["matrix_solution_plot"] = plot_matrix_solution(table, x1_rounded, spectral_radius)
+            result["system_plot"] = plot_system_equations(A.tolist(), b.tolist(), x1_rounded)
 
         return result
 
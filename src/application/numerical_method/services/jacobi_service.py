@@ -1,5 +1,7 @@
 import numpy as np
 from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.shared.utils.method_metrics import count_matrix_vector_products
+from src.application.shared.utils.prepared_system import JACOBI, PreparedSystem
 from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
 
 
@@ -12,37 +14,39 @@ class JacobiService(MatrixMethod):
         tolerance: float,  # Tolerancia para el error
         max_iterations: int,  # Número máximo de iteraciones
         precision_type: str = "decimales_correctos",  # Tipo de precisión
+        prepared: PreparedSystem | None = None,  # Sistema ya preparado (se reutiliza si se pasa)
         **kwargs,
     ) -> dict:
 
-        A = np.array(A)
-        b = np.array(b)
-        x0 = np.array(x0)
-
-        n = len(b)
+        if prepared is None:
+            prepared = PreparedSystem(A, b)
+        A = prepared.A
+        b = prepared.b
+        # Vectores de trabajo: se reservan una vez y cada iteración escribe sobre ellos.
+        x0 = np.array(x0, dtype=float)
         x1 = np.zeros_like(x0)
+        residual = np.zeros_like(x0)
+        difference = np.zeros_like(x0)
         current_error = tolerance + 1
         current_iteration = 0
         table = {}
 
-        # Inicialización de matrices para el cálculo de T y C
-        D = np.diag(np.diag(A))
-        L = np.tril(A, -1)
-        U = np.triu(A, 1)
-
-        # Cálculo de la matriz de iteración T para el método Jacobi
-        T = np.linalg.inv(D).dot(L + U)
-        spectral_radius = max(abs(np.linalg.eigvals(T)))
+        # Radio espectral de la matriz de iteración T = D^-1 (L + U)
+        spectral_radius = prepared.spectral_radius(JACOBI)
 
         while current_error > tolerance and current_iteration < max_iterations:
-            # Iteración de Jacobi
-            for i in range(n):
-                sum_others = np.dot(A[i, :i], x0[:i]) + np.dot(
-                    A[i, i + 1 :], x0[i + 1 :]
-                )
-                x1[i] = (b[i] - sum_others) / A[i, i]
-
-            current_error = np.linalg.norm(x1 - x0, ord=np.inf)
+            # Iteración de Jacobi: x1 = D^-1 (b - (L + U) x0), en un solo producto matriz-vector.
+            # BLAS suma cada fila en otro orden que los dos `np.dot` por fila de antes, así que los
+            # valores sin redondear pueden cambiar en la última cifra. La tabla redondeada solo
+            # cambia si esa cifra cae dentro de los decimales que se muestran, es decir, con valores
+            # muy grandes (por ejemplo, cuando el método diverge).
+            np.dot(prepared.off_diagonal, x0, out=residual)
+            np.subtract(b, residual, out=residual)
+            np.divide(residual, prepared.diagonal, out=x1)
+            count_matrix_vector_products()
+
+            np.subtract(x1, x0, out=difference)
+            current_error = np.abs(difference, out=difference).max()
 
             # Aplicar precisión según el tipo seleccionado
             formatted_x1 = self.apply_precision(x1.tolist(), precision_type, tolerance)
@@ -63,8 +67,8 @@ class JacobiService(MatrixMethod):
                 }
                 break
 
-            # Preparación para la siguiente iteración
-            x0 = x1.copy()
+            # Preparación para la siguiente iteración: se intercambian los vectores en lugar de copiarlos
+            x0, x1 = x1, x0
             current_iteration += 1
 
         # Verificación de éxito o fallo tras las iteraciones
@@ -100,8 +104,8 @@ class JacobiService(MatrixMethod):
         # Generar gráficas si la matriz es 2x2 (independientemente de convergencia)
         if len(A) == 2:
             # Usa la última solución calculada (x1 o formatted_x1)
-            plot_matrix_solution(table, formatted_x1, spectral_radius)
-            plot_system_equations(A.tolist(), b.tolist(), formatted_x1)
+            result["matrix_solution_plot"] = plot_matrix_solution(table, formatted_x1, spectral_radius)
+            result["system_plot"] = plot_system_equations(A.tolist(), b.tolist(), formatted_x1)
 
         return result
 
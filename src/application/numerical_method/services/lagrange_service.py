@@ -1,16 +1,45 @@
 import numpy as np
+from numpy.polynomial import Polynomial
 from src.application.numerical_method.interfaces.interpolation_method import (
     InterpolationMethod,
 )
 from src.application.shared.utils.build_polynomial import build_polynomial
+from src.application.shared.utils.interpolation_points import parse_points, point_limit_error
 
 
 class LagrangeService(InterpolationMethod):
+    # Número máximo de puntos que acepta el método.
+    max_points = 10
+    # Número mínimo de puntos para calcular el polinomio.
+    min_points = 1
+
     def solve(
         self,
         x: list[float],
         y: list[float],
+        model: Polynomial | None = None,  # Polinomio ya calculado con `fit` para estos puntos (se reutiliza si se pasa)
     ) -> dict:
+        if model is None:
+            model = self.fit(x, y)
+        coefficients = model.coef
+
+        # Construcción del polinomio en forma de cadena
+        polynomial = build_polynomial(coefficients)
+
+        return {
+            "message_method": "El polinomio interpolante fue encontrado con éxito.",
+            "polynomial": polynomial,
+            "is_successful": True,
+            "have_solution": True,
+        }
+
+    def fit(self, x: list[float], y: list[float]) -> Polynomial:
+        """
+        Calcula el polinomio interpolante de Lagrange de los puntos.
+
+        Returns:
+            Polynomial: El polinomio, con los coeficientes de la potencia menor a la mayor.
+        """
         n = len(x)
         coefficients_table = np.zeros((n, n))
 
@@ -28,49 +57,15 @@ class LagrangeService(InterpolationMethod):
         # Suma de los polinomios Lagrange para obtener el polinomio interpolante
         coefficients = np.sum(coefficients_table, axis=0)
 
-        # Asegurar que los coeficientes estén en orden descendente de grado
-        coefficients = coefficients[::-1]
-
-        # Construcción del polinomio en forma de cadena
-        polynomial = build_polynomial(coefficients)
-
-        return {
-            "message_method": "El polinomio interpolante fue encontrado con éxito.",
-            "polynomial": polynomial,
-            "is_successful": True,
-            "have_solution": True,
-        }
+        # np.convolve deja los coeficientes de la potencia mayor a la menor; Polynomial los usa al revés.
+        return Polynomial(coefficients[::-1])
 
     def validate_input(
         self, x_input: str, y_input: str
     ) -> str | list[tuple[float, float]]:
-        max_points = 10
-
-        # Convertir las cadenas de entrada en listas
-        x_list = [value.strip() for value in x_input.split(" ") if value.strip()]
-        y_list = [value.strip() for value in y_input.split(" ") if value.strip()]
-
-        # Validar que las listas no estén vacías
-        if len(x_list) == 0 or len(y_list) == 0:
-            return "Error: Las listas de 'x' y 'y' no pueden estar vacías."
-
-        # Validar que ambas listas tengan el mismo tamaño
-        if len(x_list) != len(y_list):
-            return "Error: Las listas de 'x' y 'y' deben tener la misma cantidad de elementos."
-
-        # Validar que cada elemento de x_list y y_list es numérico
-        try:
-            x_values = [float(value) for value in x_list]
-            y_values = [float(value) for value in y_list]
-        except ValueError:
-            return "Error: Todos los valores de 'x' y 'y' deben ser numéricos."
-
-        # Validamos que los elementos de x sean únicos.
-        if len(set(x_values)) != len(x_values):
-            return "Error: Los valores de 'x' deben ser únicos."
+        response_validation = parse_points(x_input, y_input)
+        if isinstance(response_validation, str):
+            return response_validation
 
         # Verificar que el número de puntos no exceda el límite máximo
-        if len(x_values) > max_points:
-            return f"Error: El número máximo de puntos es {max_points}."
-
-        return [x_values, y_values]
\ No newline at end of file
+        return point_limit_error(response_validation[0], self.max_points) or response_validation
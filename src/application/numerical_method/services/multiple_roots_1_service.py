@@ -1,9 +1,12 @@
-import sympy as sp
 import math
 from src.application.numerical_method.interfaces.iterative_method import (
     IterativeMethod,
 )
-from src.application.shared.utils.convert_math_to_simply import convert_math_to_sympy
+from src.application.shared.utils.derivatives import (
+    SYMBOLIC,
+    derivative_evaluator,
+    uses_variable,
+)
 from src.application.shared.utils.plot_function import plot_function
 
 class MultipleRoots1Service(IterativeMethod):
@@ -17,18 +20,10 @@ class MultipleRoots1Service(IterativeMethod):
         multiplicity: int,
         **kwargs,
     ) -> dict:
-        # Inicializa la variable simbólica para usar en SymPy
-        x = sp.symbols("x")
-
-        # Convierte la función ingresada de `math` a `SymPy`
-        sympy_function_f = convert_math_to_sympy(function_f)
-        # Intenta convertir la función a una expresión simbólica usando sympify
-        f_expr = sp.sympify(sympy_function_f)
-        f_prime_expr = sp.diff(f_expr, x)  # Calcular la derivada simbólicamente
-
-        # Crea funciones evaluables en Python utilizando lambdify
-        f = sp.lambdify(x, f_expr, modules=["math"])
-        f_prime = sp.lambdify(x, f_prime_expr, modules=["math"])
+        # Evaluador de f(x) y f'(x): simbólico (SymPy) o por diferenciación automática
+        evaluate = derivative_evaluator(
+            function_f, 1, kwargs.get("differentiation", SYMBOLIC)
+        )
 
         # Definición de tabla que contiene todo el proceso
         table = {}
@@ -40,8 +35,7 @@ class MultipleRoots1Service(IterativeMethod):
         while current_iteration <= max_iterations:
             # Evaluar f(x) y f'(x) en el valor actual de x0
             try:
-                fx = f(x0_current)
-                f_prime_x = f_prime(x0_current)
+                fx, f_prime_x = evaluate(x0_current)
                 if f_prime_x == 0:
                     return {
                         "message_method": f"La derivada es cero en x = {x0_current}. No se puede continuar.",
@@ -124,11 +118,6 @@ class MultipleRoots1Service(IterativeMethod):
         **kwargs,
     ) -> str | bool:
 
-        # Inicializa la variable simbólica para usar en SymPy
-        x = sp.symbols("x")
-        # Convierte la función ingresada de `math` a `SymPy`
-        sympy_function_f = convert_math_to_sympy(function_f)
-
         # Validación de los parámetros de entrada tolerancia positiva
         if not isinstance(tolerance, (int, float)) or tolerance <= 0:
             plot_function(function_f, False, [(x0, 0)]);  # Graficar incluso si hay error
@@ -140,10 +129,8 @@ class MultipleRoots1Service(IterativeMethod):
             return "El máximo número de iteraciones debe ser un entero positivo."
 
         try:
-            f_expr = sp.sympify(sympy_function_f)
-            if f_expr.free_symbols != {x}:
+            if not uses_variable(function_f, 1, kwargs.get("differentiation", SYMBOLIC)):
                 return "Error al interpretar la función: utilice la variable 'x'."
-            f_prime_expr = sp.diff(f_expr, x)
         except Exception as e:
             return f"Error al interpretar la función ingresada o su derivada: {str(e)}."
 
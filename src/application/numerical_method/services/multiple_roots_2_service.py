@@ -1,9 +1,12 @@
-import sympy as sp
 import math
 from src.application.numerical_method.interfaces.iterative_method import (
     IterativeMethod,
 )
-from src.application.shared.utils.convert_math_to_simply import convert_math_to_sympy
+from src.application.shared.utils.derivatives import (
+    SYMBOLIC,
+    derivative_evaluator,
+    uses_variable,
+)
 from src.application.shared.utils.plot_function import plot_function
 
 class MultipleRoots2Service(IterativeMethod):
@@ -16,21 +19,10 @@ class MultipleRoots2Service(IterativeMethod):
         function_f: str,
         **kwargs,
     ) -> dict:
-        # Inicializa la variable simbólica para usar en SymPy
-        x = sp.symbols("x")
-
-        # Convierte la función ingresada de `math` a `SymPy`
-        sympy_function_f = convert_math_to_sympy(function_f)
-
-        # Intenta convertir la función a una expresión simbólica usando sympify
-        f_expr = sp.sympify(sympy_function_f)
-        f_prime_expr = sp.diff(f_expr, x)  # Primera derivada
-        f_double_prime_expr = sp.diff(f_prime_expr, x)  # Segunda derivada
-
-        # Crea funciones evaluables en Python utilizando lambdify
-        f = sp.lambdify(x, f_expr, modules=["math"])
-        f_prime = sp.lambdify(x, f_prime_expr, modules=["math"])
-        f_double_prime = sp.lambdify(x, f_double_prime_expr, modules=["math"])
+        # Evaluador de f(x), f'(x) y f''(x): simbólico (SymPy) o por diferenciación automática
+        evaluate = derivative_evaluator(
+            function_f, 2, kwargs.get("differentiation", SYMBOLIC)
+        )
 
         # Definición de tabla que contiene todo el proceso
         table = {}
@@ -43,9 +35,7 @@ class MultipleRoots2Service(IterativeMethod):
         # Bucle del método de raíces múltiples con segunda derivada
         while current_iteration <= max_iterations:
             try:
-                fx = f(x0_current)
-                f_prime_x = f_prime(x0_current)
-                f_double_prime_x = f_double_prime(x0_current)
+                fx, f_prime_x, f_double_prime_x = evaluate(x0_current)
 
                 if f_prime_x == 0 or f_double_prime_x == 0:
                     return {
@@ -128,10 +118,7 @@ class MultipleRoots2Service(IterativeMethod):
         function_f: str,
         **kwargs,
     ) -> str | bool:
-        # Inicializa la variable simbólica para usar en SymPy
-        x = sp.symbols("x")
-        # Convierte la función ingresada de `math` a `SymPy`
-        sympy_function_f = convert_math_to_sympy(function_f)
+        differentiation = kwargs.get("differentiation", SYMBOLIC)
 
         # Validación de los parámetros de entrada tolerancia positiva
         if not isinstance(tolerance, (int, float)) or tolerance <= 0:
@@ -144,18 +131,13 @@ class MultipleRoots2Service(IterativeMethod):
             return "El máximo número de iteraciones debe ser un entero positivo."
 
         try:
-            f_expr = sp.sympify(sympy_function_f)
-            if f_expr.free_symbols != {x}:
+            if not uses_variable(function_f, 2, differentiation):
                 return "Error al interpretar la función: utilice la variable 'x'."
-            f_prime_expr = sp.diff(f_expr, x)
-            f_double_prime_expr = sp.diff(f_prime_expr, x)
         except Exception as e:
             return f"Error al interpretar o derivar la función ingresada: {str(e)}."
 
         try:
-            sp.lambdify(x, f_expr, modules=["math"])
-            sp.lambdify(x, f_prime_expr, modules=["math"])
-            sp.lambdify(x, f_double_prime_expr, modules=["math"])
+            derivative_evaluator(function_f, 2, differentiation)
         except Exception as e:
             return f"Error al convertir la función o sus derivadas a formato numérico: {str(e)}."
 
@@ -1,11 +1,23 @@
 import numpy as np
 import sympy as sp
+from numpy.polynomial import Polynomial
 from src.application.numerical_method.interfaces.interpolation_method import (
     InterpolationMethod,
 )
+from src.application.shared.utils.interpolation_points import parse_points, point_limit_error
 
 class NewtonInterpolService(InterpolationMethod):
-    def solve(self, x: list[float], y: list[float]) -> dict:
+    # Número máximo de puntos que acepta el método.
+    max_points = 10
+    # Número mínimo de puntos para calcular el polinomio.
+    min_points = 1
+
+    def solve(
+        self,
+        x: list[float],
+        y: list[float],
+        model: Polynomial | None = None,  # Polinomio ya calculado con `fit` para estos puntos (se reutiliza si se pasa)
+    ) -> dict:
         # Verificar que las listas de entrada tengan el mismo tamaño
         if len(x) != len(y):
             return {
@@ -15,6 +27,38 @@ class NewtonInterpolService(InterpolationMethod):
                 "have_solution": False,
             }
 
+        if model is None:
+            model = self.fit(x, y)
+
+        # Polinomio simbólico, ya expandido, con los coeficientes del modelo
+        x_symbol = sp.symbols("x")
+        polynomial = sp.Poly(model.coef[::-1].tolist(), x_symbol).as_expr()
+
+        return {
+            "message_method": "El polinomio interpolante fue encontrado con éxito.",
+            "polynomial": str(polynomial),
+            "is_successful": True,
+            "have_solution": True,
+        }
+
+    def fit(self, x: list[float], y: list[float]) -> Polynomial:
+        """
+        Calcula el polinomio interpolante de Newton de los puntos.
+
+        Returns:
+            Polynomial: El polinomio, con los coeficientes de la potencia menor a la mayor.
+        """
+        coefficients = self._divided_differences(x, y)
+
+        # Forma de Newton: c0 + c1 (x - x0) + c2 (x - x0)(x - x1) + ...
+        polynomial = Polynomial([coefficients[0]])
+        term = Polynomial([1.0])
+        for i in range(1, len(x)):
+            term = term * Polynomial([-x[i - 1], 1.0])
+            polynomial = polynomial + coefficients[i] * term
+        return polynomial
+
+    def _divided_differences(self, x: list[float], y: list[float]) -> np.ndarray:
         # Número de puntos
         n = len(x)
 
@@ -29,56 +73,15 @@ class NewtonInterpolService(InterpolationMethod):
                     divided_diff_table[i + 1, j - 1] - divided_diff_table[i, j - 1]
                 ) / (x[i + j] - x[i])
 
-        # Obtener los coeficientes de la primera fila de cada columna
-        coefficients = divided_diff_table[0, :]
-
-        # Construir el polinomio simbólico
-        x_symbol = sp.symbols("x")
-        polynomial = coefficients[0]
-        term = 1
-
-        for i in range(1, n):
-            term *= (x_symbol - x[i - 1])
-            polynomial += coefficients[i] * term
-
-        # Simplificar el polinomio
-        simplified_polynomial = sp.simplify(polynomial)
-
-        return {
-            "message_method": "El polinomio interpolante fue encontrado con éxito.",
-            "polynomial": str(simplified_polynomial),
-            "is_successful": True,
-            "have_solution": True,
-        }
-
-    def validate_input(self, x_input: str, y_input: str) -> str | list[tuple[float, float]]:
-        max_points = 10
-
-        # Convertir las cadenas de entrada en listas
-        x_list = [value.strip() for value in x_input.split(" ") if value.strip()]
-        y_list = [value.strip() for value in y_input.split(" ") if value.strip()]
-
-        # Validar que las listas no estén vacías
-        if len(x_list) == 0 or len(y_list) == 0:
-            return "Error: Las listas de 'x' y 'y' no pueden estar vacías."
+        # Los coeficientes son la primera fila de cada columna
+        return divided_diff_table[0, :]
 
-        # Validar que ambas listas tengan el mismo tamaño
-        if len(x_list) != len(y_list):
-            return "Error: Las listas de 'x' y 'y' deben tener la misma cantidad de elementos."
-
-        # Validar que cada elemento de x_list y y_list es numérico
-        try:
-            x_values = [float(value) for value in x_list]
-            y_values = [float(value) for value in y_list]
-        except ValueError:
-            return "Error: Todos los valores de 'x' y 'y' deben ser numéricos."
-
-        # Validar que los elementos de x sean únicos
-        if len(set(x_values)) != len(x_values):
-            return "Error: Los valores de 'x' deben ser únicos."
+    def validate_input(
+        self, x_input: str, y_input: str
+    ) -> str | list[tuple[float, float]]:
+        response_validation = parse_points(x_input, y_input)
+        if isinstance(response_validation, str):
+            return response_validation
 
         # Verificar que el número de puntos no exceda el límite máximo
-        if len(x_values) > max_points:
-            return f"Error: El número máximo de puntos es {max_points}."
-
-        return [x_values, y_values]
+        return point_limit_error(response_validation[0], self.max_points) or response_validation
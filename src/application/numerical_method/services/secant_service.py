@@ -1,4 +1,6 @@
 import math
+from src.application.shared.utils.expression_parser import parse_expression
+from src.application.shared.utils.method_metrics import counted
 from src.application.numerical_method.interfaces.interval_method import (
     IntervalMethod,
 )
@@ -28,11 +30,11 @@ class SecantService(IntervalMethod):
         current_iteration = 1
         # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
         current_error = math.inf
+        # Interpretamos la función una sola vez para reutilizarla en todas las evaluaciones.
+        compiled_f = counted(parse_expression(function_f).scalar)
         # Evaluamos la función en los puntos iniciales interval_a y interval_b
-        x = interval_a
-        f_a = eval(function_f)
-        x = interval_b
-        f_b = eval(function_f)
+        f_a = compiled_f(interval_a)
+        f_b = compiled_f(interval_b)
 
         # Bucle del método de la secante
         while current_iteration <= max_iterations:
@@ -51,8 +53,7 @@ class SecantService(IntervalMethod):
             Xn = interval_b - (f_b * (interval_b - interval_a) / (f_b - f_a))
             # Evaluamos la función en el nuevo valor aproximado
             try:
-                x = Xn
-                f = eval(function_f)
+                f = compiled_f(Xn)
             except Exception as e:
                 return {
                     "message_method": f"Error al evaluar la función en el punto aproximado: {str(e)}.",
@@ -113,10 +114,8 @@ class SecantService(IntervalMethod):
             interval_b = Xn
             # Re-evaluar las funciones en los nuevos puntos
             try:
-                x = interval_a
-                f_a = eval(function_f)
-                x = interval_b
-                f_b = eval(function_f)
+                f_a = compiled_f(interval_a)
+                f_b = compiled_f(interval_b)
             except Exception as e:
                 return {
                     "message_method": f"Error durante la evaluación en el nuevo intervalo: {str(e)}.",
@@ -160,10 +159,9 @@ class SecantService(IntervalMethod):
         # Evaluamos la función en los puntos iniciales interval_a y interval_b
         
         try:
-            x = interval_a
-            f_a = eval(function_f)
-            x = interval_b
-            f_b = eval(function_f)
+            compiled_f = parse_expression(function_f).scalar
+            f_a = compiled_f(interval_a)
+            f_b = compiled_f(interval_b)
         except ValueError as ve:
             plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]);
             return f"Error de dominio matemático al evaluar la función: {str(ve)}. Asegúrese de que los valores iniciales están en el dominio válido de la función."
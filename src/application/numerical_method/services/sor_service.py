@@ -1,5 +1,7 @@
 import numpy as np
 from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.shared.utils.method_metrics import count_matrix_vector_products
+from src.application.shared.utils.prepared_system import SOR, PreparedSystem
 from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
 
 
@@ -13,49 +15,30 @@ class SORService(MatrixMethod):
         max_iterations: int,  # Número máximo de iteraciones
         relaxation_factor: float,  # Factor de relajación (w)
         precision_type: int,  # Tipo de precisión (1 para decimales, 0 para cifras significativas)
+        prepared: PreparedSystem | None = None,  # Sistema ya preparado (se reutiliza si se pasa)
         **kwargs,
     ) -> dict:
 
-        A = np.array(A)
-        b = np.array(b)
+        if prepared is None:
+            prepared = PreparedSystem(A, b)
+        A = prepared.A
+        b = prepared.b
         x0 = np.array(x0)
 
-        n = len(b)
         x = x0.copy()
         table = {}
 
-        # Inicialización de matrices para el cálculo de T y C
-        D = np.diag(np.diag(A))
-        L = -np.tril(A, -1)
-        U = -np.triu(A, 1)
-
-        # Cálculo de la matriz de iteración T para el método SOR
-        T = np.linalg.inv(D - relaxation_factor * L).dot((1 - relaxation_factor) * D + relaxation_factor * U)
-        spectral_radius = max(abs(np.linalg.eigvals(T)))
+        # Radio espectral de la matriz de iteración T para el método SOR
+        spectral_radius = prepared.spectral_radius(SOR, relaxation_factor)
 
         current_error = tolerance + 1
         current_iteration = 0
 
         # Iteración SOR
         while current_error > tolerance and current_iteration < max_iterations:
-            x_new = x.copy()
-            for i in range(n):
-                sum_others = np.dot(A[i, :i], x_new[:i]) + np.dot(A[i, i + 1:], x[i + 1:])
-                x_new[i] = (1 - relaxation_factor) * x[i] + (relaxation_factor / A[i, i]) * (b[i] - sum_others)
-
-            # Calcular el error como norma infinito de la diferencia
-            current_error = np.linalg.norm(x_new - x, ord=np.inf)
-
-            # Aplicar precisión al vector de soluciones y al error
-            if precision_type == 1:  # Decimales correctos
-                x_new = np.round(x_new, int(-np.floor(np.log10(tolerance))))
-                current_error_rounded = round(current_error, int(-np.floor(np.log10(tolerance))))
-            elif precision_type == 0:  # Cifras significativas
-                factor = 10 ** int(np.ceil(np.log10(abs(1 / tolerance))))
-                x_new = np.round(x_new * factor) / factor
-                current_error_rounded = round(current_error * factor) / factor
-            else:
-                current_error_rounded = current_error
+            x_new, current_error = self._iterate(prepared, x, tolerance, relaxation_factor, precision_type)
+            count_matrix_vector_products()
+            current_error_rounded = self._round_error(current_error, tolerance, precision_type)
 
             # Guardar la fila SOLO si current_error > tolerance o si es la última iteración
             if current_error > tolerance or current_iteration + 1 == max_iterations:
@@ -108,11 +91,68 @@ class SORService(MatrixMethod):
 
         # Generar gráficas si la matriz es 2x2 (independientemente de convergencia)
         if len(A) == 2:
-            plot_matrix_solution(table, x.tolist(), spectral_radius)
-            plot_system_equations(A.tolist(), b.tolist(), x.tolist())
+            result["matrix_solution_plot"] = plot_matrix_solution(table, x.tolist(), spectral_radius)
+            result["system_plot"] = plot_system_equations(A.tolist(), b.tolist(), x.tolist())
 
         return result
 
+    def iterations_to_converge(
+        self,
+        prepared: PreparedSystem,  # Sistema ya preparado
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para el error
+        max_iterations: int,  # Número máximo de iteraciones
+        relaxation_factor: float,  # Factor de relajación (w)
+        precision_type: int,  # Tipo de precisión (1 para decimales, 0 para cifras significativas)
+    ) -> int | None:
+        """
+        Iteraciones que necesita `solve` para converger, sin tabla, valores propios ni gráficas.
+
+        Se detiene en cuanto pasa de `max_iterations`, así que sirve para comparar factores de
+        relajación con el mejor encontrado hasta el momento como límite.
+
+        Returns:
+            int | None: Número de iteraciones, o None si no converge en `max_iterations`.
+        """
+        x = np.array(x0)
+        for iteration in range(1, max_iterations + 1):
+            x, current_error = self._iterate(prepared, x, tolerance, relaxation_factor, precision_type)
+            if current_error <= tolerance:
+                return iteration
+            if not np.isfinite(current_error):
+                # El método diverge: `solve` falla con este error.
+                return None
+        return None
+
+    def _iterate(self, prepared: PreparedSystem, x, tolerance, relaxation_factor, precision_type):
+        # Una iteración de SOR: el nuevo vector (ya con la precisión aplicada) y el error.
+        A = prepared.A
+        b = prepared.b
+        x_new = x.copy()
+        for i in range(prepared.n):
+            sum_others = np.dot(A[i, :i], x_new[:i]) + np.dot(A[i, i + 1:], x[i + 1:])
+            x_new[i] = (1 - relaxation_factor) * x[i] + (relaxation_factor / A[i, i]) * (b[i] - sum_others)
+
+        # Calcular el error como norma infinito de la diferencia
+        current_error = np.linalg.norm(x_new - x, ord=np.inf)
+
+        # Aplicar precisión al vector de soluciones
+        if precision_type == 1:  # Decimales correctos
+            x_new = np.round(x_new, int(-np.floor(np.log10(tolerance))))
+        elif precision_type == 0:  # Cifras significativas
+            factor = 10 ** int(np.ceil(np.log10(abs(1 / tolerance))))
+            x_new = np.round(x_new * factor) / factor
+        return x_new, current_error
+
+    def _round_error(self, current_error, tolerance, precision_type):
+        # El error con la misma precisión que el vector de soluciones, para la tabla.
+        if precision_type == 1:  # Decimales correctos
+            return round(current_error, int(-np.floor(np.log10(tolerance))))
+        if precision_type == 0:  # Cifras significativas
+            factor = 10 ** int(np.ceil(np.log10(abs(1 / tolerance))))
+            return round(current_error * factor) / factor
+        return current_error
+
     def validate_input(
         self,
         matrix_a_raw: str,
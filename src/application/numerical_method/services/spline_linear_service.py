@@ -1,38 +1,48 @@
 import numpy as np
+from scipy.interpolate import PPoly
 from src.application.numerical_method.interfaces.interpolation_method import InterpolationMethod
 from src.application.shared.utils.plot_spline import plot_spline_linear
+from src.application.shared.utils.interpolation_points import parse_points, point_limit_error
 
 
 class SplineLinearService(InterpolationMethod):
+    # Número máximo de puntos que acepta el método.
+    max_points = 8
+    # Número mínimo de puntos para calcular el spline.
+    min_points = 2
+
     def solve(
         self,
         x: list[float],
         y: list[float],
+        model: PPoly | None = None,  # Spline ya calculado con `fit` para estos puntos (se reutiliza si se pasa)
     ) -> dict:
         n = len(x)
-        if n < 2:
+        if n < self.min_points:
             return {
-                "message_method": "Se necesitan al menos 2 puntos para calcular un spline lineal.",
+                "message_method": f"Se necesitan al menos {self.min_points} puntos para calcular un spline lineal.",
                 "is_successful": False,
                 "have_solution": False,
                 "tramos": [],
             }
 
+        if model is None:
+            model = self.fit(x, y)
+        # Pendiente (m) y valor inicial de cada tramo, de izquierda a derecha
+        slopes, intercepts = model.c
+
         tramos = []
         equations = []
 
         for i in range(n - 1):
-            # Calcular la pendiente (m)
-            m = (y[i + 1] - y[i]) / (x[i + 1] - x[i])
             # Construir el polinomio en formato evaluable
-            tramo = f"{m:.4f}*(x - ({x[i]:.4f})) + {y[i]:.4f}"
+            tramo = f"{slopes[i]:.4f}*(x - ({model.x[i]:.4f})) + {intercepts[i]:.4f}"
             tramos.append(tramo)
             equations.append(f"Tramo {i + 1}: {tramo}")
 
         # Generar la gráfica del spline
-        points = list(zip(x, y))
-        sorted_points = sorted(points, key=lambda point: point[0])
-        plot_spline_linear(sorted_points)
+        sorted_points = sorted(zip(x, y), key=lambda point: point[0])
+        spline_plot = plot_spline_linear(sorted_points)
 
         return {
             "message_method": "Spline lineal calculado con éxito.",
@@ -40,38 +50,28 @@ class SplineLinearService(InterpolationMethod):
             "have_solution": True,
             "tramos": tramos,
             "equations": equations,
+            "spline_plot": spline_plot,
         }
 
+    def fit(self, x: list[float], y: list[float]) -> PPoly:
+        """
+        Calcula el spline lineal de los puntos (se ordenan por x).
+
+        Returns:
+            PPoly: Polinomio por tramos S_i(x) = y_i + m_i*(x-x_i).
+        """
+        points = sorted(zip(x, y), key=lambda point: point[0])
+        x = np.array([point[0] for point in points])
+        y = np.array([point[1] for point in points])
+        slopes = np.diff(y) / np.diff(x)
+        return PPoly(np.array([slopes, y[:-1]]), x)
+
     def validate_input(
         self, x_input: str, y_input: str
     ) -> str | list[tuple[float, float]]:
-        max_points = 8
-
-        # Convertir las cadenas de entrada en listas
-        x_list = [value.strip() for value in x_input.split(" ") if value.strip()]
-        y_list = [value.strip() for value in y_input.split(" ") if value.strip()]
-
-        # Validar que las listas no estén vacías
-        if len(x_list) == 0 or len(y_list) == 0:
-            return "Error: Las listas de 'x' y 'y' no pueden estar vacías."
-
-        # Validar que ambas listas tengan el mismo tamaño
-        if len(x_list) != len(y_list):
-            return "Error: Las listas de 'x' y 'y' deben tener la misma cantidad de elementos."
-
-        # Validar que cada elemento de x_list y y_list es numérico
-        try:
-            x_values = [float(value) for value in x_list]
-            y_values = [float(value) for value in y_list]
-        except ValueError:
-            return "Error: Todos los valores de 'x' y 'y' deben ser numéricos."
-
-        # Validamos que los elementos de x sean únicos.
-        if len(set(x_values)) != len(x_values):
-            return "Error: Los valores de 'x' deben ser únicos."
+        response_validation = parse_points(x_input, y_input)
+        if isinstance(response_validation, str):
+            return response_validation
 
         # Verificar que el número de puntos no exceda el límite máximo
-        if len(x_values) > max_points:
-            return f"Error: El número máximo de puntos es {max_points}."
-
-        return [x_values, y_values]
+        return point_limit_error(response_validation[0], self.max_points) or response_validation
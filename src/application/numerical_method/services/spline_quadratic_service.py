@@ -1,13 +1,25 @@
 import numpy as np
+from scipy.interpolate import PPoly
 from src.application.numerical_method.interfaces.interpolation_method import InterpolationMethod
 from src.application.shared.utils.plot_spline import plot_spline_quadratic
+from src.application.shared.utils.interpolation_points import parse_points, point_limit_error
 
 class SplineQuadraticService(InterpolationMethod):
-    def solve(self, x: list[float], y: list[float]) -> dict:
+    # Número máximo de puntos que acepta el método.
+    max_points = 8
+    # Número mínimo de puntos para calcular el spline.
+    min_points = 3
+
+    def solve(
+        self,
+        x: list[float],
+        y: list[float],
+        model: PPoly | None = None,  # Spline ya calculado con `fit` para estos puntos (se reutiliza si se pasa)
+    ) -> dict:
         n = len(x)
-        if n < 3:
+        if n < self.min_points:
             return {
-                "message_method": "Se necesitan al menos 3 puntos para calcular un spline cuadrático.",
+                "message_method": f"Se necesitan al menos {self.min_points} puntos para calcular un spline cuadrático.",
                 "is_successful": False,
                 "have_solution": False,
                 "tramos": [],
@@ -16,14 +28,39 @@ class SplineQuadraticService(InterpolationMethod):
         points = sorted(zip(x, y), key=lambda p: p[0])
         x = [p[0] for p in points]
         y = [p[1] for p in points]
+
+        spline = model if model is not None else self.fit(x, y)
+        # Los coeficientes de PPoly van de la potencia mayor a la menor: c_i, b_i, a_i.
+        c, b, a = spline.c
+
+        tramos = []
+        for i in range(len(x)-1):
+            tramo = f"{a[i]:.4f} + {b[i]:.4f}*(x - {x[i]:.4f}) + {c[i]:.4f}*(x - {x[i]:.4f})^2"
+            tramos.append(tramo)
+        spline_plot = plot_spline_quadratic("Spline Cuadrático", points, spline)
+        return {
+            "is_successful": True,
+            "have_solution": True,
+            "tramos": tramos,
+            "spline_plot": spline_plot,
+        }
+
+    def fit(self, x: list[float], y: list[float]) -> PPoly:
+        """
+        Calcula el spline cuadrático de los puntos (se ordenan por x).
+
+        Returns:
+            PPoly: Polinomio por tramos S_i(x) = a_i + b_i*(x-x_i) + c_i*(x-x_i)^2.
+        """
+        points = sorted(zip(x, y), key=lambda p: p[0])
+        x = [p[0] for p in points]
+        y = [p[1] for p in points]
         n = len(x)
         h = [x[i+1] - x[i] for i in range(n-1)]
 
         # Sistema para coeficientes a, b, c de cada tramo
         # S_i(x) = a_i + b_i*(x-x_i) + c_i*(x-x_i)^2
         a = [y[i] for i in range(n-1)]
-        b = [0]*(n-1)
-        c = [0]*(n-1)
 
         # Ecuaciones:
         # 1. S_i(x_{i+1}) = y_{i+1}
@@ -58,32 +95,14 @@ class SplineQuadraticService(InterpolationMethod):
         b = sol[:n-1]
         c = sol[n-1:]
 
-        tramos = []
-        for i in range(n-1):
-            tramo = f"{a[i]:.4f} + {b[i]:.4f}*(x - {x[i]:.4f}) + {c[i]:.4f}*(x - {x[i]:.4f})^2"
-            tramos.append(tramo)
-        plot_spline_quadratic("Spline Cuadrático", list(zip(x, y)), x, y)
-        return {
-            "is_successful": True,
-            "have_solution": True,
-            "tramos": tramos,
-        }
+        return PPoly(np.array([c, b, a]), x)
+
+    def validate_input(
+        self, x_input: str, y_input: str
+    ) -> str | list[tuple[float, float]]:
+        response_validation = parse_points(x_input, y_input)
+        if isinstance(response_validation, str):
+            return response_validation
 
-    def validate_input(self, x_input: str, y_input: str) -> str | list[tuple[float, float]]:
-        max_points = 8
-        x_list = [value.strip() for value in x_input.split(" ") if value.strip()]
-        y_list = [value.strip() for value in y_input.split(" ") if value.strip()]
-        if len(x_list) == 0 or len(y_list) == 0:
-            return "Error: Las listas de 'x' y 'y' no pueden estar vacías."
-        if len(x_list) != len(y_list):
-            return "Error: Las listas de 'x' y 'y' deben tener la misma cantidad de elementos."
-        try:
-            x_values = [float(value) for value in x_list]
-            y_values = [float(value) for value in y_list]
-        except ValueError:
-            return "Error: Todos los valores de 'x' y 'y' deben ser numéricos."
-        if len(set(x_values)) != len(x_values):
-            return "Error: Los valores de 'x' deben ser únicos."
-        if len(x_values) > max_points:
-            return f"Error: El número máximo de puntos es {max_points}."
-        return [x_values, y_values]
+        # Verificar que el número de puntos no exceda el límite máximo
+        return point_limit_error(response_validation[0], self.max_points) or response_validation
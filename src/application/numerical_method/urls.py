@@ -1,5 +1,7 @@
 from django.urls import path
 from .views.file_download_view import FileDownloadView
+from .views.plot_view import PlotView
+from .views.plot_data_view import PlotDataView
 from .views.bisection_view import BisectionView
 from .views.regula_falsi_view import RegulaFalsiView
 from .views.fixed_point_view import FixedPointView
@@ -27,6 +29,16 @@ urlpatterns = [
         FileDownloadView.as_view(),
         name="download_svg",
     ),
+    path(
+        "plots/<str:name>",
+        PlotView.as_view(),
+        name="plot",
+    ),
+    path(
+        "plot-data/<str:kind>/",
+        PlotDataView.as_view(),
+        name="plot_data",
+    ),
     path(
         "bisection/",
         BisectionView.as_view(),
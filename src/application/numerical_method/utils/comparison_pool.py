@@ -0,0 +1,35 @@
+from typing import Callable, Iterator
+
+from config.settings import COMPARISON_METHOD_TIMEOUT, COMPARISON_PARALLEL, COMPARISON_WORKERS
+from src.application.shared.utils.parallel_tasks import ProcessPool, supports_process_pool
+
+# Procesos que ejecutan los métodos de los reportes de comparación. Los módulos de sus tareas (y
+# con ellos NumPy, SymPy y SciPy) se importan una sola vez en el servidor de procesos, no en cada
+# proceso.
+comparison_pool = ProcessPool(
+    COMPARISON_WORKERS,
+    preload=[
+        "src.application.numerical_method.utils.method_comparison",
+        "src.application.numerical_method.utils.interpolation_comparison",
+    ],
+)
+
+
+def iter_tasks(tasks: dict[str, tuple[Callable, tuple]]) -> Iterator[tuple[str, object]]:
+    """
+    Ejecuta las tareas y entrega el resultado de cada una (o la excepción que lanzó) en cuanto termina.
+
+    Con COMPARISON_PARALLEL cada tarea corre en un proceso de `comparison_pool` y se cancela si
+    supera COMPARISON_METHOD_TIMEOUT segundos; si no, se ejecutan una tras otra en este proceso.
+    """
+    if COMPARISON_PARALLEL and supports_process_pool():
+        yield from comparison_pool.as_completed(tasks, COMPARISON_METHOD_TIMEOUT)
+        return
+
+    for name, (function, args) in tasks.items():
+        try:
+            outcome = function(*args)
+        except Exception as e:
+            outcome = e
+        yield name, outcome
+
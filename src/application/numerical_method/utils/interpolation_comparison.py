@@ -0,0 +1,111 @@
+import time
+
+import numpy as np
+
+from src.application.numerical_method.services.lagrange_service import LagrangeService
+from src.application.numerical_method.services.vandermonde_service import VandermondeService
+from src.application.numerical_method.services.newton_interpol_service import NewtonInterpolService
+from src.application.numerical_method.services.spline_linear_service import SplineLinearService
+from src.application.numerical_method.services.spline_cubic_service import SplineCubicService
+from src.application.numerical_method.services.spline_quadratic_service import SplineQuadraticService
+from src.application.numerical_method.utils.comparison_pool import iter_tasks
+from src.application.shared.utils.interpolation_points import parse_points, point_limit_error
+from src.application.shared.utils.plot_context import plot_context
+
+# Métodos del informe de interpolación, en el orden en que aparecen.
+INTERPOLATION_METHODS = {
+    "Lagrange": LagrangeService,
+    "Vandermonde": VandermondeService,
+    "Newton": NewtonInterpolService,
+    "Spline Lineal": SplineLinearService,
+    "Spline Cuadrático": SplineQuadraticService,
+    "Spline Cúbico": SplineCubicService,
+}
+
+# Puntos de la malla en la que se mide el tiempo de evaluación de cada interpolante.
+GRID_POINTS = 1000
+
+INTERPOLATION_METRIC_COLUMNS = ["Tiempo de ajuste (ms)", "Tiempo de evaluación (ms)", "Desviación máxima"]
+
+
+def _empty_metrics() -> dict:
+    return {column: "-" for column in INTERPOLATION_METRIC_COLUMNS}
+
+
+def _result_text(response: dict) -> str:
+    # Los polinomios se muestran en una sola línea; los splines, tramo por tramo.
+    if "polynomial" in response:
+        return response.get("polynomial") or response.get("message_method")
+    if response.get("is_successful"):
+        return "\n".join(response.get("tramos", []))
+    return response.get("message_method", "")
+
+
+def _interpolate(name: str, x: list[float], y: list[float]) -> dict:
+    # Resultado y métricas de un método. Se ejecuta en un proceso de `comparison_pool`, así que
+    # solo devuelve textos y números.
+    service = INTERPOLATION_METHODS[name]()
+    error = point_limit_error(x, service.max_points)
+    if error:
+        return {"Resultado": error, **_empty_metrics()}
+
+    if len(x) < service.min_points:
+        # `solve` devuelve el mensaje de error sin ajustar nada.
+        with plot_context(render=False):
+            response = service.solve(x, y)
+        return {"Resultado": _result_text(response), **_empty_metrics()}
+
+    # Un solo ajuste: el resultado que se muestra y las métricas salen del mismo modelo. El
+    # tiempo de ajuste incluye armar el resultado (por ejemplo, el polinomio simbólico de Newton).
+    start = time.perf_counter()
+    model = service.fit(x, y)
+    with plot_context(render=False):
+        response = service.solve(x, y, model=model)
+    fit_time = time.perf_counter() - start
+
+    row = {"Resultado": _result_text(response), **_empty_metrics()}
+    if not response.get("is_successful"):
+        return row
+
+    x_values = np.array(x)
+    y_values = np.array(y)
+    grid = np.linspace(x_values.min(), x_values.max(), GRID_POINTS)
+    start = time.perf_counter()
+    model(grid)
+    evaluation_time = time.perf_counter() - start
+
+    row["Tiempo de ajuste (ms)"] = round(fit_time * 1000, 3)
+    row["Tiempo de evaluación (ms)"] = round(evaluation_time * 1000, 3)
+    row["Desviación máxima"] = f"{float(np.max(np.abs(model(x_values) - y_values))):.3e}"
+    return row
+
+
+def compare_interpolation_methods(x_input: str, y_input: str) -> list[tuple[str, dict]]:
+    """
+    Ajusta todos los métodos de interpolación a los mismos puntos, sin gráficas.
+
+    Los valores se interpretan una sola vez, cada método se ajusta una sola vez y los métodos
+    corren en paralelo (ver `iter_tasks`). Además del resultado de cada método se mide el tiempo
+    de ajuste (incluido armar el resultado que se muestra), el de evaluar el interpolante en una
+    malla de GRID_POINTS puntos y la mayor diferencia con los datos.
+
+    Args:
+        x_input (str): Valores de x separados por espacios.
+        y_input (str): Valores de y separados por espacios.
+
+    Returns:
+        list[tuple[str, dict]]: Nombre de cada método, en el orden de INTERPOLATION_METHODS, y su
+        fila con "Resultado" y las columnas de INTERPOLATION_METRIC_COLUMNS ("-" si no aplica).
+    """
+    points = parse_points(x_input, y_input)
+    if isinstance(points, str):
+        return [(name, {"Resultado": points, **_empty_metrics()}) for name in INTERPOLATION_METHODS]
+
+    x, y = points
+    tasks = {name: (_interpolate, (name, x, y)) for name in INTERPOLATION_METHODS}
+    rows = {}
+    for name, outcome in iter_tasks(tasks):
+        if isinstance(outcome, Exception):
+            outcome = {"Resultado": f"Error: {outcome}", **_empty_metrics()}
+        rows[name] = outcome
+    return [(name, rows[name]) for name in INTERPOLATION_METHODS]
@@ -1,5 +1,9 @@
+import ast
 import csv
 import io
+import itertools
+import logging
+from typing import Iterable, Iterator
 
 from src.application.numerical_method.services.bisection_service import BisectionService
 from src.application.numerical_method.services.regula_falsi_service import RegulaFalsiService
@@ -11,10 +15,284 @@ from src.application.numerical_method.services.multiple_roots_2_service import M
 from src.application.numerical_method.services.jacobi_service import JacobiService
 from src.application.numerical_method.services.gauss_seidel_service import GaussSeidelService
 from src.application.numerical_method.services.sor_service import SORService
+from src.application.shared.utils.expression_parser import parse_expression
+from src.application.shared.utils.method_metrics import empty_metrics_row, measure
+from src.application.shared.utils.plot_context import plot_context
+from src.application.shared.utils.prepared_system import PreparedSystem
+from src.application.shared.utils.result_cache import ResultCache, cache_key
+from src.application.numerical_method.utils.comparison_pool import iter_tasks
+from src.application.numerical_method.utils.relaxation_factor import select_relaxation_factor
+from config.settings import (
+    COMPARISON_CACHE_SIZE,
+    COMPARISON_CACHE_TTL,
+    COMPARISON_CACHE_WAIT,
+    COMPARISON_RANKING_WEIGHTS,
+)
 
-def run_all_methods(params):
+logger = logging.getLogger(__name__)
+
+# Criterios que se pueden ponderar al elegir el mejor método, y la columna del CSV de cada uno.
+RANKING_COLUMNS = {
+    "iterations": "Iteraciones",
+    "time": "Tiempo (ms)",
+    "evaluations": "Evaluaciones de f",
+    "derivatives": "Evaluaciones de derivadas",
+    "products": "Productos matriz-vector",
+    "memory": "Memoria pico (KB)",
+    "error": "Error",
+}
+
+
+def parse_ranking_weights(text: str | None, columns: Iterable[str]) -> dict[str, float]:
+    """
+    Interpreta los pesos del ranking, con el formato "criterio=peso,criterio=peso".
+
+    Solo se aceptan los criterios cuya columna está en el reporte que se va a ordenar (por
+    ejemplo, "error" y "products" no existen en el de raíces). Como COMPARISON_RANKING_WEIGHTS
+    es el mismo para todos los reportes, de él se descartan los que no aplican, con un aviso
+    en el log.
+
+    Args:
+        text (str | None): Pesos; si es None se usa COMPARISON_RANKING_WEIGHTS.
+        columns (Iterable[str]): Columnas del reporte, por ejemplo ROOT_COLUMNS o MATRIX_COLUMNS.
+
+    Returns:
+        dict[str, float]: Peso de cada criterio de RANKING_COLUMNS. Vacío si no se indicó ninguno.
+
+    Raises:
+        ValueError: Si un criterio no existe o no aplica al reporte, o un peso no es un número no negativo.
+    """
+    from_settings = text is None
+    if from_settings:
+        text = COMPARISON_RANKING_WEIGHTS
+    columns = set(columns)
+    applicable = [criterion for criterion, column in RANKING_COLUMNS.items() if column in columns]
+    weights = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        criterion, _, weight = item.partition("=")
+        criterion = criterion.strip()
+        if criterion not in RANKING_COLUMNS:
+            raise ValueError(
+                f"Criterio de ranking no válido: '{criterion}'. Use uno de: {', '.join(applicable)}."
+            )
+        try:
+            weights[criterion] = float(weight)
+        except ValueError:
+            raise ValueError(f"El peso de '{criterion}' debe ser un número.") from None
+        if not weights[criterion] >= 0:
+            raise ValueError(f"El peso de '{criterion}' no puede ser negativo.")
+        if criterion not in applicable:
+            if not from_settings:
+                raise ValueError(
+                    f"El criterio '{criterion}' no aplica a este reporte. Use uno de: {', '.join(applicable)}."
+                )
+            logger.warning("COMPARISON_RANKING_WEIGHTS: el criterio '%s' no aplica a este reporte y se ignora.", criterion)
+            del weights[criterion]
+    return weights
+
+
+def weighted_best(rows: list[dict], weights: dict[str, float], columns: dict[str, str] = RANKING_COLUMNS) -> int:
+    """
+    Elige la fila de menor costo ponderado.
+
+    Cada criterio se normaliza dividiendo por el mayor valor entre las filas, así los pesos no
+    dependen de las unidades (milisegundos, kilobytes...). Un valor que no es numérico ("-")
+    cuenta como el peor posible. En caso de empate gana la primera fila.
+
+    Args:
+        rows (list[dict]): Filas candidatas del reporte.
+        weights (dict[str, float]): Peso de cada criterio, como los devuelve `parse_ranking_weights`.
+        columns (dict[str, str]): Columna del reporte de cada criterio.
+
+    Returns:
+        int: Índice de la mejor fila en `rows`.
+    """
+    def numeric(value) -> float:
+        try:
+            return abs(float(value))
+        except (TypeError, ValueError):
+            return float("inf")
+
+    scores = [0.0] * len(rows)
+    for criterion, weight in weights.items():
+        if not weight or columns.get(criterion) is None:
+            continue
+        values = [numeric(row.get(columns[criterion])) for row in rows]
+        finite = [value for value in values if value != float("inf")]
+        scale = max(finite, default=0.0)
+        for i, value in enumerate(values):
+            if value == float("inf"):
+                scores[i] += weight * 2
+            elif scale > 0:
+                scores[i] += weight * value / scale
+    return min(range(len(rows)), key=lambda i: scores[i])
+
+
+def _parse_solution(solution) -> list[float]:
+    # La solución puede ser una lista, un número o un texto como "[1.0, 2.0]".
+    if isinstance(solution, list):
+        return [float(x) for x in solution]
+    try:
+        return [float(solution)]
+    except Exception:
+        try:
+            value = ast.literal_eval(solution)
+            if isinstance(value, (list, tuple)):
+                return [float(x) for x in value]
+            return [float(value)]
+        except Exception:
+            return []
+
+
+def closest_solutions(solutions: list) -> list[int]:
+    """
+    Índices de las dos soluciones más parecidas (menor distancia euclidiana).
+
+    Sirve para descartar un método que convergió a otra raíz: el mejor se elige entre los dos
+    que más coinciden. Las soluciones que no se pueden interpretar o de otra dimensión no se
+    comparan.
+
+    Args:
+        solutions (list): Solución de cada método convergente (número, lista o texto).
+
+    Returns:
+        list[int]: Los dos índices; [0] si hay una sola solución, o vacía si no hay par comparable.
+    """
+    if len(solutions) == 1:
+        return [0]
+    parsed = [(i, _parse_solution(solution)) for i, solution in enumerate(solutions)]
+    min_dist = float("inf")
+    best_pair = []
+    for (i1, s1), (i2, s2) in itertools.combinations(parsed, 2):
+        if len(s1) == len(s2) and len(s1) > 0:
+            dist = sum((a - b) ** 2 for a, b in zip(s1, s2)) ** 0.5
+            if dist < min_dist:
+                min_dist = dist
+                best_pair = [i1, i2]
+    return best_pair
+
+
+def _root_result(name: str, res: dict) -> dict:
+    return {
+        "Método": name,
+        "Iteraciones": len(res["table"]),
+        "Solución": res.get("root", "-"),
+        "¿Converge?": "Sí" if res.get("have_solution") else "No"
+    }
+
+
+def _bisection(std_params):
+    res = BisectionService().solve(
+        std_params["interval_a"], std_params["interval_b"], std_params["tolerance"],
+        std_params["max_iterations"], std_params["function_f"], std_params["precision"]
+    )
+    return _root_result("Bisección", res)
+
+
+def _regula_falsi(std_params):
+    res = RegulaFalsiService().solve(
+        std_params["interval_a"], std_params["interval_b"], std_params["tolerance"],
+        std_params["max_iterations"], std_params["function_f"], std_params["precision"]
+    )
+    return _root_result("Regla Falsa", res)
+
+
+def _fixed_point(std_params):
+    res = FixedPointService().solve(
+        std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
+        std_params["precision"], std_params["function_f"], function_g=std_params["function_g"]
+    )
+    return _root_result("Punto Fijo", res)
+
+
+def _newton(std_params):
+    res = NewtonService().solve(
+        std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
+        std_params["precision"], std_params["function_f"]
+    )
+    return _root_result("Newton-Raphson", res)
+
+
+def _secant(std_params):
+    res = SecantService().solve(
+        std_params["interval_a"], std_params["tolerance"], std_params["max_iterations"],
+        std_params["precision"], std_params["function_f"], interval_b=std_params["interval_b"]
+    )
+    return _root_result("Secante", res)
+
+
+def _multiple_roots_1(std_params):
+    res = MultipleRoots1Service().solve(
+        std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
+        std_params["precision"], std_params["function_f"], std_params["multiplicity"]
+    )
+    return _root_result("Raíces Múltiples #1", res)
+
+
+def _multiple_roots_2(std_params):
+    res = MultipleRoots2Service().solve(
+        std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
+        std_params["precision"], std_params["function_f"]
+    )
+    return _root_result("Raíces Múltiples #2", res)
+
+
+# Métodos de búsqueda de raíces que se comparan, en el orden de las filas del CSV.
+ROOT_METHODS = {
+    "Bisección": _bisection,
+    "Regla Falsa": _regula_falsi,
+    "Punto Fijo": _fixed_point,
+    "Newton-Raphson": _newton,
+    "Secante": _secant,
+    "Raíces Múltiples #1": _multiple_roots_1,
+    "Raíces Múltiples #2": _multiple_roots_2,
+}
+
+
+# Filas de las comparaciones ya calculadas, por parámetros normalizados. Así el reporte que se
+# pide desde la página de un método y la descarga posterior con los mismos datos se calculan
+# una sola vez. Las filas conservan las métricas de la ejecución que las produjo.
+comparison_cache = ResultCache(COMPARISON_CACHE_SIZE, COMPARISON_CACHE_TTL, COMPARISON_CACHE_WAIT)
+
+
+# Resultados de `iter_tasks` que dependen de la carga del servidor y no de los datos: el método
+# se canceló por tiempo o su proceso terminó sin devolver un resultado.
+_TRANSIENT_ERRORS = (TimeoutError, RuntimeError)
+
+
+class _TransientRow(dict):
+    # Fila de un método que no terminó por uno de `_TRANSIENT_ERRORS`; otra solicitud con los
+    # mismos datos puede obtener un resultado distinto, así que la comparación no se guarda.
+    pass
+
+
+def _canonical_function(function_f):
+    # "math.sin(x)" y "sin(x)" dan los mismos resultados; una expresión inválida se deja tal cual.
+    try:
+        return parse_expression(function_f).canonical
+    except Exception:
+        return function_f
+
+
+def _run_without_plots(method, std_params: dict) -> dict:
+    # El reporte solo usa los resultados numéricos: las gráficas que piden los servicios no se dibujan.
+    # El costo se mide en el proceso que ejecuta el método y viaja de vuelta con la fila.
+    with plot_context(render=False), measure() as metrics:
+        row = method(std_params)
+    return {**row, **metrics.as_row()}
+
+
+def _iter_methods(methods: dict, std_params: dict) -> Iterator[tuple[str, object]]:
+    # Cada método corre sin gráficas y con su costo medido (ver `iter_tasks`).
+    tasks = {name: (_run_without_plots, (method, std_params)) for name, method in methods.items()}
+    yield from iter_tasks(tasks)
+
+
+def _standard_params(params: dict) -> dict:
     # Estandarizar parámetros para todos los métodos
-    std_params = {
+    return {
         "interval_a": params.get("interval_a", params.get("x0", 1)),
         "interval_b": params.get("interval_b", params.get("x0", 1) + 1),
         "x0": params.get("x0", params.get("interval_a", 1)),
@@ -26,113 +304,69 @@ def run_all_methods(params):
         "multiplicity": params.get("multiplicity", 1),
     }
 
-    results = []
 
-    # Bisección
-    try:
-        res = BisectionService().solve(
-            std_params["interval_a"], std_params["interval_b"], std_params["tolerance"],
-            std_params["max_iterations"], std_params["function_f"], std_params["precision"]
-        )
-        results.append({
-            "Método": "Bisección",
-            "Iteraciones": len(res["table"]),
-            "Solución": res["root"],
-            "¿Converge?": "Sí" if res["have_solution"] else "No"
-        })
-    except Exception:
-        results.append({"Método": "Bisección", "Iteraciones": "-", "Solución": "-", "¿Converge?": "No"})
+# Columnas de las filas de resultados de los métodos de búsqueda de raíces.
+ROOT_COLUMNS = ["Método", "Iteraciones", "Solución", "¿Converge?", *empty_metrics_row()]
 
-    # Regla Falsa
-    try:
-        res = RegulaFalsiService().solve(
-            std_params["interval_a"], std_params["interval_b"], std_params["tolerance"],
-            std_params["max_iterations"], std_params["function_f"], std_params["precision"]
-        )
-        results.append({
-            "Método": "Regla Falsa",
-            "Iteraciones": len(res["table"]),
-            "Solución": res["root"],
-            "¿Converge?": "Sí" if res["have_solution"] else "No"
-        })
-    except Exception:
-        results.append({"Método": "Regla Falsa", "Iteraciones": "-", "Solución": "-", "¿Converge?": "No"})
 
-    # Punto Fijo
-    try:
-        res = FixedPointService().solve(
-            std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
-            std_params["precision"], std_params["function_f"], function_g=std_params["function_g"]
-        )
-        results.append({
-            "Método": "Punto Fijo",
-            "Iteraciones": len(res["table"]),
-            "Solución": res.get("root", "-"),
-            "¿Converge?": "Sí" if res.get("have_solution") else "No"
-        })
-    except Exception:
-        results.append({"Método": "Punto Fijo", "Iteraciones": "-", "Solución": "-", "¿Converge?": "No"})
+def iter_root_methods(params: dict) -> Iterator[dict]:
+    """
+    Motor de la comparación de métodos de búsqueda de raíces.
 
-    # Newton-Raphson
-    try:
-        res = NewtonService().solve(
-            std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
-            std_params["precision"], std_params["function_f"]
-        )
-        results.append({
-            "Método": "Newton-Raphson",
-            "Iteraciones": len(res["table"]),
-            "Solución": res.get("root", "-"),
-            "¿Converge?": "Sí" if res.get("have_solution") else "No"
-        })
-    except Exception:
-        results.append({"Método": "Newton-Raphson", "Iteraciones": "-", "Solución": "-", "¿Converge?": "No"})
+    Ejecuta todos los métodos de ROOT_METHODS con los mismos parámetros y entrega la fila de
+    cada uno (columnas ROOT_COLUMNS) en cuanto termina, así que el orden es el de llegada.
+    Un método que falla o se cancela queda como no convergente.
 
-    # Secante
-    try:
-        res = SecantService().solve(
-            std_params["interval_a"], std_params["tolerance"], std_params["max_iterations"],
-            std_params["precision"], std_params["function_f"], interval_b=std_params["interval_b"]
-        )
-        results.append({
-            "Método": "Secante",
-            "Iteraciones": len(res["table"]),
-            "Solución": res.get("root", "-"),
-            "¿Converge?": "Sí" if res.get("have_solution") else "No"
-        })
-    except Exception:
-        results.append({"Método": "Secante", "Iteraciones": "-", "Solución": "-", "¿Converge?": "No"})
+    Las filas se guardan en `comparison_cache`: con los mismos parámetros se entregan las filas
+    guardadas, y dos solicitudes simultáneas comparten la misma ejecución. Si un método se
+    canceló por tiempo o su proceso murió, la comparación no se guarda y la próxima solicitud
+    la repite. Las filas no deben modificarse.
 
-    # Raíces Múltiples #1
-    try:
-        res = MultipleRoots1Service().solve(
-            std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
-            std_params["precision"], std_params["function_f"], std_params["multiplicity"]
-        )
-        results.append({
-            "Método": "Raíces Múltiples #1",
-            "Iteraciones": len(res["table"]),
-            "Solución": res.get("root", "-"),
-            "¿Converge?": "Sí" if res.get("have_solution") else "No"
-        })
-    except Exception:
-        results.append({"Método": "Raíces Múltiples #1", "Iteraciones": "-", "Solución": "-", "¿Converge?": "No"})
+    Args:
+        params (dict): Parámetros del formulario; los que faltan se completan con `_standard_params`.
+
+    Yields:
+        dict: Fila del reporte de cada método.
+    """
+    std_params = _standard_params(params)
+    key = cache_key(
+        "roots",
+        {
+            **std_params,
+            "function_f": _canonical_function(std_params["function_f"]),
+            "function_g": _canonical_function(std_params["function_g"]),
+        },
+    )
+    yield from comparison_cache.stream(
+        key,
+        lambda: _root_rows(std_params),
+        cacheable=lambda rows: not any(isinstance(row, _TransientRow) for row in rows),
+    )
+
+
+def _root_rows(std_params: dict) -> Iterator[dict]:
+    for name, outcome in _iter_methods(ROOT_METHODS, std_params):
+        if isinstance(outcome, Exception):
+            row_type = _TransientRow if isinstance(outcome, _TRANSIENT_ERRORS) else dict
+            yield row_type(
+                {"Método": name, "Iteraciones": "-", "Solución": "-", "¿Converge?": "No", **empty_metrics_row()}
+            )
+        else:
+            yield outcome
 
-    # Raíces Múltiples #2
-    try:
-        res = MultipleRoots2Service().solve(
-            std_params["x0"], std_params["tolerance"], std_params["max_iterations"],
-            std_params["precision"], std_params["function_f"]
-        )
-        results.append({
-            "Método": "Raíces Múltiples #2",
-            "Iteraciones": len(res["table"]),
-            "Solución": res.get("root", "-"),
-            "¿Converge?": "Sí" if res.get("have_solution") else "No"
-        })
-    except Exception:
-        results.append({"Método": "Raíces Múltiples #2", "Iteraciones": "-", "Solución": "-", "¿Converge?": "No"})
 
+def best_root_method(results: list[dict], weights: dict[str, float]) -> dict | None:
+    """
+    Elige el mejor método: de los dos convergentes cuyas soluciones más se parecen, el de menos
+    iteraciones o, con `weights`, el de menor costo ponderado según `weighted_best`.
+
+    Args:
+        results (list[dict]): Filas de todos los métodos, en el orden de ROOT_METHODS.
+        weights (dict[str, float]): Pesos del ranking; vacío para el criterio de iteraciones.
+
+    Returns:
+        dict | None: La fila del mejor método, o None si ninguno converge.
+    """
     # Filtrar solo los métodos convergentes y tienen solución numérica válida
     converged = [
         r for r in results
@@ -140,44 +374,12 @@ def run_all_methods(params):
         and r.get('Solución', r.get('Raíz', None)) not in ("-", "", None)
     ]
 
-    # Si hay al menos dos métodos convergentes, buscar los más parecidos
-    best_indexes = []
-    if len(converged) >= 2:
-        # Extraer soluciones numéricas
-        def parse_solution(sol):
-            # Puede ser lista, float, o string
-            if isinstance(sol, list):
-                return [float(x) for x in sol]
-            try:
-                return [float(sol)]
-            except Exception:
-                # Intentar parsear string tipo "[1.0, 2.0]"
-                try:
-                    import ast
-                    val = ast.literal_eval(sol)
-                    if isinstance(val, (list, tuple)):
-                        return [float(x) for x in val]
-                    return [float(val)]
-                except Exception:
-                    return []
-        parsed = [(i, parse_solution(r.get('Solución', r.get('Raíz', None)))) for i, r in enumerate(converged)]
-        # Calcular distancia euclidiana entre todas las combinaciones
-        import itertools
-        min_dist = float('inf')
-        best_pair = None
-        for (i1, s1), (i2, s2) in itertools.combinations(parsed, 2):
-            if len(s1) == len(s2) and len(s1) > 0:
-                dist = sum((a - b) ** 2 for a, b in zip(s1, s2)) ** 0.5
-                if dist < min_dist:
-                    min_dist = dist
-                    best_pair = (i1, i2)
-        # Seleccionar los dos más parecidos
-        if best_pair:
-            best_indexes = list(best_pair)
-    elif len(converged) == 1:
-        best_indexes = [0]
-
-    # De los más parecidos, elegir el de menos iteraciones
+    # Buscar los dos métodos convergentes con las soluciones más parecidas
+    best_indexes = closest_solutions([r.get('Solución', r.get('Raíz', None)) for r in converged])
+
+    # De los más parecidos, elegir el de menos iteraciones (o el de menor costo ponderado)
+    if best_indexes and weights:
+        return converged[best_indexes[weighted_best([converged[idx] for idx in best_indexes], weights)]]
     if best_indexes:
         min_iter = float('inf')
         best_idx = None
@@ -190,35 +392,100 @@ def run_all_methods(params):
             if iteraciones < min_iter:
                 min_iter = iteraciones
                 best_idx = idx
-        # Marcar el mejor método
-        for i, r in enumerate(results):
-            r['¿Mejor?'] = "Sí" if r in converged and converged.index(r) == best_idx else "No"
-    else:
-        for r in results:
-            r['¿Mejor?'] = "No"
+        if best_idx is not None:
+            return converged[best_idx]
+    return None
 
-    # Generar CSV en memoria (incluyendo columna ¿Mejor?)
-    output = io.StringIO()
-    # Detectar campos automáticamente
-    fieldnames = list(results[0].keys()) if results else []
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    for row in results:
-        writer.writerow(row)
-    return output.getvalue()
 
-def compare_matrix_methods_report(A, b, x0, tolerance, max_iterations, relaxation_factor=1.2, precision_type="decimales_correctos"):
+
+# Prefijo de la última fila de los reportes de raíces, la que indica el mejor método.
+BEST_METHOD_PREFIX = "Mejor método: "
+
+
+def best_method_row(best: dict | None) -> dict:
     """
-    Compara Jacobi, Gauss-Seidel y SOR para el mismo sistema.
-    Devuelve el CSV y los datos tabulares.
+    Última fila de los reportes de raíces, con las mismas columnas que las demás: en "Método"
+    va BEST_METHOD_PREFIX y el nombre del mejor método, y en el resto sus valores ("-" si
+    ninguno converge).
     """
+    if best is None:
+        return {column: "-" for column in ROOT_COLUMNS} | {"Método": f"{BEST_METHOD_PREFIX}-"}
+    return {**best, "Método": f"{BEST_METHOD_PREFIX}{best['Método']}"}
+
+
+class _Echo:
+    # Archivo que devuelve lo que se le escribe, para obtener cada línea del CSV por separado.
+    def write(self, value: str) -> str:
+        return value
+
+
+def _root_report_lines(rows: Iterable[dict], weights: dict[str, float]) -> Iterator[str]:
+    # Formato único de los reportes de raíces: encabezado ROOT_COLUMNS, una línea por método en
+    # el orden de `rows` y al final `best_method_row`.
+    writer = csv.DictWriter(_Echo(), fieldnames=ROOT_COLUMNS)
+    yield writer.writeheader()
+
+    by_name = {}
+    for row in rows:
+        by_name[row["Método"]] = row
+        yield writer.writerow(row)
+
+    # El mejor se elige con las filas en el orden de ROOT_METHODS, sea cual sea el de llegada.
+    best = best_root_method([by_name[name] for name in ROOT_METHODS], weights)
+    yield writer.writerow(best_method_row(best))
+
+
+def run_all_methods(params, weights: dict[str, float] | None = None) -> str:
+    """
+    Compara los métodos de búsqueda de raíces y devuelve el CSV con sus resultados y costos.
+
+    Tiene el mismo formato que `stream_root_comparison`, pero con los métodos en el orden de
+    ROOT_METHODS. Los pesos por defecto son los de COMPARISON_RANKING_WEIGHTS.
+    """
+    if weights is None:
+        weights = parse_ranking_weights(None, ROOT_COLUMNS)
+    rows = {row["Método"]: row for row in iter_root_methods(params)}
+    return "".join(_root_report_lines([rows[name] for name in ROOT_METHODS], weights))
+
+
+def stream_root_comparison(params: dict, weights: dict[str, float] | None = None) -> Iterator[str]:
+    """
+    Versión en streaming de `run_all_methods`, para `StreamingHttpResponse`.
+
+    Entrega el encabezado y luego la línea de cada método en cuanto termina, sin esperar a los
+    más lentos. El formato es el mismo de `run_all_methods`: como el mejor método solo se conoce
+    al final, se indica en la última línea (ver `best_method_row`) y no en una columna.
+
+    Args:
+        params (dict): Parámetros del formulario, como en `run_all_methods`.
+        weights (dict[str, float] | None): Pesos del ranking; por defecto COMPARISON_RANKING_WEIGHTS.
+
+    Yields:
+        str: Líneas del CSV.
+    """
+    if weights is None:
+        weights = parse_ranking_weights(None, ROOT_COLUMNS)
+    yield from _root_report_lines(iter_root_methods(params), weights)
+
+
+# Columnas del reporte de los métodos matriciales.
+MATRIX_COLUMNS = ["Método", "Iteraciones", "Solución", "Error", "¿Converge?", *empty_metrics_row(matrix=True), "¿Mejor?"]
+
+
+def _matrix_rows(A, b, x0, tolerance, max_iterations, relaxation_factor, precision_type) -> list[dict]:
+    # La conversión y la descomposición de A se hacen una vez para los tres métodos.
+    try:
+        prepared = PreparedSystem(A, b)
+    except Exception:
+        prepared = None
     results = []
 
     # Jacobi
     try:
-        jacobi_res = JacobiService().solve(
-            A, b, x0, tolerance, max_iterations, precision_type
-        )
+        with measure() as metrics:
+            jacobi_res = JacobiService().solve(
+                A, b, x0, tolerance, max_iterations, precision_type, prepared=prepared
+            )
         have_solution = jacobi_res.get("have_solution")
         table = jacobi_res.get("table", {})
         last_iter = table[max(table)] if table else {}
@@ -228,17 +495,22 @@ def compare_matrix_methods_report(A, b, x0, tolerance, max_iterations, relaxatio
             "Iteraciones": len(table),
             "Solución": jacobi_res.get("solution", []) if have_solution else "-",
             "Error": error_value,
-            "¿Converge?": "Sí" if have_solution else "No"
+            "¿Converge?": "Sí" if have_solution else "No",
+            **metrics.as_row(matrix=True),
         })
     except Exception:
-        results.append({"Método": "Jacobi", "Iteraciones": "-", "Solución": "-", "Error": "-", "¿Converge?": "No"})
+        results.append({
+            "Método": "Jacobi", "Iteraciones": "-", "Solución": "-", "Error": "-", "¿Converge?": "No",
+            **empty_metrics_row(matrix=True),
+        })
 
     # Gauss-Seidel
     try:
         gs_precision = 1 if precision_type == "decimales_correctos" else 0
-        gs_res = GaussSeidelService().solve(
-            A, b, x0, tolerance, max_iterations, gs_precision
-        )
+        with measure() as metrics:
+            gs_res = GaussSeidelService().solve(
+                A, b, x0, tolerance, max_iterations, gs_precision, prepared=prepared
+            )
         have_solution = gs_res.get("have_solution")
         table = gs_res.get("table", {})
         last_iter = table[max(table)] if table else {}
@@ -248,67 +520,89 @@ def compare_matrix_methods_report(A, b, x0, tolerance, max_iterations, relaxatio
             "Iteraciones": len(table),
             "Solución": gs_res.get("solution", []) if have_solution else "-",
             "Error": error_value,
-            "¿Converge?": "Sí" if have_solution else "No"
+            "¿Converge?": "Sí" if have_solution else "No",
+            **metrics.as_row(matrix=True),
         })
     except Exception:
-        results.append({"Método": "Gauss-Seidel", "Iteraciones": "-", "Solución": "-", "Error": "-", "¿Converge?": "No"})
+        results.append({
+            "Método": "Gauss-Seidel", "Iteraciones": "-", "Solución": "-", "Error": "-", "¿Converge?": "No",
+            **empty_metrics_row(matrix=True),
+        })
 
-    # SOR
+    # SOR (sin factor de relajación, se elige con `select_relaxation_factor`; su costo no se
+    # suma al de SOR, que es el de la solución con el factor elegido)
+    sor_name = "SOR"
     try:
         sor_precision = 1 if precision_type == "decimales_correctos" else 0
-        sor_res = SORService().solve(
-            A, b, x0, tolerance, max_iterations, relaxation_factor, sor_precision
-        )
+        if relaxation_factor is None:
+            relaxation_factor = select_relaxation_factor(
+                A, b, x0, tolerance, max_iterations, sor_precision, prepared=prepared
+            )["relaxation_factor"]
+            sor_name = f"SOR (w = {relaxation_factor:.4g})"
+        with measure() as metrics:
+            sor_res = SORService().solve(
+                A, b, x0, tolerance, max_iterations, relaxation_factor, sor_precision, prepared=prepared
+            )
         have_solution = sor_res.get("have_solution")
         table = sor_res.get("table", {})
         last_iter = table[max(table)] if table else {}
         error_value = last_iter.get("Error", "-") if have_solution else "-"
         results.append({
-            "Método": "SOR",
+            "Método": sor_name,
             "Iteraciones": len(table),
             "Solución": sor_res.get("solution", []) if have_solution else "-",
             "Error": error_value,
-            "¿Converge?": "Sí" if have_solution else "No"
+            "¿Converge?": "Sí" if have_solution else "No",
+            **metrics.as_row(matrix=True),
         })
     except Exception:
-        results.append({"Método": "SOR", "Iteraciones": "-", "Solución": "-", "Error": "-", "¿Converge?": "No"})
+        results.append({
+            "Método": sor_name, "Iteraciones": "-", "Solución": "-", "Error": "-", "¿Converge?": "No",
+            **empty_metrics_row(matrix=True),
+        })
+
+    return results
+
+
+def _matrix_rows_without_plots(*args) -> list[dict]:
+    # Como en la comparación de raíces, las gráficas que piden los servicios no se dibujan.
+    with plot_context(render=False):
+        return _matrix_rows(*args)
+
+
+def compare_matrix_methods_report(A, b, x0, tolerance, max_iterations, relaxation_factor=None, precision_type="decimales_correctos", weights=None):
+    """
+    Compara Jacobi, Gauss-Seidel y SOR para el mismo sistema.
+    Devuelve el CSV y los datos tabulares.
+
+    Sin `relaxation_factor`, SOR usa el factor que elige `select_relaxation_factor` y la fila
+    lo indica en el nombre del método.
+
+    Con `weights` (por defecto los de COMPARISON_RANKING_WEIGHTS) el mejor método es el de menor
+    costo ponderado en lugar del de menor error. Las filas de un mismo sistema se reutilizan
+    desde `comparison_cache`.
+    """
+    if weights is None:
+        weights = parse_ranking_weights(None, MATRIX_COLUMNS)
+    key = cache_key("matrix", A, b, x0, tolerance, max_iterations, relaxation_factor, precision_type)
+    results = [
+        dict(row)
+        for row in comparison_cache.get_or_compute(
+            key, lambda: _matrix_rows_without_plots(A, b, x0, tolerance, max_iterations, relaxation_factor, precision_type)
+        )
+    ]
 
     # Selección del mejor método: compara soluciones, elige los más parecidos y de esos el de menor error final (si empate, menor iteraciones)
     converged = [r for r in results if r.get("¿Converge?") == "Sí" and r.get("Solución") not in ("-", "", None)]
-    best_indexes = []
-    if len(converged) >= 2:
-        # Parsear soluciones a listas de floats
-        def parse_solution(sol):
-            if isinstance(sol, list):
-                return [float(x) for x in sol]
-            try:
-                return [float(sol)]
-            except Exception:
-                try:
-                    import ast
-                    val = ast.literal_eval(sol)
-                    if isinstance(val, (list, tuple)):
-                        return [float(x) for x in val]
-                    return [float(val)]
-                except Exception:
-                    return []
-        parsed = [(i, parse_solution(r.get("Solución"))) for i, r in enumerate(converged)]
-        import itertools
-        min_dist = float("inf")
-        best_pair = None
-        for (i1, s1), (i2, s2) in itertools.combinations(parsed, 2):
-            if len(s1) == len(s2) and len(s1) > 0:
-                dist = sum((a - b) ** 2 for a, b in zip(s1, s2)) ** 0.5
-                if dist < min_dist:
-                    min_dist = dist
-                    best_pair = (i1, i2)
-        if best_pair:
-            best_indexes = list(best_pair)
-    elif len(converged) == 1:
-        best_indexes = [0]
-
-    # De los más parecidos, elegir el de menor error final (si empate, menor iteraciones)
-    if best_indexes:
+    best_indexes = closest_solutions([r.get("Solución") for r in converged])
+
+    # De los más parecidos, elegir el de menor error final (si empate, menor iteraciones),
+    # o el de menor costo ponderado
+    if best_indexes and weights:
+        best = converged[best_indexes[weighted_best([converged[idx] for idx in best_indexes], weights)]]
+        for r in results:
+            r["¿Mejor?"] = "Sí" if r is best else "No"
+    elif best_indexes:
         min_error = float("inf")
         best_idx = None
         for idx in best_indexes:
@@ -339,7 +633,7 @@ def compare_matrix_methods_report(A, b, x0, tolerance, max_iterations, relaxatio
 
     # Generar CSV en memoria
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=["Método", "Iteraciones", "Solución", "Error", "¿Converge?", "¿Mejor?"])
+    writer = csv.DictWriter(output, fieldnames=MATRIX_COLUMNS)
     writer.writeheader()
     for row in results:
         writer.writerow(row)
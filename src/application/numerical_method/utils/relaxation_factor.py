@@ -0,0 +1,132 @@
+import math
+
+from src.application.numerical_method.services.sor_service import SORService
+from src.application.shared.utils.prepared_system import JACOBI, PreparedSystem
+
+# Factores de relajación del barrido grueso, en el orden en que se prueban: desde 1 (Gauss-Seidel)
+# hacia afuera, porque el óptimo suele estar cerca y así el límite de iteraciones baja pronto.
+COARSE_OMEGAS = tuple(
+    sorted((round(0.1 * k, 2) for k in range(1, 20)), key=lambda omega: (abs(omega - 1), -omega))
+)
+
+# Barrido fino: paso y distancia máxima alrededor del mejor factor del barrido grueso.
+FINE_STEP = 0.02
+FINE_RADIUS = 0.1
+
+# Parte imaginaria relativa por debajo de la cual un valor propio se considera real.
+REAL_EIGENVALUE_TOLERANCE = 1e-10
+
+# Formas en que se eligió el factor de relajación.
+YOUNG = "young"  # Fórmula de Young a partir del radio espectral de Jacobi.
+SWEEP = "sweep"  # Barrido de candidatos, el de menos iteraciones.
+FALLBACK = "fallback"  # Ningún candidato convergió: se usa 1 (Gauss-Seidel).
+
+
+def young_relaxation_factor(prepared: PreparedSystem) -> float | None:
+    """
+    Factor de relajación óptimo según la fórmula de Young, w = 2 / (1 + sqrt(1 - ρ(T_J)²)).
+
+    La fórmula solo vale si A es consistentemente ordenada (aquí: tridiagonal), los valores
+    propios de la matriz de iteración de Jacobi son reales y su radio espectral es menor que 1.
+
+    Returns:
+        float | None: El factor óptimo, o None si la teoría no se aplica a este sistema.
+    """
+    if prepared.n < 2 or not prepared.is_tridiagonal() or not prepared.diagonal.all():
+        return None
+    eigenvalues = prepared.eigenvalues(JACOBI)
+    radius = float(max(abs(eigenvalues)))
+    if radius >= 1 or any(abs(value.imag) > REAL_EIGENVALUE_TOLERANCE * max(radius, 1) for value in eigenvalues):
+        return None
+    return 2 / (1 + math.sqrt(1 - radius**2))
+
+
+def _sweep(candidates, prepared, x0, tolerance, budget, precision_type, curve: dict) -> int:
+    # Prueba los candidatos uno tras otro con la iteración de SOR sin tabla ni valores propios.
+    # El límite de cada uno son las iteraciones del mejor factor hasta el momento, así los
+    # candidatos que ya no pueden ganar se detienen en cuanto lo alcanzan.
+    service = SORService()
+    for omega in candidates:
+        iterations = service.iterations_to_converge(prepared, x0, tolerance, budget, omega, precision_type)
+        curve[omega] = (iterations, budget)
+        if iterations is not None:
+            budget = iterations
+    return budget
+
+
+def sweep_relaxation_factor(
+    prepared: PreparedSystem, x0, tolerance, max_iterations, precision_type
+) -> tuple[float | None, dict]:
+    """
+    Busca el factor de relajación con menos iteraciones: primero un barrido grueso en (0, 2) y
+    luego uno fino alrededor del mejor. Ningún candidato pasa de las iteraciones del mejor
+    anterior, y no se calculan valores propios por candidato.
+
+    Returns:
+        tuple[float | None, dict]: El mejor factor (None si ninguno converge en `max_iterations`)
+        y, por cada factor probado, sus iteraciones (None si no convergió) y su límite de iteraciones.
+    """
+    curve = {}
+    budget = _sweep(list(COARSE_OMEGAS), prepared, x0, tolerance, max_iterations, precision_type, curve)
+    best = _best(curve)
+    if best is None:
+        return None, curve
+
+    steps = round(FINE_RADIUS / FINE_STEP)
+    fine = [round(best + k * FINE_STEP, 2) for k in range(-steps, steps + 1)]
+    fine = [omega for omega in fine if 0 < omega < 2 and omega not in curve]
+    _sweep(fine, prepared, x0, tolerance, budget, precision_type, curve)
+    return _best(curve), curve
+
+
+def _best(curve: dict) -> float | None:
+    # Menos iteraciones; en caso de empate, el primero que se probó.
+    converged = [
+        (iterations, index, omega)
+        for index, (omega, (iterations, _)) in enumerate(curve.items())
+        if iterations is not None
+    ]
+    return min(converged)[2] if converged else None
+
+
+def select_relaxation_factor(
+    A, b, x0, tolerance, max_iterations, precision_type, prepared: PreparedSystem | None = None
+) -> dict:
+    """
+    Elige el factor de relajación de SOR: con la fórmula de Young cuando la teoría se aplica y,
+    si no, con un barrido de candidatos.
+
+    Args:
+        A, b, x0: Sistema y vector inicial, como los recibe SORService.
+        tolerance (float): Tolerancia.
+        max_iterations (int): Máximo de iteraciones de cada candidato.
+        precision_type (int): 1 para decimales correctos, 0 para cifras significativas.
+        prepared (PreparedSystem | None): Sistema ya preparado, si se tiene.
+
+    Returns:
+        dict: "relaxation_factor" (el elegido), "selection" (YOUNG, SWEEP o FALLBACK),
+        "jacobi_spectral_radius" (solo con YOUNG) y "sweep" (lista de {"omega", "iterations",
+        "limit"} ordenada por omega, con iterations None si el factor se descartó al pasar de
+        "limit" iteraciones; vacía con YOUNG).
+    """
+    if prepared is None:
+        prepared = PreparedSystem(A, b)
+
+    omega = young_relaxation_factor(prepared)
+    if omega is not None:
+        return {
+            "relaxation_factor": omega,
+            "selection": YOUNG,
+            "jacobi_spectral_radius": float(prepared.spectral_radius(JACOBI)),
+            "sweep": [],
+        }
+
+    omega, curve = sweep_relaxation_factor(prepared, x0, tolerance, max_iterations, precision_type)
+    return {
+        "relaxation_factor": omega if omega is not None else 1.0,
+        "selection": SWEEP if omega is not None else FALLBACK,
+        "jacobi_spectral_radius": None,
+        "sweep": [
+            {"omega": value, "iterations": curve[value][0], "limit": curve[value][1]} for value in sorted(curve)
+        ],
+    }
@@ -1,6 +1,10 @@
 from django.views import View
-from django.http import HttpResponse
-from src.application.numerical_method.utils.method_comparison import run_all_methods
+from django.http import HttpResponse, StreamingHttpResponse
+from src.application.numerical_method.utils.method_comparison import (
+    ROOT_COLUMNS,
+    parse_ranking_weights,
+    stream_root_comparison,
+)
 
 class DownloadCSVReportView(View):
     def get(self, request, *args, **kwargs):
@@ -31,7 +35,12 @@ class DownloadCSVReportView(View):
                     pass
         # Elimina None
         params = {k: v for k, v in params.items() if v is not None}
-        csv_content = run_all_methods(params)
-        response = HttpResponse(csv_content, content_type="text/csv")
+        # Pesos opcionales del ranking, por ejemplo ?weights=iterations=1,time=0.5
+        try:
+            weights = parse_ranking_weights(request.GET.get("weights"), ROOT_COLUMNS)
+        except ValueError as e:
+            return HttpResponse(str(e), status=400)
+        # Cada fila se envía en cuanto su método termina (ver stream_root_comparison)
+        response = StreamingHttpResponse(stream_root_comparison(params, weights), content_type="text/csv")
         response["Content-Disposition"] = "attachment; filename=comparacion_metodos.csv"
         return response
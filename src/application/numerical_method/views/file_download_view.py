@@ -1,16 +1,16 @@
-import os
-from django.http import FileResponse, Http404
+from django.http import Http404, HttpResponse
 from django.views import View
-from django.conf import settings
+from src.application.shared.utils.plot_store import plot_store
 
 
 class FileDownloadView(View):
 
     def get(self, request, *args, **kwargs):
-        file_path = os.path.join(
-            settings.BASE_DIR, "static/img/numerical_method/function_plot.svg"
-        )
+        name = request.GET.get("plot", "")
+        content = plot_store.read(name)
+        if content is None:
+            raise Http404("La gráfica solicitada no existe.")
 
-        response = FileResponse(open(file_path, "rb"), content_type="image/svg+xml")
-        response["Content-Disposition"] = 'attachment; filename="function_plot.svg"'
+        response = HttpResponse(content, content_type="image/svg+xml")
+        response["Content-Disposition"] = f'attachment; filename="{name}"'
         return response
@@ -63,6 +63,7 @@ class FixedPointView(TemplateView):
                     "is_successful": True,
                     "have_solution": False,
                     "root": 0.0,
+                    "function_plot": plot_function(function_f, False, [(x0, 0)]),
                 }
             template_data = template_data | error_response
             context["template_data"] = template_data
@@ -78,7 +79,7 @@ class FixedPointView(TemplateView):
         )
 
         if method_response["is_successful"]:
-            plot_function(
+            method_response["function_plot"] = plot_function(
                 function_f,
                 method_response["have_solution"],
                 [(method_response["root"], 0.0)],
@@ -66,7 +66,7 @@ class LagrangeView(TemplateView):
 
         if method_response["is_successful"]:
             # Graficar la función interpolante
-            plot_function(
+            method_response["function_plot"] = plot_function(
                 method_response["polynomial"],
                 method_response["have_solution"],
                 sorted_points,
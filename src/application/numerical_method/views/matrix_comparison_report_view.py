@@ -1,6 +1,10 @@
 from django.http import HttpResponse
 from django.views import View
-from src.application.numerical_method.utils.method_comparison import compare_matrix_methods_report
+from src.application.numerical_method.utils.method_comparison import (
+    MATRIX_COLUMNS,
+    compare_matrix_methods_report,
+    parse_ranking_weights,
+)
 
 class MatrixComparisonReportView(View):
     def get(self, request):
@@ -9,7 +13,9 @@ class MatrixComparisonReportView(View):
         initial_guess_raw = request.GET.get("initial_guess", "")
         tolerance = float(request.GET.get("tolerance"))
         max_iterations = int(request.GET.get("max_iterations"))
-        relaxation_factor = float(request.GET.get("relaxation_factor", 1.2))
+        # Sin factor de relajación (o con "auto") se elige el óptimo para SOR
+        relaxation_factor = request.GET.get("relaxation_factor", "").strip()
+        relaxation_factor = None if relaxation_factor in ("", "auto") else float(relaxation_factor)
         precision_type = request.GET.get("precision_type", "decimales_correctos")
         matrix_size = int(request.GET.get("matrix_size", 2))
 
@@ -20,8 +26,13 @@ class MatrixComparisonReportView(View):
         b = [float(num) for num in vector_b_raw.strip().split()]
         x0 = [float(num) for num in initial_guess_raw.strip().split()]
 
+        try:
+            weights = parse_ranking_weights(request.GET.get("weights"), MATRIX_COLUMNS)
+        except ValueError as e:
+            return HttpResponse(str(e), status=400)
+
         csv_content, _ = compare_matrix_methods_report(
-            A, b, x0, tolerance, max_iterations, relaxation_factor, precision_type
+            A, b, x0, tolerance, max_iterations, relaxation_factor, precision_type, weights
         )
 
         response = HttpResponse(csv_content, content_type="text/csv")
@@ -35,6 +35,7 @@ class MultipleRoots1View(TemplateView):
         max_iterations = int(request.POST.get("max_iterations"))
         precision = int(request.POST.get("precision"))
         function_f = request.POST.get("function_f")
+        differentiation = request.POST.get("differentiation", "symbolic")
         multiplicity = int(request.POST.get("multiplicity"))
 
         response_validation = self.method_service.validate_input(
@@ -42,6 +43,7 @@ class MultipleRoots1View(TemplateView):
             tolerance=tolerance,
             max_iterations=max_iterations,
             function_f=function_f,
+            differentiation=differentiation,
         )
 
         if isinstance(response_validation, str):
@@ -60,6 +62,7 @@ class MultipleRoots1View(TemplateView):
                     "is_successful": True,
                     "have_solution": False,
                     "root": 0.0,
+                    "function_plot": plot_function(function_f, False, [(x0, 0)]),
                 }
             template_data = template_data | error_response
             context["template_data"] = template_data
@@ -71,10 +74,11 @@ class MultipleRoots1View(TemplateView):
             max_iterations=max_iterations,
             precision=precision,
             function_f=function_f,
+            differentiation=differentiation,
             multiplicity=multiplicity,
         )
         if method_response["is_successful"]:
-            plot_function(
+            method_response["function_plot"] = plot_function(
                 function_f,
                 method_response["have_solution"],
                 [(method_response["root"], 0.0)],
@@ -35,12 +35,14 @@ class MultipleRoots2View(TemplateView):
         max_iterations = int(request.POST.get("max_iterations"))
         precision = int(request.POST.get("precision"))
         function_f = request.POST.get("function_f")
+        differentiation = request.POST.get("differentiation", "symbolic")
 
         response_validation = self.method_service.validate_input(
             x0=x0,
             tolerance=tolerance,
             max_iterations=max_iterations,
             function_f=function_f,
+            differentiation=differentiation,
         )
 
         if isinstance(response_validation, str):
@@ -59,6 +61,7 @@ class MultipleRoots2View(TemplateView):
                     "is_successful": True,
                     "have_solution": False,
                     "root": 0.0,
+                    "function_plot": plot_function(function_f, False, [(x0, 0)]),
                 }
             template_data = template_data | error_response
             context["template_data"] = template_data
@@ -70,9 +73,10 @@ class MultipleRoots2View(TemplateView):
             max_iterations=max_iterations,
             precision=precision,
             function_f=function_f,
+            differentiation=differentiation,
         )
         if method_response["is_successful"]:
-            plot_function(
+            method_response["function_plot"] = plot_function(
                 function_f,
                 method_response["have_solution"],
                 [(method_response["root"], 0.0)],
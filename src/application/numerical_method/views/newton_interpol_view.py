@@ -58,7 +58,7 @@ class NewtonInterpolView(TemplateView):
 
 
         if method_response["is_successful"]:
-            plot_function(
+            method_response["function_plot"] = plot_function(
                 method_response["polynomial"],
                 method_response["have_solution"],
                 sorted_points,
@@ -0,0 +1,129 @@
+import hashlib
+import json
+
+from config.settings import PLOT_SIMPLIFY_TOLERANCE
+from dependency_injector.wiring import Provide, inject
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.views import View
+from src.application.numerical_method.containers.numerical_method_container import NumericalMethodContainer
+from src.application.numerical_method.interfaces.interpolation_method import InterpolationMethod
+from src.application.shared.utils.expression_parser import parse_expression
+from src.application.shared.utils.plot_data import (
+    function_plot_data,
+    spline_linear_plot_data,
+    spline_plot_data,
+)
+from src.application.shared.utils.plot_store import RENDER_VERSION
+
+# Número máximo de puntos de interés que se aceptan para la gráfica de una función.
+MAX_FUNCTION_POINTS = 16
+
+
+class PlotDataView(View):
+    """
+    Devuelve en JSON los datos de una gráfica para que el navegador la dibuje.
+
+    Las curvas se muestrean igual que en las gráficas SVG y se envían como float32 en base64,
+    junto con los marcadores y los límites de los ejes. La respuesta lleva un ETag calculado a
+    partir de los datos de entrada, así el navegador puede revalidarla sin descargarla de nuevo.
+
+    Parámetros (GET):
+        - kind "function": `function` (f(x)), `points` ("x,y;x,y") y `solution` ("true" o "false").
+        - kind "spline_linear", "spline_cubic" o "spline_quadratic": `x` y `y` separados por espacios,
+          como en los formularios de los splines.
+    """
+
+    @inject
+    def __init__(
+        self,
+        spline_linear_service: InterpolationMethod = Provide[NumericalMethodContainer.spline_linear_service],
+        spline_cubic_service: InterpolationMethod = Provide[NumericalMethodContainer.spline_cubic_service],
+        spline_quadratic_service: InterpolationMethod = Provide[NumericalMethodContainer.spline_quadratic_service],
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.spline_services = {
+            "spline_linear": spline_linear_service,
+            "spline_cubic": spline_cubic_service,
+            "spline_quadratic": spline_quadratic_service,
+        }
+
+    def get(self, request: HttpRequest, kind: str, *args, **kwargs) -> HttpResponse:
+        if kind == "function":
+            inputs = self._function_inputs(request)
+        elif kind in self.spline_services:
+            inputs = self._spline_inputs(request, kind)
+        else:
+            raise Http404("El tipo de gráfica solicitado no existe.")
+        if isinstance(inputs, str):
+            return JsonResponse({"message_method": inputs}, status=400)
+
+        payload = json.dumps([RENDER_VERSION, PLOT_SIMPLIFY_TOLERANCE, kind, inputs], sort_keys=True)
+        etag = f'"{hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            try:
+                response = JsonResponse(self._plot_data(kind, inputs))
+            except Exception as e:
+                return JsonResponse({"message_method": f"No se pudo calcular la gráfica: {e}"}, status=400)
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "public, max-age=86400"
+        return response
+
+    @staticmethod
+    def _function_inputs(request: HttpRequest) -> dict | str:
+        function_f = request.GET.get("function", "").strip()
+        try:
+            parse_expression(function_f)
+        except (SyntaxError, NameError) as e:
+            return f"Error: la función no es válida: {e}"
+
+        try:
+            points = [
+                [float(value) for value in point.split(",")]
+                for point in request.GET.get("points", "").split(";")
+                if point.strip()
+            ]
+        except ValueError:
+            return "Error: Los puntos deben tener el formato 'x,y;x,y'."
+        if not points or len(points) > MAX_FUNCTION_POINTS or any(len(point) != 2 for point in points):
+            return f"Error: Se necesitan entre 1 y {MAX_FUNCTION_POINTS} puntos con el formato 'x,y;x,y'."
+
+        return {
+            "function_f": function_f,
+            "have_solution": request.GET.get("solution", "false").lower() == "true",
+            "points": points,
+        }
+
+    def _spline_inputs(self, request: HttpRequest, kind: str) -> dict | str:
+        # Se valida igual que en el formulario del método.
+        response_validation = self.spline_services[kind].validate_input(
+            request.GET.get("x", ""), request.GET.get("y", "")
+        )
+        if isinstance(response_validation, str):
+            return response_validation
+
+        x_values, y_values = response_validation
+        if kind != "spline_linear" and len(x_values) < 3:
+            return "Error: Se necesitan al menos 3 puntos para calcular el spline."
+        sorted_points = sorted(zip(x_values, y_values))
+        return {
+            "x_values": [point[0] for point in sorted_points],
+            "y_values": [point[1] for point in sorted_points],
+        }
+
+    def _plot_data(self, kind: str, inputs: dict) -> dict:
+        if kind == "function":
+            return function_plot_data(
+                inputs["function_f"], inputs["have_solution"], [tuple(point) for point in inputs["points"]]
+            )
+        points = list(zip(inputs["x_values"], inputs["y_values"]))
+        if kind == "spline_linear":
+            return spline_linear_plot_data(points)
+        # El spline se calcula con el mismo servicio que resuelve el método.
+        spline = self.spline_services[kind].fit(inputs["x_values"], inputs["y_values"])
+        if kind == "spline_cubic":
+            return spline_plot_data("spline_cubic_plot", "Spline Cúbico", spline, points, "blue", "red")
+        return spline_plot_data("spline_quadratic_plot", "Spline Cuadrático", spline, points, "#8e44ad", "#f7dc6f")
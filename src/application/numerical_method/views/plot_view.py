@@ -0,0 +1,19 @@
+from django.http import Http404, HttpResponse
+from django.views import View
+from src.application.shared.utils.plot_store import plot_store
+
+
+class PlotView(View):
+    """
+    Sirve una gráfica del almacén. Como el nombre depende del contenido, el navegador
+    puede guardarla en caché indefinidamente.
+    """
+
+    def get(self, request, name: str, *args, **kwargs):
+        content = plot_store.read(name)
+        if content is None:
+            raise Http404("La gráfica solicitada no existe.")
+
+        response = HttpResponse(content, content_type="image/svg+xml")
+        response["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
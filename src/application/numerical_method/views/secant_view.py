@@ -61,6 +61,7 @@ class SecantView(TemplateView):
                     "is_successful": True,
                     "have_solution": False,
                     "root": 0.0,
+                    "function_plot": plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]),
                 }
             template_data = template_data | error_response
             context["template_data"] = template_data
@@ -75,7 +76,7 @@ class SecantView(TemplateView):
             interval_b=interval_b,
         )
         if method_response["is_successful"]:
-            plot_function(
+            method_response["function_plot"] = plot_function(
                 function_f,
                 method_response["have_solution"],
                 [(method_response["root"], 0.0)],
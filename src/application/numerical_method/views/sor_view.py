@@ -5,6 +5,7 @@ from src.application.numerical_method.containers.numerical_method_container impo
 )
 from dependency_injector.wiring import inject
 from django.http import HttpRequest, HttpResponse
+from src.application.numerical_method.utils.relaxation_factor import select_relaxation_factor
 
 
 class SORView(TemplateView):
@@ -34,7 +35,9 @@ class SORView(TemplateView):
         initial_guess_raw = request.POST.get("initial_guess", "")
         tolerance = float(request.POST.get("tolerance"))
         max_iterations = int(request.POST.get("max_iterations"))
-        relaxation_factor = float(request.POST.get("relaxation_factor"))
+        # Con "auto" el factor de relajación se elige después de validar el sistema
+        automatic_relaxation = request.POST.get("relaxation_mode") == "auto"
+        relaxation_factor = 1.0 if automatic_relaxation else float(request.POST.get("relaxation_factor"))
         precision_type = int(request.POST.get("precision"))
         matrix_size = int(request.POST.get("matrix_size"))
 
@@ -67,6 +70,11 @@ class SORView(TemplateView):
         b = response_validation[1]
         x0 = response_validation[2]
 
+        if automatic_relaxation:
+            relaxation_selection = select_relaxation_factor(A, b, x0, tolerance, max_iterations, precision_type)
+            relaxation_factor = relaxation_selection["relaxation_factor"]
+            template_data["relaxation_selection"] = relaxation_selection
+
         # Ejecutar el método SOR con los parámetros recibidos
         method_response = self.method_service.solve(
             A=A,
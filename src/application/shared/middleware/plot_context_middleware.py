@@ -0,0 +1,21 @@
+from src.application.shared.utils.plot_context import plot_context
+
+
+class PlotContextMiddleware:
+    """
+    Abre un contexto de gráficas por solicitud, así cada gráfica se dibuja una sola vez
+    aunque servicios y vistas la pidan varias veces.
+
+    Las gráficas solo se dibujan si la respuesta es una página HTML: los reportes CSV (y las
+    respuestas en streaming) no las muestran aunque la vista las haya pedido.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with plot_context(render=False) as context:
+            response = self.get_response(request)
+        if not response.streaming and response.get("Content-Type", "").startswith("text/html"):
+            context.flush()
+        return response
@@ -0,0 +1,240 @@
+import math
+from typing import Callable
+
+from src.application.shared.utils.expression_parser import CONSTANTS, FUNCTIONS, parse_expression
+
+
+class Taylor:
+    """
+    Número de Taylor truncado en segundo orden: guarda u, u' y u'' con respecto a x.
+
+    Las operaciones aritméticas y las funciones de `TAYLOR_FUNCTIONS` propagan las dos
+    derivadas con la regla de la cadena (diferenciación automática en modo directo), así
+    una sola evaluación de la expresión entrega f(x), f'(x) y f''(x).
+    """
+
+    __slots__ = ("value", "first", "second")
+
+    def __init__(self, value: float, first: float = 0.0, second: float = 0.0):
+        self.value = value
+        self.first = first
+        self.second = second
+
+    def __repr__(self) -> str:
+        return f"Taylor({self.value!r}, {self.first!r}, {self.second!r})"
+
+    def __add__(self, other):
+        other = _lift(other)
+        return Taylor(self.value + other.value, self.first + other.first, self.second + other.second)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _lift(other)
+        return Taylor(self.value - other.value, self.first - other.first, self.second - other.second)
+
+    def __rsub__(self, other):
+        return _lift(other) - self
+
+    def __mul__(self, other):
+        other = _lift(other)
+        return Taylor(
+            self.value * other.value,
+            self.first * other.value + self.value * other.first,
+            self.second * other.value + 2 * self.first * other.first + self.value * other.second,
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = _lift(other)
+        value = self.value / other.value
+        first = (self.first - value * other.first) / other.value
+        second = (self.second - 2 * first * other.first - value * other.second) / other.value
+        return Taylor(value, first, second)
+
+    def __rtruediv__(self, other):
+        return _lift(other) / self
+
+    def __pow__(self, other):
+        if isinstance(other, Taylor):
+            # u**v = exp(v * log(u))
+            return taylor_exp(other * taylor_log(self))
+        if other == 0:
+            return Taylor(1.0)
+        # Regla de la potencia; los términos con coeficiente cero no se evalúan para no
+        # dividir entre cero en u = 0 (por ejemplo x**2 en x = 0).
+        first_factor = other * self.value ** (other - 1)
+        second_factor = other * (other - 1) * self.value ** (other - 2) if other != 1 else 0.0
+        return Taylor(
+            self.value**other,
+            first_factor * self.first,
+            second_factor * self.first**2 + first_factor * self.second,
+        )
+
+    def __rpow__(self, other):
+        # c**u = exp(u * log(c))
+        if other == 0:
+            return Taylor(0.0 ** self.value)
+        return taylor_exp(self * math.log(other))
+
+    def __neg__(self):
+        return Taylor(-self.value, -self.first, -self.second)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return taylor_abs(self)
+
+    def __mod__(self, other):
+        other = _lift(other)
+        if other.first or other.second:
+            raise TypeError("El módulo solo admite un divisor constante.")
+        return Taylor(self.value % other.value, self.first, self.second)
+
+    def __rmod__(self, other):
+        # c % u es escalonada en u (sus derivadas son nulas donde existen), como c // u.
+        return Taylor(_lift(other).value % self.value)
+
+    def __floordiv__(self, other):
+        other = _lift(other)
+        return Taylor(self.value // other.value)
+
+    def __rfloordiv__(self, other):
+        return Taylor(_lift(other).value // self.value)
+
+
+def _lift(value) -> Taylor:
+    # Las constantes tienen derivadas nulas.
+    if isinstance(value, Taylor):
+        return value
+    return Taylor(value)
+
+
+def _chain(u, g0: float, g1: float, g2: float) -> Taylor:
+    # (g∘u)' = g'(u)·u'   y   (g∘u)'' = g''(u)·u'^2 + g'(u)·u''
+    return Taylor(g0, g1 * u.first, g2 * u.first**2 + g1 * u.second)
+
+
+def _unary(scalar_function: Callable, derivatives: Callable) -> Callable:
+    """
+    Construye la versión de Taylor de una función de una variable.
+
+    Args:
+        scalar_function (Callable): Función de `math` que se aplica al valor.
+        derivatives (Callable): Recibe (u, g(u)) y devuelve (g'(u), g''(u)).
+    """
+
+    def taylor_function(u, *args):
+        if args or not isinstance(u, Taylor):
+            return scalar_function(_value(u), *map(_value, args))
+        value = scalar_function(u.value)
+        return _chain(u, value, *derivatives(u.value, value))
+
+    return taylor_function
+
+
+def _value(value):
+    return value.value if isinstance(value, Taylor) else value
+
+
+def taylor_log(u, base=None):
+    u = _lift(u)
+    result = _chain(u, math.log(u.value), 1 / u.value, -1 / u.value**2)
+    if base is None:
+        return result
+    return result / taylor_log(base)
+
+
+def _taylor_pow(u, v):
+    return _lift(u) ** v
+
+
+def taylor_atan2(u, v):
+    # Localmente atan2(u, v) difiere de atan(u/v) (o de -atan(v/u)) en una constante,
+    # así que comparten derivadas; el valor se toma de math.atan2 para conservar el cuadrante.
+    u, v = _lift(u), _lift(v)
+    branch = TAYLOR_FUNCTIONS["atan"](u / v) if v.value != 0 else -TAYLOR_FUNCTIONS["atan"](v / u)
+    return Taylor(math.atan2(u.value, v.value), branch.first, branch.second)
+
+
+def taylor_hypot(*values):
+    # hypot(u, v, ...) = sqrt(u² + v² + ...); el valor se toma de math.hypot, que no se desborda.
+    branch = TAYLOR_FUNCTIONS["sqrt"](sum(_lift(value) * _lift(value) for value in values))
+    return Taylor(math.hypot(*map(_value, values)), branch.first, branch.second)
+
+
+def _taylor_extreme(choose: Callable) -> Callable:
+    def taylor_extreme(*values):
+        return choose(values, key=_value)
+
+    return taylor_extreme
+
+
+taylor_exp = _unary(math.exp, lambda u, value: (value, value))
+taylor_abs = _unary(abs, lambda u, value: (math.copysign(1.0, u), 0.0))
+
+TAYLOR_FUNCTIONS = {
+    "exp": taylor_exp,
+    "expm1": _unary(math.expm1, lambda u, value: (value + 1, value + 1)),
+    "log": taylor_log,
+    "ln": taylor_log,
+    "log10": _unary(math.log10, lambda u, value: (1 / (u * math.log(10)), -1 / (u**2 * math.log(10)))),
+    "log2": _unary(math.log2, lambda u, value: (1 / (u * math.log(2)), -1 / (u**2 * math.log(2)))),
+    "log1p": _unary(math.log1p, lambda u, value: (1 / (1 + u), -1 / (1 + u) ** 2)),
+    "sqrt": _unary(math.sqrt, lambda u, value: (1 / (2 * value), -1 / (4 * value**3))),
+    "sin": _unary(math.sin, lambda u, value: (math.cos(u), -value)),
+    "cos": _unary(math.cos, lambda u, value: (-math.sin(u), -value)),
+    "tan": _unary(math.tan, lambda u, value: (1 + value**2, 2 * value * (1 + value**2))),
+    "asin": _unary(math.asin, lambda u, value: (1 / math.sqrt(1 - u**2), u / (1 - u**2) ** 1.5)),
+    "acos": _unary(math.acos, lambda u, value: (-1 / math.sqrt(1 - u**2), -u / (1 - u**2) ** 1.5)),
+    "atan": _unary(math.atan, lambda u, value: (1 / (1 + u**2), -2 * u / (1 + u**2) ** 2)),
+    "atan2": taylor_atan2,
+    "sinh": _unary(math.sinh, lambda u, value: (math.cosh(u), value)),
+    "cosh": _unary(math.cosh, lambda u, value: (math.sinh(u), value)),
+    "tanh": _unary(math.tanh, lambda u, value: (1 - value**2, -2 * value * (1 - value**2))),
+    "asinh": _unary(math.asinh, lambda u, value: (1 / math.sqrt(u**2 + 1), -u / (u**2 + 1) ** 1.5)),
+    "acosh": _unary(math.acosh, lambda u, value: (1 / math.sqrt(u**2 - 1), -u / (u**2 - 1) ** 1.5)),
+    "atanh": _unary(math.atanh, lambda u, value: (1 / (1 - u**2), 2 * u / (1 - u**2) ** 2)),
+    "fabs": taylor_abs,
+    "abs": taylor_abs,
+    "floor": _unary(math.floor, lambda u, value: (0.0, 0.0)),
+    "ceil": _unary(math.ceil, lambda u, value: (0.0, 0.0)),
+    "trunc": _unary(math.trunc, lambda u, value: (0.0, 0.0)),
+    "pow": _taylor_pow,
+    "hypot": taylor_hypot,
+    "degrees": _unary(math.degrees, lambda u, value: (180 / math.pi, 0.0)),
+    "radians": _unary(math.radians, lambda u, value: (math.pi / 180, 0.0)),
+    "min": _taylor_extreme(min),
+    "max": _taylor_extreme(max),
+}
+
+TAYLOR_NAMESPACE = dict(TAYLOR_FUNCTIONS)
+TAYLOR_NAMESPACE |= {name: constants[0] for name, constants in CONSTANTS.items()}
+TAYLOR_NAMESPACE["__builtins__"] = {}
+
+
+def taylor_evaluator(function_f: str) -> Callable[[float], tuple[float, float, float]]:
+    """
+    Devuelve una función que calcula f(x), f'(x) y f''(x) en una sola pasada.
+
+    Usa la misma expresión interpretada por `parse_expression`, sin pasar por SymPy.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+
+    Returns:
+        Callable[[float], tuple[float, float, float]]: Evaluador de (f, f', f'').
+    """
+    taylor_function = parse_expression(function_f).build_function(TAYLOR_NAMESPACE)
+
+    def evaluate(x: float) -> tuple[float, float, float]:
+        result = _lift(taylor_function(Taylor(x, 1.0, 0.0)))
+        return result.value, result.first, result.second
+
+    return evaluate
+
+
+# Toda función permitida por el intérprete de expresiones debe tener su versión de Taylor.
+assert TAYLOR_FUNCTIONS.keys() == FUNCTIONS.keys()
@@ -0,0 +1,65 @@
+from typing import Callable
+
+from src.application.shared.utils.automatic_differentiation import taylor_evaluator
+from src.application.shared.utils.expression_parser import x_symbol
+from src.application.shared.utils.method_metrics import counted
+from src.application.shared.utils.symbolic_cache import symbolic_cache
+
+# Formas de obtener las derivadas que usan los métodos de la familia de Newton.
+SYMBOLIC = "symbolic"  # Derivación simbólica con SymPy (sp.diff + lambdify).
+AUTOMATIC = "automatic"  # Diferenciación automática en modo directo, sin SymPy.
+DIFFERENTIATION_MODES = (SYMBOLIC, AUTOMATIC)
+
+
+def _check_mode(differentiation: str) -> None:
+    if differentiation not in DIFFERENTIATION_MODES:
+        raise ValueError(f"Modo de derivación no válido: '{differentiation}'")
+
+
+def uses_variable(function_f: str, order: int, differentiation: str = SYMBOLIC) -> bool:
+    """
+    Interpreta la función, prepara sus derivadas hasta `order` e indica si depende de x.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+        order (int): Orden de la derivada más alta que necesita el método.
+        differentiation (str): SYMBOLIC o AUTOMATIC.
+
+    Returns:
+        bool: True si la función depende de x.
+
+    Raises:
+        SyntaxError, NameError, ValueError: Si la expresión o el modo de derivación no son válidos.
+    """
+    _check_mode(differentiation)
+    # En los dos modos se usa la expresión de SymPy, así "x - x" es constante en ambos. La
+    # derivada simbólica solo se prepara si se va a usar.
+    symbolic_entry = symbolic_cache.get(function_f)
+    if symbolic_entry.expression.free_symbols != {x_symbol}:
+        return False
+    if differentiation == SYMBOLIC:
+        symbolic_entry.derivative(order)
+    return True
+
+
+def derivative_evaluator(
+    function_f: str, order: int, differentiation: str = SYMBOLIC
+) -> Callable[[float], tuple[float, ...]]:
+    """
+    Devuelve una función que evalúa f(x) y sus derivadas hasta `order` en un punto.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+        order (int): Orden de la derivada más alta (1 o 2).
+        differentiation (str): SYMBOLIC o AUTOMATIC.
+
+    Returns:
+        Callable[[float], tuple[float, ...]]: Evaluador de (f, f', ..., f^(order)). Cada llamada
+        cuenta como una evaluación de f y `order` de derivadas en la medición activa.
+    """
+    _check_mode(differentiation)
+    if differentiation == AUTOMATIC:
+        evaluate_taylor = taylor_evaluator(function_f)
+        return counted(lambda x: evaluate_taylor(x)[: order + 1], derivatives=order)
+
+    return counted(symbolic_cache.get(function_f).fused(order), derivatives=order)
@@ -0,0 +1,360 @@
+import ast
+import copy
+import math
+import operator
+from functools import cached_property, lru_cache, reduce
+from typing import Callable
+
+import numpy as np
+import sympy as sp
+
+# Número máximo de expresiones interpretadas que se conservan en memoria.
+EXPRESSION_CACHE_SIZE = 256
+
+# Límites para plegar potencias enteras con aritmética exacta; fuera de ellos se usa float,
+# así "10**10**10" falla rápido con OverflowError en vez de construir un entero gigante.
+MAX_FOLDED_EXPONENT = 64
+MAX_FOLDED_BASE = 2**64
+
+x_symbol = sp.symbols("x")
+
+
+def _numpy_log(value, base=None):
+    # `math.log` admite una base opcional, `np.log` no.
+    if base is None:
+        return np.log(value)
+    return np.log(value) / np.log(base)
+
+
+def _sympy_log(value, base=None):
+    if base is None:
+        return sp.log(value)
+    return sp.log(value, base)
+
+
+def _sympy_trunc(value):
+    return sp.Piecewise((sp.floor(value), value >= 0), (sp.ceiling(value), True))
+
+
+def _sympy_hypot(*values):
+    return sp.sqrt(sum(value**2 for value in values))
+
+
+# Funciones permitidas en las expresiones: nombre -> (math, NumPy, SymPy).
+# Se aceptan tanto con el prefijo `math.` (math.sin) como sin él (sin). Son las que ya tenían
+# versión vectorizada, más ln, abs, min y max. El resto de `math` y de las funciones de Python
+# (que antes se alcanzaban porque la expresión se evaluaba con `eval` sin restricciones) no se
+# acepta a propósito: no tienen equivalente en NumPy y SymPy, o no son funciones matemáticas.
+FUNCTIONS = {
+    "exp": (math.exp, np.exp, sp.exp),
+    "expm1": (math.expm1, np.expm1, lambda value: sp.exp(value) - 1),
+    "log": (math.log, _numpy_log, _sympy_log),
+    "log10": (math.log10, np.log10, lambda value: sp.log(value, 10)),
+    "log2": (math.log2, np.log2, lambda value: sp.log(value, 2)),
+    "ln": (math.log, np.log, sp.log),
+    "log1p": (math.log1p, np.log1p, lambda value: sp.log(1 + value)),
+    "sqrt": (math.sqrt, np.sqrt, sp.sqrt),
+    "sin": (math.sin, np.sin, sp.sin),
+    "cos": (math.cos, np.cos, sp.cos),
+    "tan": (math.tan, np.tan, sp.tan),
+    "asin": (math.asin, np.arcsin, sp.asin),
+    "acos": (math.acos, np.arccos, sp.acos),
+    "atan": (math.atan, np.arctan, sp.atan),
+    "atan2": (math.atan2, np.arctan2, sp.atan2),
+    "sinh": (math.sinh, np.sinh, sp.sinh),
+    "cosh": (math.cosh, np.cosh, sp.cosh),
+    "tanh": (math.tanh, np.tanh, sp.tanh),
+    "asinh": (math.asinh, np.arcsinh, sp.asinh),
+    "acosh": (math.acosh, np.arccosh, sp.acosh),
+    "atanh": (math.atanh, np.arctanh, sp.atanh),
+    "fabs": (math.fabs, np.fabs, sp.Abs),
+    "abs": (abs, np.abs, sp.Abs),
+    "floor": (math.floor, np.floor, sp.floor),
+    "ceil": (math.ceil, np.ceil, sp.ceiling),
+    "trunc": (math.trunc, np.trunc, _sympy_trunc),
+    "pow": (math.pow, np.power, sp.Pow),
+    "hypot": (math.hypot, lambda *values: reduce(np.hypot, values), _sympy_hypot),
+    "degrees": (math.degrees, np.degrees, lambda value: value * 180 / sp.pi),
+    "radians": (math.radians, np.radians, lambda value: value * sp.pi / 180),
+    "min": (min, lambda *values: reduce(np.minimum, values), sp.Min),
+    "max": (max, lambda *values: reduce(np.maximum, values), sp.Max),
+}
+
+# Constantes permitidas: nombre canónico -> (math, NumPy, SymPy).
+CONSTANTS = {
+    "pi": (math.pi, np.pi, sp.pi),
+    "E": (math.e, np.e, sp.E),
+    "tau": (math.tau, 2 * np.pi, 2 * sp.pi),
+    "inf": (math.inf, np.inf, sp.oo),
+    "nan": (math.nan, np.nan, sp.nan),
+}
+
+# Nombres de `math.*` que corresponden a una constante, con su nombre canónico.
+MATH_CONSTANT_ALIASES = {"pi": "pi", "e": "E", "tau": "tau", "inf": "inf", "nan": "nan"}
+
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.Mod: operator.mod,
+    ast.FloorDiv: operator.floordiv,
+}
+UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _namespace(position: int) -> dict:
+    namespace = {name: functions[position] for name, functions in FUNCTIONS.items()}
+    namespace |= {name: constants[position] for name, constants in CONSTANTS.items()}
+    namespace["__builtins__"] = {}
+    return namespace
+
+
+SCALAR_NAMESPACE = _namespace(0)
+NUMPY_NAMESPACE = _namespace(1)
+SYMPY_NAMESPACE = _namespace(2)
+# Los enteros de la expresión se convierten a enteros de SymPy (ver `_SympyIntegers`).
+SYMPY_NAMESPACE["Integer"] = sp.Integer
+
+
+def normalize_expression(expression: str) -> str:
+    """
+    Normaliza el texto de una expresión para usarlo como llave de caché.
+
+    Args:
+        expression (str): Expresión ingresada por el usuario, por ejemplo "math.exp(-x) - x".
+
+    Returns:
+        str: La expresión sin espacios sobrantes.
+    """
+    return " ".join(expression.split())
+
+
+class ParsedExpression:
+    """
+    Expresión de una variable (x) interpretada una sola vez a partir de su árbol sintáctico.
+
+    Del mismo árbol validado se obtienen:
+        - `scalar`: función de Python que evalúa con el módulo `math`.
+        - `vectorized`: función que evalúa arreglos completos con las ufuncs de NumPy.
+        - `sympy`: expresión simbólica de SymPy, construida solo cuando se pide.
+
+    Las funciones numéricas usan el árbol con las subexpresiones constantes ya calculadas
+    (ver `_ConstantFolder`). `sympy` solo pliega la aritmética entre enteros y usa enteros de
+    SymPy, así 1/3, sqrt(2) y pi siguen siendo exactos; `canonical` usa el árbol sin plegar.
+    """
+
+    def __init__(self, text: str, tree: ast.Expression):
+        self.text = text
+        self.tree = tree
+        # Texto canónico: mismo resultado para "math.sin(x)" y "sin( x )".
+        self.canonical = ast.unparse(tree)
+
+        folded_tree = _ConstantFolder().visit(copy.deepcopy(tree))
+        ast.fix_missing_locations(folded_tree)
+        self.code = _compile_function(folded_tree)
+
+        self.scalar = self.build_function(SCALAR_NAMESPACE)
+        self.vectorized = self.build_function(NUMPY_NAMESPACE)
+
+    def build_function(self, namespace: dict) -> Callable:
+        """
+        Construye la función numérica de x resolviendo los nombres de la expresión en `namespace`.
+        """
+        return eval(self.code, namespace)
+
+    @cached_property
+    def sympy(self) -> sp.Expr:
+        exact_tree = _SympyIntegers().visit(_ConstantFolder(exact=True).visit(copy.deepcopy(self.tree)))
+        ast.fix_missing_locations(exact_tree)
+        exact_function = eval(_compile_function(exact_tree), SYMPY_NAMESPACE)
+        return sp.sympify(exact_function(x_symbol))
+
+
+def _compile_function(tree: ast.Expression):
+    # Envuelve el cuerpo de la expresión en `lambda x: <expresión>` y lo compila.
+    function_node = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg="x")],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=tree.body,
+        )
+    )
+    ast.fix_missing_locations(function_node)
+    return compile(function_node, "<function>", "eval")
+
+
+def parse_expression(expression: str) -> ParsedExpression:
+    """
+    Interpreta una expresión en función de x y la guarda en una caché LRU.
+
+    Args:
+        expression (str): Expresión ingresada por el usuario, por ejemplo "math.exp(-x) - x".
+
+    Returns:
+        ParsedExpression: Expresión interpretada, lista para evaluar.
+
+    Raises:
+        SyntaxError: Si la expresión no es válida o usa construcciones no permitidas.
+        NameError: Si la expresión usa nombres distintos de x, las funciones y las constantes permitidas.
+    """
+    return _parse_normalized(normalize_expression(expression))
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _parse_normalized(expression: str) -> ParsedExpression:
+    # Como en SymPy, "^" se interpreta como potencia; se reemplaza antes de interpretar
+    # para conservar la precedencia de "**" (x^2 - 2 es x**2 - 2).
+    tree = ast.parse(expression.replace("^", "**"), mode="eval")
+    tree = _Whitelist().visit(tree)
+    ast.fix_missing_locations(tree)
+    return ParsedExpression(expression, tree)
+
+
+class _Whitelist(ast.NodeTransformer):
+    """
+    Valida que el árbol solo tenga operaciones aritméticas, x, y funciones o constantes permitidas.
+
+    También lleva los nombres a su forma canónica: `math.sin` -> `sin` y `math.e` -> `E`.
+    """
+
+    def generic_visit(self, node):
+        raise SyntaxError(f"Construcción no permitida en la función: {type(node).__name__}.")
+
+    def visit_Expression(self, node):
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise SyntaxError(f"Constante no permitida en la función: {node.value!r}.")
+        return node
+
+    def visit_Name(self, node):
+        if node.id != "x" and node.id not in FUNCTIONS and node.id not in CONSTANTS:
+            raise NameError(f"name '{node.id}' is not defined")
+        return ast.Name(id=node.id, ctx=ast.Load())
+
+    def visit_Attribute(self, node):
+        if not (isinstance(node.value, ast.Name) and node.value.id == "math"):
+            raise SyntaxError("Solo se permite acceder a funciones del módulo 'math'.")
+        if node.attr in MATH_CONSTANT_ALIASES:
+            return ast.Name(id=MATH_CONSTANT_ALIASES[node.attr], ctx=ast.Load())
+        if node.attr in FUNCTIONS:
+            return ast.Name(id=node.attr, ctx=ast.Load())
+        raise NameError(f"name 'math.{node.attr}' is not defined")
+
+    def visit_BinOp(self, node):
+        if type(node.op) not in BINARY_OPERATORS:
+            raise SyntaxError(f"Operador no permitido en la función: {type(node.op).__name__}.")
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        return node
+
+    def visit_UnaryOp(self, node):
+        if type(node.op) not in UNARY_OPERATORS:
+            raise SyntaxError(f"Operador no permitido en la función: {type(node.op).__name__}.")
+        node.operand = self.visit(node.operand)
+        return node
+
+    def visit_Call(self, node):
+        if node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+            raise SyntaxError("Las funciones solo admiten argumentos posicionales.")
+        node.func = self.visit(node.func)
+        if not (isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS):
+            raise SyntaxError("Solo se pueden llamar las funciones matemáticas permitidas.")
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+
+class _ConstantFolder(ast.NodeTransformer):
+    """
+    Reemplaza los subárboles que solo dependen de constantes por su valor numérico (float o
+    entero), para las funciones numéricas.
+
+    Con `exact` solo se pliegan operaciones entre enteros cuyo resultado es entero (por ejemplo
+    2**10, pero no 1/3 ni sqrt(2)), así la expresión de SymPy no pierde exactitud.
+
+    Si la evaluación falla (por ejemplo 1/0 o math.log(-1)) el subárbol se deja igual,
+    para que el error aparezca al evaluar la función como antes.
+    """
+
+    def __init__(self, exact: bool = False):
+        self.exact = exact
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        left, right = self._constant_value(node.left), self._constant_value(node.right)
+        if isinstance(node.op, ast.Pow) and isinstance(left, int) and isinstance(right, int):
+            if not (abs(right) <= MAX_FOLDED_EXPONENT and abs(left) <= MAX_FOLDED_BASE):
+                # Potencia entera demasiado grande: se calcula con float, también para SymPy,
+                # que calcularía el entero completo.
+                left = float(left)
+                node.left = ast.copy_location(ast.Constant(left), node.left)
+                if self.exact:
+                    return node
+            elif right < 0 and self.exact:
+                # En Python 2**-1 es 0.5; se deja para SymPy, que da 1/2.
+                return node
+        if left is None or right is None:
+            return node
+        return self._fold(node, lambda: BINARY_OPERATORS[type(node.op)](left, right))
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        operand = self._constant_value(node.operand)
+        if operand is None:
+            return node
+        return self._fold(node, lambda: UNARY_OPERATORS[type(node.op)](operand))
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if self.exact:
+            return node
+        args = [self._constant_value(arg) for arg in node.args]
+        if any(arg is None for arg in args):
+            return node
+        return self._fold(node, lambda: SCALAR_NAMESPACE[node.func.id](*args))
+
+    def _fold(self, node, evaluate):
+        try:
+            value = evaluate()
+        except (ArithmeticError, ValueError, TypeError):
+            return node
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            return node
+        if self.exact and not isinstance(value, int):
+            return node
+        return ast.copy_location(ast.Constant(value), node)
+
+    def _constant_value(self, node):
+        if isinstance(node, ast.Constant):
+            if self.exact and not isinstance(node.value, int):
+                return None
+            return node.value
+        if not self.exact and isinstance(node, ast.Name) and node.id in CONSTANTS:
+            return CONSTANTS[node.id][0]
+        return None
+
+
+class _SympyIntegers(ast.NodeTransformer):
+    """
+    Envuelve las constantes enteras en `Integer(...)`, así 1/3 se divide en SymPy (Rational)
+    y no en Python (float).
+    """
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, int) and not isinstance(node.value, bool):
+            return ast.copy_location(
+                ast.Call(func=ast.Name(id="Integer", ctx=ast.Load()), args=[node], keywords=[]), node
+            )
+        return node
@@ -0,0 +1,63 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from matplotlib.backends.backend_svg import FigureCanvasSVG
+from matplotlib.figure import Figure, SubplotParams
+
+
+class FigurePool:
+    """
+    Figuras de matplotlib reutilizables, una por hilo y por tamaño.
+
+    Se usa la interfaz orientada a objetos (`Figure` con su propio `FigureCanvasSVG`) en lugar
+    de `pyplot`, que guarda la figura actual en un estado global compartido por todos los hilos.
+    Cada hilo tiene sus propias figuras, así varios hilos pueden dibujar a la vez sin
+    compartir objetos de matplotlib, y cada gráfica limpia y reutiliza una figura existente en
+    vez de crear y destruir una nueva.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @contextmanager
+    def figure(self, figsize: tuple[float, float]) -> Iterator[Figure]:
+        """
+        Presta una figura vacía de tamaño `figsize` (en pulgadas) al hilo actual.
+
+        Al terminar la figura se limpia y vuelve al conjunto del hilo, aunque el dibujo falle.
+        """
+        figures = self._figures()
+        figure = figures.pop(figsize, None)
+        if figure is None:
+            figure = Figure(figsize=figsize)
+            FigureCanvasSVG(figure)
+        try:
+            yield figure
+        finally:
+            _reset(figure)
+            figures[figsize] = figure
+
+    def _figures(self) -> dict:
+        # Figuras libres del hilo actual, por tamaño. Una figura prestada no está en el diccionario,
+        # así que un dibujo anidado del mismo tamaño recibe una figura distinta.
+        if not hasattr(self._local, "figures"):
+            self._local.figures = {}
+        return self._local.figures
+
+
+def _reset(figure: Figure) -> None:
+    # `clear` quita los ejes y textos, pero no los márgenes que dejó `tight_layout`.
+    figure.clear()
+    defaults = SubplotParams()
+    figure.subplots_adjust(
+        left=defaults.left,
+        right=defaults.right,
+        bottom=defaults.bottom,
+        top=defaults.top,
+        wspace=defaults.wspace,
+        hspace=defaults.hspace,
+    )
+
+
+figure_pool = FigurePool()
@@ -0,0 +1,154 @@
+import numpy as np
+
+from config.settings import PLOT_SAMPLE_BUDGET
+from src.application.shared.utils.expression_parser import parse_expression
+
+# Puntos uniformes con los que empieza el muestreo adaptativo, en todo el dominio y en la ventana visible.
+INITIAL_DOMAIN_SAMPLES = 65
+INITIAL_WINDOW_SAMPLES = 129
+
+# Desviación máxima, como fracción del alto de la ventana, entre la curva y el segmento que la
+# aproxima antes de refinar (con una gráfica de unos 400 px de alto es menos de medio píxel).
+CURVATURE_TOLERANCE = 1e-3
+
+# Ancho mínimo de un tramo, como fracción del ancho de la ventana: no tiene sentido dividir por
+# debajo de un píxel.
+MIN_INTERVAL_FRACTION = 1 / 2048
+
+
+def evaluate_function(function_f: str, x_vals: np.ndarray) -> np.ndarray:
+    """
+    Evalúa la función en todos los valores de x; donde no está definida el resultado es NaN.
+
+    Primero intenta evaluar el arreglo completo en una sola llamada con NumPy; los errores de
+    dominio quedan como NaN o infinito. Si la evaluación vectorizada falla (por ejemplo
+    resultados complejos) se evalúa punto a punto.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+        x_vals (np.ndarray): Valores de x donde se evalúa la función.
+
+    Returns:
+        np.ndarray: Imágenes de x, con NaN en los puntos donde la función no está definida.
+    """
+    try:
+        vectorized_f = parse_expression(function_f).vectorized
+        with np.errstate(all="ignore"):
+            y_vals = vectorized_f(x_vals)
+        if np.iscomplexobj(y_vals):
+            raise TypeError("La función tiene valores complejos.")
+        # Las funciones constantes devuelven un escalar, se extiende a todo el rango.
+        y_vals = np.broadcast_to(np.asarray(y_vals, dtype=float), x_vals.shape)
+    except Exception:
+        return _evaluate_function_scalar(function_f, x_vals)
+
+    return np.where(np.isfinite(y_vals), y_vals, np.nan)
+
+
+def _evaluate_function_scalar(function_f: str, x_vals: np.ndarray) -> np.ndarray:
+    # Evaluación punto a punto para las expresiones que no se pueden vectorizar.
+    y_vals = np.full(x_vals.shape, np.nan)
+    try:
+        scalar_f = parse_expression(function_f).scalar
+    except Exception:
+        return y_vals
+
+    for i, val in enumerate(x_vals):
+        try:
+            y = scalar_f(val)
+        except Exception:
+            continue
+        if isinstance(y, (int, float)) and np.isfinite(y):
+            y_vals[i] = y
+    return y_vals
+
+
+def sample_function(function_f: str, x_vals: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa la función en todos los valores de x y descarta los puntos donde no está definida.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+        x_vals (np.ndarray): Valores de x donde se evalúa la función.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Valores de x válidos y sus imágenes.
+    """
+    y_vals = evaluate_function(function_f, x_vals)
+    mask = np.isfinite(y_vals)
+    return x_vals[mask], y_vals[mask]
+
+
+def adaptive_sample(
+    function_f: str,
+    domain: tuple[float, float],
+    x_window: tuple[float, float],
+    y_window: tuple[float, float],
+    budget: int = PLOT_SAMPLE_BUDGET,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Muestrea la función empezando con una malla gruesa y refinando solo donde hace falta.
+
+    En cada ronda se parte por la mitad cada tramo visible en el que:
+        - la curva se aleja del segmento recto más de `CURVATURE_TOLERANCE` del alto de la ventana,
+        - la función cambia de signo, o
+        - la función pasa de estar definida a no estarlo (borde del dominio o discontinuidad).
+    Se detiene cuando ningún tramo necesita refinarse, cuando los tramos llegan al ancho de un
+    píxel o cuando se alcanza `budget` evaluaciones; si no caben todos, se refinan primero los
+    tramos con mayor error.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+        domain (tuple[float, float]): Intervalo de x donde se evalúa la función.
+        x_window (tuple[float, float]): Límites del eje x de la gráfica.
+        y_window (tuple[float, float]): Límites del eje y de la gráfica.
+        budget (int): Número máximo de evaluaciones de la función.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Valores de x válidos y sus imágenes.
+    """
+    width = x_window[1] - x_window[0]
+    height = y_window[1] - y_window[0]
+    min_interval = width * MIN_INTERVAL_FRACTION
+
+    window_start, window_end = max(domain[0], x_window[0]), min(domain[1], x_window[1])
+    x_vals = np.linspace(domain[0], domain[1], INITIAL_DOMAIN_SAMPLES)
+    if window_start < window_end:
+        x_vals = np.union1d(x_vals, np.linspace(window_start, window_end, INITIAL_WINDOW_SAMPLES))
+    y_vals = evaluate_function(function_f, x_vals)
+
+    while len(x_vals) < budget:
+        defined = np.isfinite(y_vals)
+        # Fuera de la ventana la curva se recorta, así que basta medir el error hasta un alto más.
+        y_clipped = np.clip(y_vals, y_window[0] - height, y_window[1] + height)
+
+        # Desviación de cada punto interior respecto al segmento entre sus vecinos.
+        t = (x_vals[1:-1] - x_vals[:-2]) / (x_vals[2:] - x_vals[:-2])
+        interpolated = y_clipped[:-2] + t * (y_clipped[2:] - y_clipped[:-2])
+        deviation = np.nan_to_num(np.abs(y_clipped[1:-1] - interpolated) / height)
+        error = np.zeros(len(x_vals) - 1)
+        error[:-1] = deviation
+        error[1:] = np.maximum(error[1:], deviation)
+
+        sign_change = defined[:-1] & defined[1:] & (np.sign(y_vals[:-1]) != np.sign(y_vals[1:]))
+        domain_edge = defined[:-1] != defined[1:]
+        refine = (error > CURVATURE_TOLERANCE) | sign_change | domain_edge
+
+        visible = (x_vals[1:] >= x_window[0]) & (x_vals[:-1] <= x_window[1])
+        wide = np.diff(x_vals) > min_interval
+        candidates = np.flatnonzero(refine & visible & wide)
+        if candidates.size == 0:
+            break
+
+        room = budget - len(x_vals)
+        if candidates.size > room:
+            priority = error[candidates] + CURVATURE_TOLERANCE * (sign_change | domain_edge)[candidates]
+            candidates = np.sort(candidates[np.argsort(-priority, kind="stable")[:room]])
+
+        new_x = (x_vals[candidates] + x_vals[candidates + 1]) / 2
+        new_y = evaluate_function(function_f, new_x)
+        x_vals = np.insert(x_vals, candidates + 1, new_x)
+        y_vals = np.insert(y_vals, candidates + 1, new_y)
+
+    mask = np.isfinite(y_vals)
+    return x_vals[mask], y_vals[mask]
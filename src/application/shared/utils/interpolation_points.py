@@ -0,0 +1,44 @@
+def parse_points(x_input: str, y_input: str) -> str | list[list[float]]:
+    """
+    Convierte los valores de 'x' y 'y' (separados por espacios) en listas de números.
+
+    Args:
+        x_input (str): Valores de x.
+        y_input (str): Valores de y.
+
+    Returns:
+        str | list[list[float]]: Mensaje de error, o las listas [x, y].
+    """
+    # Convertir las cadenas de entrada en listas
+    x_list = [value.strip() for value in x_input.split(" ") if value.strip()]
+    y_list = [value.strip() for value in y_input.split(" ") if value.strip()]
+
+    # Validar que las listas no estén vacías
+    if len(x_list) == 0 or len(y_list) == 0:
+        return "Error: Las listas de 'x' y 'y' no pueden estar vacías."
+
+    # Validar que ambas listas tengan el mismo tamaño
+    if len(x_list) != len(y_list):
+        return "Error: Las listas de 'x' y 'y' deben tener la misma cantidad de elementos."
+
+    # Validar que cada elemento de x_list y y_list es numérico
+    try:
+        x_values = [float(value) for value in x_list]
+        y_values = [float(value) for value in y_list]
+    except ValueError:
+        return "Error: Todos los valores de 'x' y 'y' deben ser numéricos."
+
+    # Validamos que los elementos de x sean únicos.
+    if len(set(x_values)) != len(x_values):
+        return "Error: Los valores de 'x' deben ser únicos."
+
+    return [x_values, y_values]
+
+
+def point_limit_error(x_values: list[float], max_points: int) -> str | None:
+    """
+    Devuelve el mensaje de error si hay más de `max_points` puntos, o None si no.
+    """
+    if len(x_values) > max_points:
+        return f"Error: El número máximo de puntos es {max_points}."
+    return None
@@ -0,0 +1,111 @@
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+_current_metrics: ContextVar["MethodMetrics | None"] = ContextVar("method_metrics", default=None)
+
+# `tracemalloc` es global al proceso: las mediciones de un mismo proceso se hacen de a una.
+_measure_lock = threading.Lock()
+
+
+class MethodMetrics:
+    """
+    Costo de una ejecución de un método: tiempo, evaluaciones y memoria.
+
+    Los servicios solo cuentan cuando hay una medición activa (`measure`); en las páginas de
+    los métodos los contadores no hacen nada.
+    """
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self.function_evaluations = 0
+        self.derivative_evaluations = 0
+        self.matrix_vector_products = 0
+        self.peak_memory = 0
+
+    def as_row(self, matrix: bool = False) -> dict:
+        """
+        Devuelve las métricas como columnas de los reportes CSV.
+        """
+        row = {"Tiempo (ms)": round(self.elapsed * 1000, 3)}
+        if matrix:
+            row["Productos matriz-vector"] = self.matrix_vector_products
+        else:
+            row["Evaluaciones de f"] = self.function_evaluations
+            row["Evaluaciones de derivadas"] = self.derivative_evaluations
+        row["Memoria pico (KB)"] = round(self.peak_memory / 1024, 1)
+        return row
+
+
+def empty_metrics_row(matrix: bool = False) -> dict:
+    """
+    Columnas de métricas para un método que falló o se canceló.
+    """
+    return {column: "-" for column in MethodMetrics().as_row(matrix)}
+
+
+@contextmanager
+def measure() -> Iterator[MethodMetrics]:
+    """
+    Mide el bloque: tiempo de reloj, evaluaciones contadas por los servicios y memoria pico
+    (con `tracemalloc`, relativa a la memoria en uso al empezar).
+
+    `tracemalloc` es global al proceso, así que dos hilos no pueden medir a la vez sin mezclar
+    su memoria: cada medición espera a que termine la anterior del mismo proceso. Los métodos
+    de raíces corren cada uno en su proceso (con COMPARISON_PARALLEL) y no esperan; los
+    matriciales, que se ejecutan en el proceso de la solicitud, sí. La memoria que reservan a la
+    vez otros hilos sin medición también se cuenta. La espera no se cuenta en el tiempo, que
+    incluye el costo de `tracemalloc`, el mismo para todos los métodos.
+    """
+    metrics = MethodMetrics()
+    with _measure_lock:
+        token = _current_metrics.set(metrics)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.elapsed = time.perf_counter() - start
+            metrics.peak_memory = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+            if started_tracing:
+                tracemalloc.stop()
+            _current_metrics.reset(token)
+
+
+def counted(function: Callable, derivatives: int = 0) -> Callable:
+    """
+    Envuelve un evaluador para contar sus llamadas en la medición activa.
+
+    Args:
+        function (Callable): Evaluador de f(x) o de (f, f', ..., f^(derivatives)).
+        derivatives (int): Cuántas derivadas calcula cada llamada además de f.
+
+    Returns:
+        Callable: El mismo evaluador si no hay medición activa, o uno que cuenta cada llamada.
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return function
+
+    def counted_function(*args):
+        metrics.function_evaluations += 1
+        metrics.derivative_evaluations += derivatives
+        return function(*args)
+
+    return counted_function
+
+
+def count_matrix_vector_products(count: int = 1) -> None:
+    """
+    Suma `count` productos matriz-vector (un barrido completo de un método iterativo) a la medición activa.
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.matrix_vector_products += count
@@ -0,0 +1,228 @@
+import multiprocessing
+import threading
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Callable, Iterator
+
+
+def supports_process_pool() -> bool:
+    """
+    Indica si la plataforma permite crear procesos con `forkserver` (Linux y macOS, no Windows).
+    """
+    return "forkserver" in multiprocessing.get_all_start_methods()
+
+
+class _Worker:
+    """
+    Proceso hijo que ejecuta tareas una tras otra; recibe (función, argumentos) por un pipe y
+    devuelve el resultado por el mismo pipe.
+    """
+
+    def __init__(self, context):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_worker_loop, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def close(self) -> None:
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.connection.close()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+
+    def kill(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def _worker_loop(connection: Connection) -> None:
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        function, args = message
+        try:
+            result = function(*args)
+        except Exception as e:
+            result = e
+        try:
+            connection.send(result)
+        except Exception as e:
+            # El resultado (o la excepción) no se pudo serializar.
+            connection.send(RuntimeError(str(e)))
+
+
+class ProcessPool:
+    """
+    Conjunto de procesos reutilizables que ejecutan tareas con un límite de tiempo por tarea.
+
+    Los procesos se crean la primera vez que se necesitan y se conservan para las siguientes
+    llamadas, así no se pierden las cachés del proceso hijo. Una tarea que supera su límite se
+    cancela terminando solo su proceso, que se reemplaza la próxima vez que haga falta.
+
+    Nunca hay más de `max_workers` procesos vivos, aunque varias solicitudes usen el pool a la
+    vez: una tarea que no encuentra un proceso libre espera a que otra lo devuelva, y si no lo
+    consigue dentro de su límite de tiempo su resultado es un `TimeoutError`.
+
+    Los procesos no se copian de este proceso (`fork`), que tiene hilos de solicitudes y de
+    dibujo que pueden estar usando un candado justo en ese momento; el hijo heredaría el candado
+    tomado y se bloquearía hasta el límite de tiempo. Se copian de un servidor de procesos
+    (`forkserver`) que no tiene otros hilos y que importa una sola vez los módulos de `preload`.
+
+    Las funciones se envían por referencia (pickle), así que deben estar definidas a nivel de
+    módulo; sus argumentos y resultados también deben poder serializarse. Como con cualquier
+    proceso que no se crea con `fork`, el script principal se vuelve a importar en cada hijo y
+    debe protegerse con `if __name__ == "__main__":` (manage.py ya lo hace).
+    """
+
+    def __init__(self, max_workers: int, preload: list[str] | None = None):
+        self.max_workers = max(max_workers, 1)
+        self._context = multiprocessing.get_context("forkserver")
+        # El servidor de procesos es uno solo por proceso: se usa la lista del último pool creado.
+        self._context.set_forkserver_preload(list(preload or []))
+        self._idle: list[_Worker] = []
+        # Procesos vivos, libres u ocupados; `_available` avisa cuando uno se libera o termina.
+        self._live = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+    def run(self, tasks: dict[str, tuple[Callable, tuple]], timeout: float) -> dict[str, object]:
+        """
+        Ejecuta las tareas en paralelo, hasta `max_workers` a la vez.
+
+        Args:
+            tasks (dict[str, tuple[Callable, tuple]]): Función y argumentos de cada tarea, por nombre.
+            timeout (float): Segundos máximos de cada tarea, contados desde que empieza. También
+                es lo máximo que una tarea espera un proceso libre cuando otras solicitudes los
+                ocupan todos.
+
+        Returns:
+            dict[str, object]: Resultado de cada tarea, en el mismo orden que `tasks`. Si la tarea
+            lanzó una excepción el resultado es esa excepción, y si se canceló es un `TimeoutError`.
+        """
+        results = dict(self.as_completed(tasks, timeout))
+        return {name: results[name] for name in tasks}
+
+    def as_completed(self, tasks: dict[str, tuple[Callable, tuple]], timeout: float) -> Iterator[tuple[str, object]]:
+        """
+        Como `run`, pero entrega cada resultado en cuanto su tarea termina.
+
+        Si quien consume el generador lo abandona (por ejemplo, porque el cliente cerró la
+        conexión), las tareas que seguían corriendo se cancelan.
+
+        Yields:
+            tuple[str, object]: Nombre de la tarea y su resultado, excepción o `TimeoutError`.
+        """
+        pending = list(tasks.items())
+        running: dict[Connection, tuple[str, _Worker, float]] = {}
+        # Desde cuándo espera un proceso libre la próxima tarea de `pending`.
+        waiting_since = None
+
+        try:
+            while pending or running:
+                while pending and len(running) < self.max_workers:
+                    name, (function, args) = pending[0]
+                    if waiting_since is None:
+                        waiting_since = time.monotonic()
+                    # Mientras haya tareas propias corriendo no se bloquea: al terminar alguna
+                    # se vuelve a intentar.
+                    wait_time = 0.0 if running else waiting_since + timeout - time.monotonic()
+                    worker = self._acquire(wait_time)
+                    if worker is None:
+                        if running:
+                            break
+                        pending.pop(0)
+                        waiting_since = None
+                        yield name, TimeoutError(
+                            f"'{name}' esperó más de {timeout:g} segundos un proceso libre."
+                        )
+                        continue
+                    pending.pop(0)
+                    waiting_since = None
+                    try:
+                        worker.connection.send((function, args))
+                    except Exception as e:
+                        # Por ejemplo, argumentos que no se pueden serializar.
+                        self._release(worker)
+                        yield name, e
+                        continue
+                    running[worker.connection] = (name, worker, time.monotonic() + timeout)
+                if not running:
+                    continue
+
+                next_deadline = min(deadline for _, _, deadline in running.values())
+                for connection in wait(list(running), timeout=max(0.0, next_deadline - time.monotonic())):
+                    name, worker, _ = running.pop(connection)
+                    try:
+                        result = connection.recv()
+                        self._release(worker)
+                    except EOFError:
+                        result = RuntimeError(f"El proceso de '{name}' terminó sin devolver un resultado.")
+                        self._discard(worker)
+                    yield name, result
+
+                now = time.monotonic()
+                for connection, (name, worker, deadline) in list(running.items()):
+                    if deadline <= now:
+                        del running[connection]
+                        self._discard(worker)
+                        yield name, TimeoutError(f"'{name}' superó el límite de {timeout:g} segundos.")
+        finally:
+            # Si algo falla a mitad de camino no quedan procesos ocupados con tareas abandonadas.
+            for _, worker, _ in running.values():
+                self._discard(worker)
+
+    def shutdown(self) -> None:
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._available.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def _acquire(self, wait_time: float) -> _Worker | None:
+        # Devuelve un proceso libre o uno nuevo si hay menos de `max_workers` vivos; si no,
+        # espera hasta `wait_time` segundos a que otra solicitud libere uno y devuelve None.
+        deadline = time.monotonic() + wait_time
+        with self._available:
+            while True:
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.process.is_alive():
+                        return worker
+                    worker.connection.close()
+                    self._live -= 1
+                if self._live < self.max_workers:
+                    self._live += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._available.wait(remaining)
+        try:
+            return _Worker(self._context)
+        except BaseException:
+            with self._available:
+                self._live -= 1
+                self._available.notify()
+            raise
+
+    def _release(self, worker: _Worker) -> None:
+        with self._available:
+            self._idle.append(worker)
+            self._available.notify()
+
+    def _discard(self, worker: _Worker) -> None:
+        # Termina un proceso ocupado (cancelado o que murió) y deja su lugar a otra tarea.
+        worker.kill()
+        with self._available:
+            self._live -= 1
+            self._available.notify()
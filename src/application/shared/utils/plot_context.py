@@ -0,0 +1,83 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import BinaryIO, Callable, Iterator
+
+from src.application.shared.utils.plot_store import artifact_name, plot_store
+
+logger = logging.getLogger(__name__)
+
+_current_context: ContextVar["PlotContext | None"] = ContextVar("plot_context", default=None)
+
+
+class PlotContext:
+    """
+    Gráficas pedidas durante una solicitud, agrupadas por tipo ("function_plot", "system_plot", ...).
+
+    Servicios y vistas registran la gráfica que quieren mostrar y reciben su nombre de inmediato
+    (el nombre solo depende de los datos). Si el mismo tipo se pide varias veces, por ejemplo en
+    `validate_input` y luego en la vista, solo la última se dibuja al terminar la solicitud.
+
+    Los datos de entrada no deben modificarse después de registrarlos: se dibujan al final.
+    """
+
+    def __init__(self):
+        self._intents: dict[str, tuple[str, object, Callable[[BinaryIO], None]]] = {}
+
+    def record(self, kind: str, inputs, draw: Callable[[BinaryIO], None]) -> str:
+        self._intents[kind] = (kind, inputs, draw)
+        return artifact_name(kind, inputs)
+
+    def flush(self) -> list[str]:
+        """
+        Dibuja (o encola) la última gráfica de cada tipo y devuelve los nombres de las que se dibujaron.
+
+        Una gráfica que no se puede dibujar solo se registra en el log: la página que la muestra
+        ya está lista, y su <img> simplemente no carga.
+        """
+        intents, self._intents = self._intents, {}
+        names = []
+        for kind, inputs, draw in intents.values():
+            try:
+                names.append(plot_store.render(kind, inputs, draw))
+            except Exception:
+                logger.exception("No se pudo dibujar la gráfica '%s'.", kind)
+        return names
+
+
+def request_plot(kind: str, inputs, draw: Callable[[BinaryIO], None]) -> str:
+    """
+    Pide una gráfica: dentro de `plot_context` se registra para el final de la solicitud,
+    fuera de él se dibuja en el momento.
+
+    Args:
+        kind (str): Tipo de gráfica.
+        inputs: Datos de entrada que determinan la gráfica.
+        draw (Callable[[BinaryIO], None]): Escribe el SVG en el archivo recibido.
+
+    Returns:
+        str: Nombre del archivo SVG en el almacén de gráficas.
+    """
+    context = _current_context.get()
+    if context is None:
+        return plot_store.render(kind, inputs, draw)
+    return context.record(kind, inputs, draw)
+
+
+@contextmanager
+def plot_context(render: bool = True) -> Iterator[PlotContext]:
+    """
+    Abre un contexto de gráficas; al salir sin errores se dibuja la última gráfica de cada tipo.
+
+    Con `render=False` las gráficas solo se nombran y no se dibujan, por ejemplo al comparar
+    métodos para un reporte que solo usa sus resultados numéricos; quien abrió el contexto
+    todavía puede dibujarlas con `flush` (ver `PlotContextMiddleware`).
+    """
+    context = PlotContext()
+    token = _current_context.set(context)
+    try:
+        yield context
+        if render:
+            context.flush()
+    finally:
+        _current_context.reset(token)
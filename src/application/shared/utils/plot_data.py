@@ -0,0 +1,148 @@
+import base64
+
+import numpy as np
+from scipy.interpolate import PPoly
+
+from src.application.shared.utils.plot_function import function_curve
+from src.application.shared.utils.plot_spline import spline_curve
+from src.application.shared.utils.polyline_simplification import simplification_mask
+
+# Tamaño en píxeles del lienzo para el que se simplifican las curvas que se envían al navegador.
+CANVAS_SIZE = (600, 400)
+
+# Margen que se agrega a los datos cuando los límites se calculan solos (como matplotlib).
+AUTOSCALE_MARGIN = 0.05
+
+# Formato de los arreglos codificados: float32 little-endian.
+ARRAY_DTYPE = "<f4"
+
+
+def encode_array(values) -> str:
+    """
+    Codifica un arreglo numérico como float32 little-endian en base64.
+    """
+    return base64.b64encode(np.asarray(values, dtype=ARRAY_DTYPE).tobytes()).decode("ascii")
+
+
+def _autoscale(*series) -> list[float]:
+    values = np.concatenate([np.asarray(values, dtype=float).ravel() for values in series])
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return [-1.0, 1.0]
+    low, high = float(values.min()), float(values.max())
+    if low == high:
+        low, high = low - 1, high + 1
+    margin = (high - low) * AUTOSCALE_MARGIN
+    return [low - margin, high + margin]
+
+
+def _series(x, y, x_range, y_range, label: str | None, color: str) -> dict:
+    # Se descartan los vértices que no se distinguen en un lienzo de CANVAS_SIZE.
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    x_scale = CANVAS_SIZE[0] / (x_range[1] - x_range[0])
+    y_scale = CANVAS_SIZE[1] / (y_range[1] - y_range[0])
+    keep = simplification_mask(x * x_scale, y * y_scale)
+    return {
+        "label": label,
+        "color": color,
+        "length": int(keep.sum()),
+        "x": encode_array(x[keep]),
+        "y": encode_array(y[keep]),
+    }
+
+
+def _markers(points: list[tuple[float, float]], color: str, precision: int | None = None) -> list[dict]:
+    return [
+        {
+            "x": float(x),
+            "y": float(y),
+            "color": color,
+            "label": f"({x}, {y})" if precision is None else f"({x:.{precision}f}, {y:.{precision}f})",
+        }
+        for x, y in points
+    ]
+
+
+def _plot_data(kind: str, title: str, x_range, y_range, series: list[dict], markers: list[dict]) -> dict:
+    return {
+        "kind": kind,
+        "title": title,
+        "dtype": ARRAY_DTYPE,
+        "x_range": [float(value) for value in x_range],
+        "y_range": [float(value) for value in y_range],
+        "series": series,
+        "markers": markers,
+    }
+
+
+def function_plot_data(function_f: str, have_solution: bool, points: list[tuple[float, float]]) -> dict:
+    """
+    Datos de la gráfica de f(x), con el mismo muestreo y los mismos ejes que `plot_function`.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+        have_solution (bool): Si se encontró solución (define el rango y los marcadores).
+        points (list[tuple[float, float]]): Puntos de interés.
+
+    Returns:
+        dict: Límites de los ejes, curvas (x y y en base64) y marcadores.
+    """
+    x_vals, y_vals, x_window, y_window = function_curve(function_f, have_solution, points)
+    return _plot_data(
+        "function_plot",
+        f"f(x) = {function_f}",
+        x_window,
+        y_window,
+        [_series(x_vals, y_vals, x_window, y_window, "f(x)", "#db3f59")],
+        _markers(points, "#f7dc6f") if have_solution else [],
+    )
+
+
+def spline_linear_plot_data(points: list[tuple[float, float]]) -> dict:
+    """
+    Datos de la gráfica del spline lineal, con los mismos ejes que `plot_spline_linear`.
+    """
+    points = sorted(points)
+    x_coords = [point[0] for point in points]
+    y_coords = [point[1] for point in points]
+    x_range = (min(x_coords) - 1, max(x_coords) + 1)
+    y_range = (min(y_coords) - 1, max(y_coords) + 1)
+    return _plot_data(
+        "spline_linear_plot",
+        "Spline Lineal",
+        x_range,
+        y_range,
+        [_series(x_coords, y_coords, x_range, y_range, "Tramo 1", "#db3f59")],
+        _markers(points, "#f7dc6f", precision=1),
+    )
+
+
+def spline_plot_data(
+    kind: str, title: str, spline: PPoly, points: list[tuple[float, float]], color: str, marker_color: str
+) -> dict:
+    """
+    Datos de la gráfica de un spline ya calculado, muestreado como en `plot_spline_cubic`
+    y `plot_spline_quadratic`.
+
+    Args:
+        kind (str): Tipo de gráfica, por ejemplo "spline_cubic_plot".
+        title (str): Título de la gráfica.
+        spline (PPoly): Spline calculado por el servicio.
+        points (list[tuple[float, float]]): Puntos interpolados.
+        color (str): Color de la curva.
+        marker_color (str): Color de los puntos.
+
+    Returns:
+        dict: Límites de los ejes, la curva (x y y en base64) y los puntos.
+    """
+    x_curve, y_curve = spline_curve(spline)
+    x_range = _autoscale(x_curve, [x for x, _ in points])
+    y_range = _autoscale(y_curve, [y for _, y in points])
+    return _plot_data(
+        kind,
+        title,
+        x_range,
+        y_range,
+        [_series(x_curve, y_curve, x_range, y_range, title, color)],
+        _markers(points, marker_color, precision=1),
+    )
@@ -1,18 +1,42 @@
-import numpy as np
-from config.settings import BASE_DIR
-import matplotlib.pyplot as plt
-import math
 import textwrap
-import matplotlib
-
-matplotlib.use("Agg")
+from src.application.shared.utils.figure_pool import figure_pool
+from src.application.shared.utils.function_sampling import adaptive_sample
+from src.application.shared.utils.plot_context import request_plot
+from src.application.shared.utils.polyline_simplification import simplify_for_figure
+from src.application.shared.utils.svg_plot import SvgPlot, select_renderer
 
 
 def plot_function(
     function_f: str, have_solution: bool, points: list[tuple[float, float]]
-) -> None:
-    output_file = BASE_DIR / "static/img/numerical_method/function_plot.svg"
+) -> str:
+    """
+    Grafica f(x) y los puntos de interés, reutilizando la gráfica si ya existía.
+
+    Args:
+        function_f (str): Expresión de la función en términos de x.
+        have_solution (bool): Si se encontró solución (define el rango y los marcadores).
+        points (list[tuple[float, float]]): Puntos de interés.
+
+    Returns:
+        str: Nombre del archivo SVG en el almacén de gráficas.
+    """
+    return request_plot(
+        "function_plot",
+        (function_f, have_solution, points),
+        select_renderer(
+            lambda: _draw_function_svg(function_f, have_solution, points),
+            lambda output_file: _draw_function(function_f, have_solution, points, output_file),
+        ),
+    )
+
+
+def function_curve(function_f: str, have_solution: bool, points: list[tuple[float, float]]):
+    """
+    Calcula la curva de f(x) y los límites de los ejes con los que se grafica.
 
+    Returns:
+        tuple: (valores de x, valores de y, límites del eje x, límites del eje y).
+    """
     # Obtener los valores de x y y de los puntos para el rango de la gráfica
     x_coords = [point[0] for point in points]
     y_coords = [point[1] for point in points]
@@ -20,52 +44,69 @@ def plot_function(
     min_x, max_x = min(x_coords) - 1, max(x_coords) + 1
     min_y, max_y = min(y_coords) - 1, max(y_coords) + 1
 
-    # Generar un rango más ajustado de valores de x para la evaluación de la función
-    if not have_solution:
-        x_vals = np.linspace(-100, 100, 10000)
-    else:
-        x_vals = np.linspace(min_x - 3, max_x + 3, 10000)
-
-    # Evaluar la función de forma segura
-    y_vals = []
-    valid_x = []
-    for val in x_vals:
-        try:
-            y = eval(function_f, {"math": math, "x": val})
-            if not (np.isnan(y) or np.isinf(y)):
-                y_vals.append(y)
-                valid_x.append(val)
-        except Exception:
-            continue
-
-    # Crear la figura
-    plt.figure(figsize=(6, 4))
-
-    # Graficar la función en el rango ajustado
-    plt.plot(valid_x, y_vals, color="#db3f59", label="f(x)")
+    # Rango de evaluación de la función: amplio si no hay solución, ajustado a los puntos si la hay
+    x_window = (min_x - 3, max_x + 3)
+    y_window = (min_y - 3, max_y + 3)
+    domain = (-100, 100) if not have_solution else x_window
 
-    if have_solution:
-        for x, y in points:
-            plt.plot(x, y, marker="o", color="#f7dc6f")
-            plt.text(x, y, f"({x}, {y})", fontsize=9, verticalalignment="bottom")
+    # Muestreo adaptativo: más puntos solo donde la curva lo necesita
+    valid_x, y_vals = adaptive_sample(function_f, domain, x_window, y_window)
+    return valid_x, y_vals, x_window, y_window
+
+
+def _draw_function(
+    function_f: str, have_solution: bool, points: list[tuple[float, float]], output_file
+) -> None:
+    valid_x, y_vals, x_window, y_window = function_curve(function_f, have_solution, points)
+    valid_x, y_vals = simplify_for_figure(valid_x, y_vals, (6, 4), x_window, y_window)
 
-    # Ajustar los límites de los ejes para el recuadro de la grafica como tal
-    plt.xlim(min_x - 3, max_x + 3)
-    plt.ylim(min_y - 3, max_y + 3)
+    # Tomar una figura del conjunto del hilo
+    with figure_pool.figure((6, 4)) as figure:
+        axes = figure.add_subplot()
 
-    # Ejes y etiquetas
-    plt.axhline(y=0, color="red", linestyle="--", linewidth=1)
-    plt.axvline(x=0, color="red", linestyle="--", linewidth=1)
-    plt.xlabel("x")
-    plt.ylabel("y")
+        # Graficar la función en el rango ajustado
+        axes.plot(valid_x, y_vals, color="#db3f59", label="f(x)")
+
+        if have_solution:
+            for x, y in points:
+                axes.plot(x, y, marker="o", color="#f7dc6f")
+                axes.text(x, y, f"({x}, {y})", fontsize=9, verticalalignment="bottom")
+
+        # Ajustar los límites de los ejes para el recuadro de la grafica como tal
+        axes.set_xlim(*x_window)
+        axes.set_ylim(*y_window)
+
+        # Ejes y etiquetas
+        axes.axhline(y=0, color="red", linestyle="--", linewidth=1)
+        axes.axvline(x=0, color="red", linestyle="--", linewidth=1)
+        axes.set_xlabel("x")
+        axes.set_ylabel("y")
+
+        wrapped_title = "\n".join(textwrap.wrap(function_f, width=50))
+        axes.set_title(f"f(x) = {wrapped_title}", fontsize=10, y=1.1)
+
+        axes.grid(True)
+        axes.legend()
+        figure.tight_layout()
+
+        # Guardar la gráfica
+        figure.savefig(output_file, format="svg")
+
+
+def _draw_function_svg(function_f: str, have_solution: bool, points: list[tuple[float, float]]) -> bytes:
+    # Misma gráfica que `_draw_function`, escrita directamente en SVG.
+    valid_x, y_vals, x_window, y_window = function_curve(function_f, have_solution, points)
 
     wrapped_title = "\n".join(textwrap.wrap(function_f, width=50))
-    plt.title(f"f(x) = {wrapped_title}", fontsize=10, y=1.1)
+    plot = SvgPlot(title=f"f(x) = {wrapped_title}", xlabel="x", ylabel="y")
+    plot.xlim, plot.ylim = x_window, y_window
 
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
+    plot.plot(valid_x, y_vals, color="#db3f59", label="f(x)")
+    if have_solution:
+        for x, y in points:
+            plot.marker(x, y, color="#f7dc6f")
+            plot.text(x, y, f"({x}, {y})")
 
-    # Guardar la gráfica
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    plot.axhline(0, color="red", dashed=True)
+    plot.axvline(0, color="red", dashed=True)
+    return plot.render()
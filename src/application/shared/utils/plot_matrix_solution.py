@@ -1,9 +1,11 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from config.settings import BASE_DIR
+from src.application.shared.utils.figure_pool import figure_pool
+from src.application.shared.utils.plot_context import request_plot
+from src.application.shared.utils.polyline_simplification import simplify_for_figure
+from src.application.shared.utils.svg_plot import SvgPlot, select_renderer
 
 
-def plot_matrix_solution(iterations: dict, solution: list[float], spectral_radius: float):
+def plot_matrix_solution(iterations: dict, solution: list[float], spectral_radius: float) -> str:
     """
     Grafica las soluciones iterativas de un sistema de ecuaciones lineales (Jacobi para matrices 2x2).
 
@@ -13,39 +15,68 @@ def plot_matrix_solution(iterations: dict, solution: list[float], spectral_radiu
         spectral_radius (float): Radio espectral para mostrar en la gráfica.
 
     Returns:
-        None: Genera un archivo SVG con la gráfica.
+        str: Nombre del archivo SVG en el almacén de gráficas.
     """
-    output_file = BASE_DIR / "static/img/numerical_method/matrix_solution_plot.svg"
+    return request_plot(
+        "matrix_solution_plot",
+        (iterations, solution, spectral_radius),
+        select_renderer(
+            lambda: _draw_matrix_solution_svg(iterations, solution, spectral_radius),
+            lambda output_file: _draw_matrix_solution(iterations, solution, spectral_radius, output_file),
+        ),
+    )
+
 
+def _draw_matrix_solution_svg(iterations: dict, solution: list[float], spectral_radius: float) -> bytes:
+    # Misma gráfica que `_draw_matrix_solution`, escrita directamente en SVG.
+    x1_values = [iteration["X"][0] for iteration in iterations.values()]
+    x2_values = [iteration["X"][1] for iteration in iterations.values()]
+    iteration_numbers = list(iterations.keys())
+
+    plot = SvgPlot(
+        width=800,
+        height=600,
+        title=f"Evolución iterativa (Radio espectral: {spectral_radius:.4f})",
+        xlabel="Iteraciones",
+        ylabel="Valor de X",
+    )
+    plot.plot(iteration_numbers, x1_values, label="x1 (iterativo)", marker=True)
+    plot.plot(iteration_numbers, x2_values, label="x2 (iterativo)", marker=True)
+    plot.axhline(solution[0], color="blue", label=f"x1 solución: {solution[0]:.4f}")
+    plot.axhline(solution[1], color="green", label=f"x2 solución: {solution[1]:.4f}")
+    return plot.render()
+
+
+def _draw_matrix_solution(iterations: dict, solution: list[float], spectral_radius: float, output_file):
     # Extraer valores de iteración
     x1_values = [iteration["X"][0] for iteration in iterations.values()]
     x2_values = [iteration["X"][1] for iteration in iterations.values()]
     iteration_numbers = list(iterations.keys())
 
-    # Crear la figura
-    plt.figure(figsize=(8, 6))
+    # Tomar una figura del conjunto del hilo
+    with figure_pool.figure((8, 6)) as figure:
+        axes = figure.add_subplot()
 
-    # Graficar las soluciones x1 y x2 por iteración
-    plt.plot(iteration_numbers, x1_values, label="x1 (iterativo)", marker="o", linestyle="-")
-    plt.plot(iteration_numbers, x2_values, label="x2 (iterativo)", marker="o", linestyle="-")
+        # Graficar las soluciones x1 y x2 por iteración
+        axes.plot(iteration_numbers, x1_values, label="x1 (iterativo)", marker="o", linestyle="-")
+        axes.plot(iteration_numbers, x2_values, label="x2 (iterativo)", marker="o", linestyle="-")
 
-    # Añadir la solución final
-    plt.axhline(y=solution[0], color="blue", linestyle="-", label=f"x1 solución: {solution[0]:.4f}")
-    plt.axhline(y=solution[1], color="green", linestyle="-", label=f"x2 solución: {solution[1]:.4f}")
+        # Añadir la solución final
+        axes.axhline(y=solution[0], color="blue", linestyle="-", label=f"x1 solución: {solution[0]:.4f}")
+        axes.axhline(y=solution[1], color="green", linestyle="-", label=f"x2 solución: {solution[1]:.4f}")
 
-    # Detalles de la gráfica
-    plt.title(f"Evolución iterativa (Radio espectral: {spectral_radius:.4f})")
-    plt.xlabel("Iteraciones")
-    plt.ylabel("Valor de X")
-    plt.legend()
-    plt.grid(True)
+        # Detalles de la gráfica
+        axes.set_title(f"Evolución iterativa (Radio espectral: {spectral_radius:.4f})")
+        axes.set_xlabel("Iteraciones")
+        axes.set_ylabel("Valor de X")
+        axes.legend()
+        axes.grid(True)
 
-    # Guardar la gráfica como SVG
-    plt.savefig(output_file, format="svg")
-    plt.close()
+        # Guardar la gráfica como SVG
+        figure.savefig(output_file, format="svg")
 
 
-def plot_system_equations(A: list[list[float]], b: list[float], solution: list[float]):
+def plot_system_equations(A: list[list[float]], b: list[float], solution: list[float]) -> str:
     """
     Genera una gráfica de las ecuaciones de un sistema 2x2 y su solución.
 
@@ -55,42 +86,50 @@ def plot_system_equations(A: list[list[float]], b: list[float], solution: list[f
         solution (list[float]): Solución del sistema.
 
     Returns:
-        None: Genera un archivo SVG con la gráfica.
+        str: Nombre del archivo SVG en el almacén de gráficas.
     """
-    output_file = BASE_DIR / "static/img/numerical_method/system_plot.svg"
+    return request_plot(
+        "system_plot",
+        (A, b, solution),
+        lambda output_file: _draw_system_equations(A, b, solution, output_file),
+    )
 
+
+def _draw_system_equations(A: list[list[float]], b: list[float], solution: list[float], output_file):
     # Crear las ecuaciones como funciones de x
     x = np.linspace(-10, 10, 500)
     y1 = (b[0] - A[0][0] * x) / A[0][1]  # Primera ecuación
     y2 = (b[1] - A[1][0] * x) / A[1][1]  # Segunda ecuación
+    x1, y1 = simplify_for_figure(x, y1, (8, 6))
+    x2, y2 = simplify_for_figure(x, y2, (8, 6))
 
     # Crear la gráfica
-    plt.figure(figsize=(8, 6))
-    
-    # Graficar las ecuaciones con líneas continuas
-    plt.plot(x, y1, label="Ecuación 1", color="blue", linestyle="-", linewidth=1.5)
-    plt.plot(x, y2, label="Ecuación 2", color="green", linestyle="-", linewidth=1.5)
-    
-    # Añadir el punto de solución y su anotación
-    plt.scatter(solution[0], solution[1], color="red", label="Solución", zorder=5)
-    plt.text(
-        solution[0],
-        solution[1],
-        f"({solution[0]:.4f}, {solution[1]:.4f})",
-        fontsize=10,
-        verticalalignment="bottom",
-        horizontalalignment="right",
-    )
-
-    # Detalles de la gráfica
-    plt.title("Sistema de ecuaciones 2x2")
-    plt.xlabel("x")
-    plt.ylabel("y")
-    plt.axhline(0, color="black", linewidth=0.5)
-    plt.axvline(0, color="black", linewidth=0.5)
-    plt.grid(True)
-    plt.legend()
-
-    # Guardar la gráfica como SVG
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    with figure_pool.figure((8, 6)) as figure:
+        axes = figure.add_subplot()
+
+        # Graficar las ecuaciones con líneas continuas
+        axes.plot(x1, y1, label="Ecuación 1", color="blue", linestyle="-", linewidth=1.5)
+        axes.plot(x2, y2, label="Ecuación 2", color="green", linestyle="-", linewidth=1.5)
+
+        # Añadir el punto de solución y su anotación
+        axes.scatter(solution[0], solution[1], color="red", label="Solución", zorder=5)
+        axes.text(
+            solution[0],
+            solution[1],
+            f"({solution[0]:.4f}, {solution[1]:.4f})",
+            fontsize=10,
+            verticalalignment="bottom",
+            horizontalalignment="right",
+        )
+
+        # Detalles de la gráfica
+        axes.set_title("Sistema de ecuaciones 2x2")
+        axes.set_xlabel("x")
+        axes.set_ylabel("y")
+        axes.axhline(0, color="black", linewidth=0.5)
+        axes.axvline(0, color="black", linewidth=0.5)
+        axes.grid(True)
+        axes.legend()
+
+        # Guardar la gráfica como SVG
+        figure.savefig(output_file, format="svg")
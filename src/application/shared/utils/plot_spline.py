@@ -1,13 +1,12 @@
 import numpy as np
-from config.settings import BASE_DIR
-import matplotlib.pyplot as plt
-import matplotlib
-from scipy.interpolate import CubicSpline
+from scipy.interpolate import PPoly
+from src.application.shared.utils.figure_pool import figure_pool
+from src.application.shared.utils.plot_context import request_plot
+from src.application.shared.utils.polyline_simplification import simplify_for_figure
+from src.application.shared.utils.svg_plot import SvgPlot, select_renderer
 
-matplotlib.use("Agg")
 
-
-def plot_spline_linear(points: list[tuple[float, float]]) -> None:
+def plot_spline_linear(points: list[tuple[float, float]]) -> str:
     """
     Genera una gráfica para el spline lineal conectando los puntos dados.
 
@@ -15,124 +14,186 @@ def plot_spline_linear(points: list[tuple[float, float]]) -> None:
         points (list[tuple[float, float]]): Lista de puntos (x, y) para graficar.
 
     Returns:
-        None: Genera un archivo SVG con la gráfica.
+        str: Nombre del archivo SVG en el almacén de gráficas.
     """
-    output_file = BASE_DIR / "static/img/numerical_method/spline_linear_plot.svg"
-
-    # Crear la figura
-    plt.figure(figsize=(6, 4))
-
-    # Extraer coordenadas x e y de los puntos
+    return request_plot(
+        "spline_linear_plot",
+        points,
+        select_renderer(
+            lambda: _draw_spline_linear_svg(points),
+            lambda output_file: _draw_spline_linear(points, output_file),
+        ),
+    )
+
+
+def _draw_spline_linear_svg(points: list[tuple[float, float]]) -> bytes:
+    # Misma gráfica que `_draw_spline_linear`, escrita directamente en SVG.
     x_coords = [point[0] for point in points]
     y_coords = [point[1] for point in points]
 
-    # Graficar las líneas entre los puntos
-    for i in range(len(points) - 1):
-        plt.plot(
-            [x_coords[i], x_coords[i + 1]],
-            [y_coords[i], y_coords[i + 1]],
-            color="#db3f59",
-            label=f"Tramo {i + 1}" if i == 0 else "",
-        )
+    plot = SvgPlot(title="Spline Lineal", xlabel="x", ylabel="y")
+    plot.xlim = (min(x_coords) - 1, max(x_coords) + 1)
+    plot.ylim = (min(y_coords) - 1, max(y_coords) + 1)
 
-    # Graficar los puntos individuales
+    plot.plot(x_coords, y_coords, color="#db3f59", label="Tramo 1" if len(points) > 1 else None)
     for x, y in points:
-        plt.plot(x, y, marker="o", color="#f7dc6f")
-        plt.text(x, y, f"({x:.1f}, {y:.1f})", fontsize=9, verticalalignment="bottom")
-
-    # Ajustar los límites de los ejes
-    min_x, max_x = min(x_coords) - 1, max(x_coords) + 1
-    min_y, max_y = min(y_coords) - 1, max(y_coords) + 1
-    plt.xlim(min_x, max_x)
-    plt.ylim(min_y, max_y)
-
-    # Ejes y etiquetas
-    plt.axhline(y=0, color="red", linestyle="--", linewidth=1)
-    plt.axvline(x=0, color="red", linestyle="--", linewidth=1)
-    plt.xlabel("x")
-    plt.ylabel("y")
-
-    plt.title("Spline Lineal", fontsize=12)
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-
-    # Guardar la gráfica
-    plt.savefig(output_file, format="svg")
-    plt.close()
+        plot.marker(x, y, color="#f7dc6f")
+        plot.text(x, y, f"({x:.1f}, {y:.1f})")
+
+    plot.axhline(0, color="red", dashed=True)
+    plot.axvline(0, color="red", dashed=True)
+    return plot.render()
+
+
+def _draw_spline_linear(points: list[tuple[float, float]], output_file) -> None:
+    # Tomar una figura del conjunto del hilo
+    with figure_pool.figure((6, 4)) as figure:
+        axes = figure.add_subplot()
+
+        # Extraer coordenadas x e y de los puntos
+        x_coords = [point[0] for point in points]
+        y_coords = [point[1] for point in points]
+
+        # Graficar las líneas entre los puntos
+        for i in range(len(points) - 1):
+            axes.plot(
+                [x_coords[i], x_coords[i + 1]],
+                [y_coords[i], y_coords[i + 1]],
+                color="#db3f59",
+                label=f"Tramo {i + 1}" if i == 0 else "",
+            )
+
+        # Graficar los puntos individuales
+        for x, y in points:
+            axes.plot(x, y, marker="o", color="#f7dc6f")
+            axes.text(x, y, f"({x:.1f}, {y:.1f})", fontsize=9, verticalalignment="bottom")
+
+        # Ajustar los límites de los ejes
+        min_x, max_x = min(x_coords) - 1, max(x_coords) + 1
+        min_y, max_y = min(y_coords) - 1, max(y_coords) + 1
+        axes.set_xlim(min_x, max_x)
+        axes.set_ylim(min_y, max_y)
+
+        # Ejes y etiquetas
+        axes.axhline(y=0, color="red", linestyle="--", linewidth=1)
+        axes.axvline(x=0, color="red", linestyle="--", linewidth=1)
+        axes.set_xlabel("x")
+        axes.set_ylabel("y")
+
+        axes.set_title("Spline Lineal", fontsize=12)
+        axes.grid(True)
+        axes.legend()
+        figure.tight_layout()
+
+        # Guardar la gráfica
+        figure.savefig(output_file, format="svg")
+
+
+def plot_spline_cubic(title: str, points: list[tuple[float, float]], spline: PPoly) -> str:
+    """
+    Grafica un spline cúbico ya calculado y los puntos que interpola.
 
+    Args:
+        title (str): Título de la gráfica.
+        points (list[tuple[float, float]]): Puntos (x, y) interpolados.
+        spline (PPoly): Spline calculado por el servicio (por ejemplo un `CubicSpline`).
 
-def plot_spline_cubic(title: str, points: list[tuple[float, float]], x_values, y_values):
-    output_file = BASE_DIR / "static/img/numerical_method/spline_cubic_plot.svg"
+    Returns:
+        str: Nombre del archivo SVG en el almacén de gráficas.
+    """
+    return request_plot(
+        "spline_cubic_plot",
+        (title, points, spline.x, spline.c),
+        lambda output_file: _draw_spline_cubic(title, points, spline, output_file),
+    )
+
+
+def _draw_spline_cubic(title: str, points: list[tuple[float, float]], spline: PPoly, output_file):
+    with figure_pool.figure((8, 6)) as figure:
+        axes = figure.add_subplot()
+
+        x_range, y_range = spline_curve(spline)
+        x_range, y_range = simplify_for_figure(x_range, y_range, (8, 6))
+
+        # Graficar el spline cúbico
+        axes.plot(x_range, y_range, label="Spline Cúbico", color="blue")
+
+        # Graficar los puntos originales y etiquetarlos
+        for x, y in points:
+            axes.scatter(x, y, color="red")
+            axes.text(
+                x,
+                y,
+                f"({x:.1f}, {y:.1f})",
+                fontsize=9,
+                verticalalignment="bottom",
+                horizontalalignment="right",
+                color="black",
+            )
+
+        # Configuración de la gráfica
+        axes.set_title(title)
+        axes.set_xlabel("x")
+        axes.set_ylabel("y")
+        axes.axhline(0, color="black", linewidth=0.5, linestyle="--")
+        axes.axvline(0, color="black", linewidth=0.5, linestyle="--")
+        axes.legend()
+        axes.grid(True)
+
+        # Guardar la gráfica
+        figure.savefig(output_file, format="svg")
+
+
+def plot_spline_quadratic(title: str, points: list[tuple[float, float]], spline: PPoly) -> str:
+    """
+    Grafica un spline cuadrático ya calculado y los puntos que interpola.
 
-    plt.figure(figsize=(8, 6))
+    Args:
+        title (str): Título de la gráfica.
+        points (list[tuple[float, float]]): Puntos (x, y) interpolados.
+        spline (PPoly): Spline con los coeficientes que calculó el servicio.
 
-    # Crear el spline cúbico con scipy
-    cs = CubicSpline(x_values, y_values, bc_type="natural")
+    Returns:
+        str: Nombre del archivo SVG en el almacén de gráficas.
+    """
+    return request_plot(
+        "spline_quadratic_plot",
+        (title, points, spline.x, spline.c),
+        lambda output_file: _draw_spline_quadratic(title, points, spline, output_file),
+    )
+
+
+def _draw_spline_quadratic(title: str, points: list[tuple[float, float]], spline: PPoly, output_file):
+    with figure_pool.figure((8, 6)) as figure:
+        axes = figure.add_subplot()
+        x_range, y_range = spline_curve(spline)
+        x_range, y_range = simplify_for_figure(x_range, y_range, (8, 6))
+        axes.plot(x_range, y_range, color="#8e44ad", linewidth=2)
+        for x, y in points:
+            axes.scatter(x, y, color="#f7dc6f", zorder=5)
+            axes.text(x, y, f"({x:.1f}, {y:.1f})", fontsize=9, verticalalignment="bottom")
+        axes.set_title(title)
+        axes.set_xlabel("x")
+        axes.set_ylabel("y")
+        axes.axhline(0, color="black", linewidth=0.5, linestyle="--")
+        axes.axvline(0, color="black", linewidth=0.5, linestyle="--")
+        axes.grid(True)
+        figure.tight_layout()
+        figure.savefig(output_file, format="svg")
+
+
+def spline_curve(spline: PPoly, samples: int = 500) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Muestrea un spline en todo su rango evaluando todos los tramos en una sola llamada.
 
-    # Generar un rango continuo de x para graficar el spline cúbico
-    x_range = np.linspace(min(x_values), max(x_values), 500)
-    y_range = cs(x_range)
+    Los nodos se incluyen en la muestra, así la curva pasa exactamente por los puntos.
 
-    # Graficar el spline cúbico
-    plt.plot(x_range, y_range, label="Spline Cúbico", color="blue")
+    Args:
+        spline (PPoly): Polinomio por tramos calculado por el servicio.
+        samples (int): Número de valores de x uniformes entre los extremos.
 
-    # Graficar los puntos originales y etiquetarlos
-    for x, y in points:
-        plt.scatter(x, y, color="red")
-        plt.text(
-            x,
-            y,
-            f"({x:.1f}, {y:.1f})",
-            fontsize=9,
-            verticalalignment="bottom",
-            horizontalalignment="right",
-            color="black",
-        )
-
-    # Configuración de la gráfica
-    plt.title(title)
-    plt.xlabel("x")
-    plt.ylabel("y")
-    plt.axhline(0, color="black", linewidth=0.5, linestyle="--")
-    plt.axvline(0, color="black", linewidth=0.5, linestyle="--")
-    plt.legend()
-    plt.grid(True)
-
-    # Guardar la gráfica
-    plt.savefig(output_file, format="svg")
-    plt.close()
-
-
-def plot_spline_quadratic(title: str, points: list[tuple[float, float]], x_values, y_values):
-    import matplotlib.pyplot as plt
-
-    output_file = BASE_DIR / "static/img/numerical_method/spline_quadratic_plot.svg"
-    plt.figure(figsize=(8, 6))
-    x_sorted = np.array(sorted(x_values))
-    n = len(x_sorted)
-    # Calcular los tramos cuadráticos
-    for i in range(n - 1):
-        xi, xi1 = x_sorted[i], x_sorted[i + 1]
-        yi, yi1 = y_values[i], y_values[i + 1]
-        # Interpolación cuadrática simple por tramos (para visualización)
-        x_tramo = np.linspace(xi, xi1, 100)
-        # Ajuste cuadrático usando los 3 puntos más cercanos
-        idxs = [max(0, i - 1), i, min(n - 1, i + 1)]
-        px = [x_sorted[j] for j in idxs]
-        py = [y_values[j] for j in idxs]
-        coef = np.polyfit(px, py, 2)
-        y_tramo = np.polyval(coef, x_tramo)
-        plt.plot(x_tramo, y_tramo, color="#8e44ad", linewidth=2)
-    for x, y in points:
-        plt.scatter(x, y, color="#f7dc6f", zorder=5)
-        plt.text(x, y, f"({x:.1f}, {y:.1f})", fontsize=9, verticalalignment="bottom")
-    plt.title(title)
-    plt.xlabel("x")
-    plt.ylabel("y")
-    plt.axhline(0, color="black", linewidth=0.5, linestyle="--")
-    plt.axvline(0, color="black", linewidth=0.5, linestyle="--")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Valores de x y el spline evaluado en ellos.
+    """
+    x_range = np.union1d(np.linspace(spline.x[0], spline.x[-1], samples), spline.x)
+    return x_range, spline(x_range)
@@ -0,0 +1,281 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+import numpy as np
+
+from config.settings import (
+    PLOT_BACKGROUND_RENDERING,
+    PLOT_RENDER_CACHE_MAX_BYTES,
+    PLOT_RENDER_WAIT,
+    PLOT_RENDERER,
+    PLOT_SIMPLIFY_TOLERANCE,
+    PLOT_STORE_DIR,
+    PLOT_STORE_MAX_AGE,
+    PLOT_STORE_MAX_BYTES,
+)
+from src.application.shared.utils.render_cache import RenderCache
+
+# Se incluye en el hash de cada gráfica (junto con PLOT_RENDERER y PLOT_SIMPLIFY_TOLERANCE);
+# cambiarlo cuando cambie la forma de dibujar para que no se reutilicen archivos generados por la
+# versión anterior.
+RENDER_VERSION = 4
+
+# Segundos mínimos entre dos barridos de limpieza del almacén en un mismo proceso.
+EVICTION_INTERVAL = 60
+
+# Cada cuántos segundos se revisa el disco mientras se espera una gráfica que dibuja otro proceso.
+POLL_INTERVAL = 0.05
+
+# Hilos que dibujan en segundo plano. Cada hilo usa sus propias figuras de `figure_pool`, así que
+# pueden dibujar varias gráficas a la vez.
+RENDER_WORKERS = 4
+
+ARTIFACT_PATTERN = re.compile(r"^[a-z_]+_[0-9a-f]{32}\.svg$")
+
+
+def _normalize(value):
+    # Convierte los datos de entrada en tipos de JSON para calcular un hash estable.
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def artifact_name(kind: str, inputs) -> str:
+    """
+    Calcula el nombre de la gráfica a partir de su tipo y de todos los datos que la determinan.
+
+    Args:
+        kind (str): Tipo de gráfica, por ejemplo "function_plot".
+        inputs: Datos de entrada de la gráfica (función, puntos, banderas, ...).
+
+    Returns:
+        str: Nombre del archivo, por ejemplo "function_plot_<hash>.svg".
+    """
+    payload = json.dumps(
+        [RENDER_VERSION, PLOT_RENDERER, PLOT_SIMPLIFY_TOLERANCE, kind, _normalize(inputs)], sort_keys=True, default=repr
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+    return f"{kind}_{digest}.svg"
+
+
+class PlotStore:
+    """
+    Almacén de gráficas SVG direccionado por contenido.
+
+    Cada gráfica se escribe en un archivo cuyo nombre es el hash de sus datos de entrada, así
+    dos solicitudes simultáneas nunca se pisan y una gráfica idéntica se reutiliza sin volver a
+    dibujarla. Los archivos más viejos que `max_age` segundos se eliminan, y si el almacén supera
+    `max_bytes` se borran los usados hace más tiempo.
+
+    Delante del disco hay una `RenderCache` en memoria con el contenido de las gráficas
+    recientes: una gráfica repetida no toca matplotlib ni el sistema de archivos.
+
+    Con `executor`, las gráficas nuevas se dibujan en segundo plano: `render` devuelve el nombre
+    de inmediato y `read` espera hasta `wait_timeout` segundos a que la gráfica esté lista.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int,
+        max_age: int,
+        render_cache: RenderCache | None = None,
+        executor: ThreadPoolExecutor | None = None,
+        wait_timeout: float = 0.0,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.render_cache = render_cache if render_cache is not None else RenderCache(0)
+        self.executor = executor
+        self.wait_timeout = wait_timeout
+        self.renders = 0
+        self._pending: dict[str, Future] = {}
+        self._last_eviction = 0.0
+        self._lock = threading.Lock()
+
+    def render(self, kind: str, inputs, draw: Callable[[BinaryIO], None]) -> str:
+        """
+        Devuelve el nombre de la gráfica, dibujándola con `draw` solo si no estaba guardada.
+
+        Si hay `executor`, el dibujo se encola y el nombre se devuelve sin esperar; dos pedidos
+        de la misma gráfica mientras se dibuja comparten el mismo trabajo.
+
+        Args:
+            kind (str): Tipo de gráfica.
+            inputs: Datos de entrada que determinan la gráfica.
+            draw (Callable[[BinaryIO], None]): Escribe el SVG en el archivo recibido.
+
+        Returns:
+            str: Nombre del archivo SVG dentro del almacén.
+        """
+        name = artifact_name(kind, inputs)
+        path = self.directory / name
+        try:
+            # Actualiza la fecha de uso para que la limpieza conserve las gráficas recientes.
+            os.utime(path)
+            return name
+        except FileNotFoundError:
+            pass
+
+        content = self.render_cache.get(name)
+        if content is not None:
+            # La gráfica estaba en memoria pero no en disco: se escribe para que otros
+            # procesos puedan servirla.
+            self._write(path, content)
+            return name
+
+        if self.executor is None:
+            self._draw(name, draw)
+            return name
+
+        with self._lock:
+            future = self._pending.get(name)
+            submitted = future is None
+            if submitted:
+                # La marca le indica a otros procesos que la gráfica está en camino.
+                self._pending_marker(name).parent.mkdir(parents=True, exist_ok=True)
+                self._pending_marker(name).touch()
+                future = self.executor.submit(self._draw, name, draw)
+                self._pending[name] = future
+        if submitted:
+            # Fuera del candado: si el trabajo ya terminó, el callback se ejecuta aquí mismo.
+            future.add_done_callback(lambda _: self._forget(name))
+        return name
+
+    def _draw(self, name: str, draw: Callable[[BinaryIO], None]) -> None:
+        try:
+            output = BytesIO()
+            draw(output)
+            content = output.getvalue()
+            with self._lock:
+                self.renders += 1
+            self._write(self.directory / name, content)
+            self.render_cache.put(name, content)
+        finally:
+            self._pending_marker(name).unlink(missing_ok=True)
+        self.evict()
+
+    def _pending_marker(self, name: str) -> Path:
+        return self.directory / f"{name}.pending"
+
+    def _forget(self, name: str) -> None:
+        with self._lock:
+            self._pending.pop(name, None)
+
+    def read(self, name: str) -> bytes | None:
+        """
+        Devuelve el contenido SVG de una gráfica, desde memoria si está allí o desde el disco.
+
+        Si la gráfica todavía se está dibujando (en este proceso o en otro) espera hasta
+        `wait_timeout` segundos. Devuelve None si no existe o si no se pudo dibujar.
+        """
+        if not ARTIFACT_PATTERN.match(name):
+            return None
+        content = self.render_cache.get(name)
+        if content is not None:
+            return content
+
+        with self._lock:
+            future = self._pending.get(name)
+        if future is not None:
+            try:
+                future.result(timeout=self.wait_timeout)
+            except Exception:
+                return None
+            content = self.render_cache.get(name)
+            if content is not None:
+                return content
+
+        # Solo se espera si otro proceso dejó la marca de que la está dibujando.
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            try:
+                content = (self.directory / name).read_bytes()
+                break
+            except FileNotFoundError:
+                if not self._pending_marker(name).exists() or time.monotonic() >= deadline:
+                    return None
+                time.sleep(POLL_INTERVAL)
+        self.render_cache.put(name, content)
+        return content
+
+    def stats(self) -> dict:
+        """
+        Devuelve las estadísticas de la caché en memoria y cuántas gráficas se dibujaron.
+        """
+        with self._lock:
+            renders = self.renders
+        return self.render_cache.stats() | {"renders": renders}
+
+    def evict(self, force: bool = False) -> None:
+        """
+        Elimina las gráficas vencidas y, si hace falta, las menos usadas hasta respetar `max_bytes`.
+        """
+        now = time.time()
+        with self._lock:
+            if not force and now - self._last_eviction < EVICTION_INTERVAL:
+                return
+            self._last_eviction = now
+
+        # Marcas de trabajos que nunca terminaron (por ejemplo, un proceso que se reinició).
+        for marker in self.directory.glob("*.pending"):
+            try:
+                if now - marker.stat().st_mtime > self.max_age:
+                    marker.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+        files = []
+        for path in self.directory.glob("*.svg"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+            else:
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def _write(self, path: Path, content: bytes) -> None:
+        # Se escribe en un archivo temporal y se renombra, así nadie lee un SVG a medio escribir.
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as temporary:
+            temporary.write(content)
+        os.replace(temporary.name, path)
+
+
+plot_store = PlotStore(
+    PLOT_STORE_DIR,
+    PLOT_STORE_MAX_BYTES,
+    PLOT_STORE_MAX_AGE,
+    render_cache=RenderCache(PLOT_RENDER_CACHE_MAX_BYTES),
+    executor=(
+        ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="plot-render")
+        if PLOT_BACKGROUND_RENDERING
+        else None
+    ),
+    wait_timeout=PLOT_RENDER_WAIT,
+)
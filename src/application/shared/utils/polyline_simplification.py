@@ -0,0 +1,143 @@
+import threading
+
+import numpy as np
+
+from config.settings import PLOT_SIMPLIFY_TOLERANCE
+
+# Puntos por pulgada con los que matplotlib escribe los SVG: 1 pulgada de la figura son 72 unidades.
+SVG_DPI = 72
+
+
+class SimplificationStats:
+    """
+    Contadores de vértices antes y después de simplificar las curvas, compartidos por el proceso.
+    """
+
+    def __init__(self):
+        self.curves = 0
+        self.vertices_in = 0
+        self.vertices_out = 0
+        self._lock = threading.Lock()
+
+    def record(self, vertices_in: int, vertices_out: int) -> None:
+        with self._lock:
+            self.curves += 1
+            self.vertices_in += vertices_in
+            self.vertices_out += vertices_out
+
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores y la fracción de vértices eliminados.
+        """
+        with self._lock:
+            return {
+                "curves": self.curves,
+                "vertices_in": self.vertices_in,
+                "vertices_out": self.vertices_out,
+                "reduction": 1 - self.vertices_out / self.vertices_in if self.vertices_in else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.curves = 0
+            self.vertices_in = 0
+            self.vertices_out = 0
+
+
+simplification_stats = SimplificationStats()
+
+
+def _douglas_peucker(px: np.ndarray, py: np.ndarray, tolerance: float) -> np.ndarray:
+    # Ramer-Douglas-Peucker iterativo: conserva el punto más lejano del segmento entre los extremos
+    # de cada tramo mientras esa distancia supere la tolerancia.
+    keep = np.zeros(len(px), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(px) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dx, dy = px[end] - px[start], py[end] - py[start]
+        offset_x, offset_y = px[start + 1 : end] - px[start], py[start + 1 : end] - py[start]
+        # Distancia al segmento (no a la recta), para no perder curvas que se devuelven.
+        length_squared = dx * dx + dy * dy
+        t = np.clip((offset_x * dx + offset_y * dy) / length_squared, 0, 1) if length_squared else 0.0
+        distance = np.hypot(offset_x - t * dx, offset_y - t * dy)
+        farthest = int(np.argmax(distance))
+        if distance[farthest] > tolerance:
+            index = start + 1 + farthest
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return keep
+
+
+def simplification_mask(px, py, tolerance: float = PLOT_SIMPLIFY_TOLERANCE) -> np.ndarray:
+    """
+    Calcula qué vértices de una curva, en coordenadas de pantalla, hay que conservar.
+
+    Los puntos no finitos cortan la curva en tramos; cada tramo se simplifica por separado y los
+    cortes se conservan. Registra la reducción en `simplification_stats`.
+
+    Args:
+        px (np.ndarray): Coordenadas x en píxeles.
+        py (np.ndarray): Coordenadas y en píxeles.
+        tolerance (float): Distancia máxima en píxeles entre la curva original y la simplificada.
+
+    Returns:
+        np.ndarray: Máscara booleana con los vértices que se conservan.
+    """
+    px, py = np.asarray(px, dtype=float), np.asarray(py, dtype=float)
+    finite = np.isfinite(px) & np.isfinite(py)
+    if tolerance <= 0:
+        return np.ones(len(px), dtype=bool)
+
+    keep = ~finite
+    # Límites de cada tramo de puntos finitos consecutivos.
+    edges = np.diff(np.concatenate(([0], finite.astype(np.int8), [0])))
+    for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        keep[start:end] = _douglas_peucker(px[start:end], py[start:end], tolerance)
+
+    simplification_stats.record(int(finite.sum()), int((keep & finite).sum()))
+    return keep
+
+
+def simplify_for_figure(
+    x,
+    y,
+    figsize: tuple[float, float],
+    xlim: tuple[float, float] | None = None,
+    ylim: tuple[float, float] | None = None,
+    tolerance: float = PLOT_SIMPLIFY_TOLERANCE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simplifica una curva que se va a graficar con matplotlib en una figura de tamaño `figsize`.
+
+    La escala en píxeles se estima con la figura completa y, si no se dan, con los límites de
+    los propios datos; los ejes reales son más pequeños, así que el error queda por debajo de
+    la tolerancia.
+
+    Args:
+        x: Valores de x de la curva.
+        y: Valores de y de la curva.
+        figsize (tuple[float, float]): Tamaño de la figura en pulgadas.
+        xlim (tuple[float, float] | None): Límites del eje x, si están fijos.
+        ylim (tuple[float, float] | None): Límites del eje y, si están fijos.
+        tolerance (float): Distancia máxima en píxeles entre la curva original y la simplificada.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Valores de x y y simplificados.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.any():
+        return x, y
+
+    xlim = xlim or (x[finite].min(), x[finite].max())
+    ylim = ylim or (y[finite].min(), y[finite].max())
+    # Un rango nulo (recta horizontal o vertical) no aporta escala en ese eje.
+    x_scale = figsize[0] * SVG_DPI / (xlim[1] - xlim[0]) if xlim[1] > xlim[0] else 1.0
+    y_scale = figsize[1] * SVG_DPI / (ylim[1] - ylim[0]) if ylim[1] > ylim[0] else 1.0
+
+    keep = simplification_mask(x * x_scale, y * y_scale, tolerance)
+    return x[keep], y[keep]
@@ -0,0 +1,79 @@
+import threading
+
+import numpy as np
+
+# Métodos iterativos cuyo radio espectral sabe calcular PreparedSystem.
+JACOBI = "jacobi"
+GAUSS_SEIDEL = "gauss_seidel"
+SOR = "sor"
+
+
+class PreparedSystem:
+    """
+    Sistema Ax = b ya convertido a NumPy, con la descomposición A = D + L + U que comparten
+    Jacobi, Gauss-Seidel y SOR.
+
+    Se construye una vez y se pasa a los tres servicios (por ejemplo, en la comparación de
+    métodos), así la conversión, la descomposición y el inverso de la diagonal no se repiten. Los
+    valores propios de cada matriz de iteración se calculan la primera vez que se piden y quedan
+    guardados.
+    """
+
+    def __init__(self, A: list[list[float]], b: list[float]):
+        self.A = np.array(A)
+        self.b = np.array(b)
+        self.n = len(self.b)
+        self.diagonal = np.diag(self.A)
+        self.D = np.diag(self.diagonal)
+        # Partes estrictamente triangulares de A (con su signo, A = D + lower + upper).
+        self.lower = np.tril(self.A, -1)
+        self.upper = np.triu(self.A, 1)
+        self.off_diagonal = self.lower + self.upper
+        # D es diagonal: su inversa es 1/d en la diagonal, sin invertir una matriz completa.
+        self.diagonal_inverse = 1 / self.diagonal
+        self._eigenvalues = {}
+        self._lock = threading.Lock()
+
+    def eigenvalues(self, method: str, relaxation_factor: float | None = None) -> np.ndarray:
+        """
+        Valores propios de la matriz de iteración de `method`; se calculan una sola vez.
+
+        Args:
+            method (str): JACOBI, GAUSS_SEIDEL o SOR.
+            relaxation_factor (float | None): Factor de relajación (solo para SOR).
+
+        Returns:
+            np.ndarray: Valores propios (complejos en general).
+        """
+        key = (method, relaxation_factor)
+        with self._lock:
+            if key in self._eigenvalues:
+                return self._eigenvalues[key]
+        values = np.linalg.eigvals(self._iteration_matrix(method, relaxation_factor))
+        with self._lock:
+            return self._eigenvalues.setdefault(key, values)
+
+    def spectral_radius(self, method: str, relaxation_factor: float | None = None) -> float:
+        """
+        Radio espectral (máximo valor absoluto de los valores propios) de la matriz de iteración de `method`.
+        """
+        return max(abs(self.eigenvalues(method, relaxation_factor)))
+
+    def is_tridiagonal(self) -> bool:
+        """
+        Indica si A es tridiagonal (y por lo tanto consistentemente ordenada).
+        """
+        return not np.any(np.triu(self.A, 2)) and not np.any(np.tril(self.A, -2))
+
+    def _iteration_matrix(self, method: str, relaxation_factor: float | None) -> np.ndarray:
+        if method == JACOBI:
+            return np.diag(self.diagonal_inverse).dot(self.off_diagonal)
+        if method == GAUSS_SEIDEL:
+            return np.linalg.inv(self.D - self.lower).dot(self.upper)
+        if method == SOR:
+            # SOR usa la convención A = D - L - U.
+            L, U = -self.lower, -self.upper
+            return np.linalg.inv(self.D - relaxation_factor * L).dot(
+                (1 - relaxation_factor) * self.D + relaxation_factor * U
+            )
+        raise ValueError(f"Método no válido: '{method}'")
@@ -0,0 +1,65 @@
+import threading
+from collections import OrderedDict
+
+
+class RenderCache:
+    """
+    Caché LRU en memoria del contenido SVG de las gráficas, limitada por tamaño en bytes.
+
+    La llave es el nombre de la gráfica en el almacén, que ya depende de todos sus datos de
+    entrada, así que una gráfica repetida se entrega sin pasar por matplotlib ni por el disco.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            content = self._entries.get(name)
+            if content is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+            return content
+
+    def put(self, name: str, content: bytes) -> None:
+        # Una gráfica más grande que toda la caché no se guarda.
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(name, None)
+            if previous is not None:
+                self.size_bytes -= len(previous)
+            self._entries[name] = content
+            self.size_bytes += len(content)
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores de uso y la tasa de aciertos de la caché.
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,221 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Marca de "no está en caché", para poder guardar valores como None.
+_MISSING = object()
+
+
+def _normalize(value):
+    # Los números se comparan como float, así 1 y 1.0 comparten llave.
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return repr(value)
+
+
+def cache_key(*parts) -> str:
+    """
+    Calcula una llave estable a partir de datos de entrada (diccionarios, listas, números y textos).
+    """
+    payload = json.dumps(_normalize(parts), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Caché en memoria de resultados costosos, con vencimiento (TTL) y desalojo LRU.
+
+    Si llegan varias solicitudes con la misma llave mientras el resultado se calcula, solo la
+    primera lo calcula y las demás esperan su resultado ("single flight"). Si el cálculo falla o
+    se abandona, no se guarda nada y cada solicitud en espera vuelve a intentarlo. Una solicitud
+    que espera más de `wait_timeout` segundos deja de esperar y calcula el resultado ella misma,
+    sin guardarlo (la primera lo guardará cuando termine).
+
+    Con `max_entries` en 0 no se guarda nada, pero las solicitudes simultáneas siguen compartiendo
+    el cálculo. La caché es de cada proceso.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, wait_timeout: float | None = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.fallbacks = 0
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        """
+        Devuelve el resultado guardado con `key`, o lo calcula con `compute` y lo guarda.
+
+        Args:
+            key (str): Llave del resultado, por ejemplo la que devuelve `cache_key`.
+            compute (Callable[[], T]): Calcula el resultado.
+
+        Returns:
+            T: El resultado. Es el mismo objeto para todas las solicitudes, así que no debe modificarse.
+        """
+        while True:
+            state, value = self._claim(key)
+            if state == "hit":
+                return value
+            if state == "wait":
+                outcome, result = self._wait(value)
+                if outcome == "done":
+                    return result
+                if outcome == "retry":
+                    continue
+                return compute()
+            try:
+                result = compute()
+            except BaseException as e:
+                self._fail(key, value, e)
+                raise
+            self._finish(key, value, result)
+            return result
+
+    def stream(
+        self,
+        key: str,
+        produce: Callable[[], Iterable[T]],
+        cacheable: Callable[[list[T]], bool] | None = None,
+    ) -> Iterator[T]:
+        """
+        Como `get_or_compute`, pero entrega los elementos de `produce()` a medida que se generan.
+
+        La lista completa se guarda cuando el generador termina. Quienes piden la misma llave
+        mientras tanto reciben todos los elementos de una vez al final, o, si esperan más de
+        `wait_timeout` segundos, los generan ellos mismos. Si el consumidor abandona el generador
+        antes de terminar, no se guarda nada y quienes esperaban vuelven a intentarlo de inmediato.
+
+        Args:
+            key (str): Llave del resultado.
+            produce (Callable[[], Iterable[T]]): Genera los elementos del resultado.
+            cacheable (Callable[[list[T]], bool] | None): Indica si la lista completa se puede
+                guardar. Si devuelve False, quienes esperaban la reciben igual, pero la próxima
+                solicitud vuelve a generarla.
+
+        Yields:
+            T: Cada elemento, en el orden en que `produce` los generó.
+        """
+        while True:
+            state, value = self._claim(key)
+            if state == "hit":
+                yield from value
+                return
+            if state == "wait":
+                outcome, items = self._wait(value)
+                if outcome == "retry":
+                    continue
+                yield from items if outcome == "done" else produce()
+                return
+            items = []
+            try:
+                for item in produce():
+                    items.append(item)
+                    yield item
+            except GeneratorExit:
+                # El consumidor cerró el generador (por ejemplo, el cliente se desconectó).
+                self._cancel(key, value)
+                raise
+            except BaseException as e:
+                self._fail(key, value, e)
+                raise
+            self._finish(key, value, items, store=cacheable is None or cacheable(items))
+            return
+
+    def _wait(self, future: Future) -> tuple[str, object]:
+        # Espera el cálculo de otra solicitud. Devuelve ("done", resultado), ("retry", None) si
+        # ese cálculo falló o se abandonó, o ("fallback", None) si se agotó `wait_timeout`.
+        try:
+            return "done", future.result(timeout=self.wait_timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self.fallbacks += 1
+            return "fallback", None
+        except (CancelledError, Exception):
+            return "retry", None
+
+    def _claim(self, key: str) -> tuple[str, object]:
+        # Devuelve ("hit", valor), ("wait", future de otro cálculo) o ("lead", future propio).
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires, value = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return "hit", value
+                del self._entries[key]
+            future = self._pending.get(key)
+            if future is not None:
+                self.shared += 1
+                return "wait", future
+            self.misses += 1
+            future = Future()
+            self._pending[key] = future
+            return "lead", future
+
+    def _finish(self, key: str, future: Future, value, store: bool = True) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+            if store and self.max_entries > 0:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+
+    def _fail(self, key: str, future: Future, error: BaseException) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+        # Quienes esperaban vuelven a intentarlo (ver `get_or_compute`).
+        if isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            future.cancel()
+
+    def _cancel(self, key: str, future: Future) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+        # Quienes esperaban vuelven a intentarlo de inmediato (ver `_wait`).
+        future.cancel()
+
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores de uso de la caché.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared": self.shared,
+                "fallbacks": self.fallbacks,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "wait_timeout": self.wait_timeout,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.shared = 0
+            self.fallbacks = 0
@@ -0,0 +1,265 @@
+import math
+from typing import BinaryIO, Callable
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from config.settings import PLOT_RENDERER
+from src.application.shared.utils.polyline_simplification import simplification_mask
+
+# Colores por defecto de matplotlib (ciclo "tab10") y de la cuadrícula, para que las gráficas
+# nativas se vean como las de matplotlib.
+DEFAULT_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"]
+GRID_COLOR = "#b0b0b0"
+
+# Márgenes del área de dibujo en píxeles: izquierda, derecha, arriba, abajo.
+MARGINS = (64, 16, 48, 48)
+
+# Número aproximado de marcas por eje.
+TARGET_TICKS = 7
+
+# Margen que se agrega a los datos cuando los límites se calculan solos (como matplotlib).
+AUTOSCALE_MARGIN = 0.05
+
+COLORS = {"red": "#ff0000", "blue": "#0000ff", "green": "#008000", "black": "#000000"}
+
+
+def _color(color: str) -> str:
+    return COLORS.get(color, color)
+
+
+def _nice_ticks(low: float, high: float) -> np.ndarray:
+    # Paso "redondo" (1, 2, 2.5 o 5 por una potencia de 10) con unas TARGET_TICKS marcas.
+    raw_step = (high - low) / TARGET_TICKS
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(f * magnitude for f in (1, 2, 2.5, 5, 10) if f * magnitude >= raw_step)
+    first = math.ceil(low / step) * step
+    ticks = np.arange(first, high + step * 1e-9, step)
+    return np.round(ticks / step) * step
+
+
+def _format_tick(value: float, step: float) -> str:
+    decimals = max(0, -math.floor(math.log10(step)))
+    if not math.isclose(round(step, decimals), step, rel_tol=1e-9):
+        decimals += 1
+    text = f"{value:.{decimals}f}"
+    if float(text) == 0:
+        text = f"{0:.{decimals}f}"
+    return text.replace("-", "−")
+
+
+class SvgPlot:
+    """
+    Gráfica de líneas sencilla escrita directamente en SVG, sin matplotlib.
+
+    Cubre lo que usan las gráficas de la aplicación: curvas, líneas horizontales y verticales,
+    marcadores, textos, cuadrícula, título, etiquetas de los ejes y leyenda. Los límites de los
+    ejes se pueden fijar o se calculan a partir de los datos.
+    """
+
+    def __init__(self, width: int = 600, height: int = 400, title: str = "", xlabel: str = "", ylabel: str = ""):
+        self.width = width
+        self.height = height
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.xlim = None
+        self.ylim = None
+        self._lines = []
+        self._hlines = []
+        self._vlines = []
+        self._markers = []
+        self._texts = []
+        self._next_color = 0
+
+    def plot(self, x, y, color: str | None = None, label: str | None = None, width: float = 1.5, marker: bool = False):
+        if color is None:
+            color = DEFAULT_COLORS[self._next_color % len(DEFAULT_COLORS)]
+            self._next_color += 1
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        self._lines.append((x, y, _color(color), label, width))
+        if marker:
+            self._markers.extend((xi, yi, _color(color)) for xi, yi in zip(x, y))
+
+    def marker(self, x: float, y: float, color: str):
+        self._markers.append((x, y, _color(color)))
+
+    def axhline(self, y: float, color: str, width: float = 1.0, dashed: bool = False, label: str | None = None):
+        self._hlines.append((y, _color(color), width, dashed, label))
+
+    def axvline(self, x: float, color: str, width: float = 1.0, dashed: bool = False):
+        self._vlines.append((x, _color(color), width, dashed))
+
+    def text(self, x: float, y: float, text: str, anchor: str = "start"):
+        self._texts.append((x, y, text, anchor))
+
+    def render(self) -> bytes:
+        """
+        Devuelve el SVG de la gráfica.
+
+        Raises:
+            ValueError: Si no hay datos finitos para calcular los límites de los ejes.
+        """
+        xlim = self.xlim or self._autoscale([line[0] for line in self._lines] + [[x for x, _, _ in self._markers]])
+        ylim = self.ylim or self._autoscale(
+            [line[1] for line in self._lines] + [[y for _, y, _ in self._markers]] + [[h[0] for h in self._hlines]]
+        )
+        if not all(math.isfinite(v) for v in (*xlim, *ylim)) or xlim[0] >= xlim[1] or ylim[0] >= ylim[1]:
+            raise ValueError("Límites de la gráfica no válidos.")
+
+        left, right, top, bottom = MARGINS
+        plot_width = self.width - left - right
+        plot_height = self.height - top - bottom
+
+        def to_x(value):
+            return left + (np.asarray(value, dtype=float) - xlim[0]) / (xlim[1] - xlim[0]) * plot_width
+
+        def to_y(value):
+            return top + (ylim[1] - np.asarray(value, dtype=float)) / (ylim[1] - ylim[0]) * plot_height
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+            f'viewBox="0 0 {self.width} {self.height}" font-family="DejaVu Sans, Arial, sans-serif">',
+            f'<defs><clipPath id="plot-area"><rect x="{left}" y="{top}" width="{plot_width}" height="{plot_height}"/></clipPath></defs>',
+            f'<rect width="{self.width}" height="{self.height}" fill="#ffffff"/>',
+        ]
+
+        # Cuadrícula y marcas de los ejes
+        x_ticks, y_ticks = _nice_ticks(*xlim), _nice_ticks(*ylim)
+        x_step = x_ticks[1] - x_ticks[0] if len(x_ticks) > 1 else 1.0
+        y_step = y_ticks[1] - y_ticks[0] if len(y_ticks) > 1 else 1.0
+        grid = []
+        for tick in x_ticks:
+            px = float(to_x(tick))
+            grid.append(f'<line x1="{px:.2f}" y1="{top}" x2="{px:.2f}" y2="{top + plot_height}"/>')
+            parts.append(
+                f'<text x="{px:.2f}" y="{top + plot_height + 16}" font-size="11" text-anchor="middle">{_format_tick(tick, x_step)}</text>'
+            )
+        for tick in y_ticks:
+            py = float(to_y(tick))
+            grid.append(f'<line x1="{left}" y1="{py:.2f}" x2="{left + plot_width}" y2="{py:.2f}"/>')
+            parts.append(
+                f'<text x="{left - 6}" y="{py + 4:.2f}" font-size="11" text-anchor="end">{_format_tick(tick, y_step)}</text>'
+            )
+        parts.append(f'<g stroke="{GRID_COLOR}" stroke-width="0.8">{"".join(grid)}</g>')
+
+        # Contenido recortado al área de dibujo
+        parts.append('<g clip-path="url(#plot-area)" fill="none">')
+        for y, color, width, dashed, _ in self._hlines:
+            py = float(to_y(y))
+            parts.append(self._segment(left, py, left + plot_width, py, color, width, dashed))
+        for x, color, width, dashed in self._vlines:
+            px = float(to_x(x))
+            parts.append(self._segment(px, top, px, top + plot_height, color, width, dashed))
+        for x, y, color, _, width in self._lines:
+            path = self._path(to_x(x), to_y(y))
+            if path:
+                parts.append(f'<path d="{path}" stroke="{color}" stroke-width="{width}" stroke-linejoin="round"/>')
+        for x, y, color in self._markers:
+            parts.append(f'<circle cx="{float(to_x(x)):.2f}" cy="{float(to_y(y)):.2f}" r="3.5" fill="{color}"/>')
+        parts.append("</g>")
+        for x, y, text, anchor in self._texts:
+            parts.append(
+                f'<text x="{float(to_x(x)):.2f}" y="{float(to_y(y)) - 4:.2f}" font-size="12" text-anchor="{anchor}">{escape(text)}</text>'
+            )
+
+        # Marco, título, etiquetas y leyenda
+        parts.append(
+            f'<rect x="{left}" y="{top}" width="{plot_width}" height="{plot_height}" fill="none" stroke="#000000" stroke-width="0.8"/>'
+        )
+        title_lines = self.title.split("\n")
+        for i, line in enumerate(title_lines):
+            y = top - 10 - 15 * (len(title_lines) - 1 - i)
+            parts.append(
+                f'<text x="{left + plot_width / 2:.2f}" y="{y}" font-size="13" text-anchor="middle">{escape(line)}</text>'
+            )
+        parts.append(
+            f'<text x="{left + plot_width / 2:.2f}" y="{self.height - 10}" font-size="12" text-anchor="middle">{escape(self.xlabel)}</text>'
+        )
+        parts.append(
+            f'<text x="16" y="{top + plot_height / 2:.2f}" font-size="12" text-anchor="middle" '
+            f'transform="rotate(-90 16 {top + plot_height / 2:.2f})">{escape(self.ylabel)}</text>'
+        )
+        parts.append(self._legend(left + plot_width, top))
+        parts.append("</svg>")
+        return "\n".join(part for part in parts if part).encode("utf-8")
+
+    @staticmethod
+    def _autoscale(series) -> tuple[float, float]:
+        values = np.concatenate([np.asarray(values, dtype=float).ravel() for values in series] or [np.array([])])
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return (math.nan, math.nan)
+        low, high = float(values.min()), float(values.max())
+        if low == high:
+            low, high = low - 1, high + 1
+        margin = (high - low) * AUTOSCALE_MARGIN
+        return (low - margin, high + margin)
+
+    @staticmethod
+    def _segment(x1, y1, x2, y2, color, width, dashed) -> str:
+        dash = ' stroke-dasharray="5,3"' if dashed else ""
+        return f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" stroke="{color}" stroke-width="{width}"{dash}/>'
+
+    @staticmethod
+    def _path(px: np.ndarray, py: np.ndarray) -> str:
+        # Los vértices que no se distinguen a la resolución de la gráfica no se escriben.
+        keep = simplification_mask(px, py)
+        px, py = px[keep], py[keep]
+
+        # Los puntos no finitos cortan la curva en tramos, como en matplotlib.
+        commands = []
+        pen_down = False
+        for x, y in zip(px.tolist(), py.tolist()):
+            if not (math.isfinite(x) and math.isfinite(y)):
+                pen_down = False
+                continue
+            commands.append(f"{'L' if pen_down else 'M'}{x:.2f} {y:.2f}")
+            pen_down = True
+        return " ".join(commands)
+
+    def _legend(self, right: float, top: float) -> str:
+        entries = [(label, color, width, False) for _, _, color, label, width in self._lines if label]
+        entries += [(label, color, width, dashed) for _, color, width, dashed, label in self._hlines if label]
+        if not entries:
+            return ""
+        box_width = 36 + 7 * max(len(label) for label, *_ in entries)
+        box_height = 8 + 18 * len(entries)
+        x0, y0 = right - box_width - 8, top + 8
+        parts = [
+            f'<rect x="{x0:.2f}" y="{y0:.2f}" width="{box_width}" height="{box_height}" '
+            f'fill="#ffffff" fill-opacity="0.8" stroke="#cccccc" rx="3"/>'
+        ]
+        for i, (label, color, width, dashed) in enumerate(entries):
+            y = y0 + 13 + 18 * i
+            parts.append(self._segment(x0 + 6, y, x0 + 26, y, color, width, dashed))
+            parts.append(f'<text x="{x0 + 32:.2f}" y="{y + 4:.2f}" font-size="11">{escape(label)}</text>')
+        return "".join(parts)
+
+
+def select_renderer(native: Callable[[], bytes], fallback: Callable[[BinaryIO], None]) -> Callable[[BinaryIO], None]:
+    """
+    Elige cómo dibujar una gráfica según `PLOT_RENDERER`.
+
+    Con "svg" se usa el escritor nativo y, si este no puede dibujar la gráfica (por ejemplo
+    porque no hay datos finitos para los ejes), se recurre a matplotlib.
+
+    Args:
+        native (Callable[[], bytes]): Devuelve el SVG generado con `SvgPlot`.
+        fallback (Callable[[BinaryIO], None]): Dibuja la gráfica con matplotlib en el archivo recibido.
+
+    Returns:
+        Callable[[BinaryIO], None]: Función que escribe el SVG en el archivo recibido.
+    """
+    if PLOT_RENDERER != "svg":
+        return fallback
+
+    def draw(output_file: BinaryIO) -> None:
+        try:
+            content = native()
+        except (ValueError, ArithmeticError):
+            fallback(output_file)
+            return
+        output_file.write(content)
+
+    return draw
@@ -0,0 +1,151 @@
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import sympy as sp
+
+from config.settings import (
+    SYMBOLIC_DISK_CACHE,
+    SYMBOLIC_DISK_CACHE_MAX_ENTRIES,
+    SYMBOLIC_DISK_CACHE_PATH,
+)
+from src.application.shared.utils.expression_parser import parse_expression, x_symbol
+from src.application.shared.utils.symbolic_disk_cache import SymbolicDiskCache
+
+# Número máximo de expresiones simbólicas que se conservan en memoria.
+SYMBOLIC_CACHE_SIZE = 128
+
+# Orden máximo de derivada que necesitan los métodos de la familia de Newton.
+MAX_DERIVATIVE_ORDER = 2
+
+
+class SymbolicEntry:
+    """
+    Expresión simbólica de f(x) junto con sus derivadas y sus funciones evaluables.
+
+    Las derivadas y las funciones de `lambdify` se calculan la primera vez que se piden
+    y quedan guardadas para las siguientes solicitudes. Si hay caché en disco, las
+    derivadas nuevas también se guardan allí para los demás procesos.
+    """
+
+    def __init__(
+        self,
+        derivatives: list[sp.Expr],
+        key: str | None = None,
+        disk_cache: SymbolicDiskCache | None = None,
+    ):
+        self.expression = derivatives[0]
+        self._derivatives = list(derivatives)
+        self._key = key
+        self._disk_cache = disk_cache
+        self._fused = {}
+        self._lock = threading.Lock()
+
+    def derivative(self, order: int) -> sp.Expr:
+        """
+        Devuelve la derivada de orden `order` (0 es la propia función).
+        """
+        if order < 0 or order > MAX_DERIVATIVE_ORDER:
+            raise ValueError(f"Solo se admiten derivadas hasta de orden {MAX_DERIVATIVE_ORDER}.")
+        with self._lock:
+            if len(self._derivatives) <= order:
+                while len(self._derivatives) <= order:
+                    self._derivatives.append(sp.diff(self._derivatives[-1], x_symbol))
+                if self._disk_cache is not None:
+                    self._disk_cache.store(self._key, self._derivatives)
+            return self._derivatives[order]
+
+    def fused(self, order: int) -> Callable[[float], tuple[float, ...]]:
+        """
+        Devuelve una sola función que evalúa (f, f', ..., f^(order)) en un punto.
+
+        Se genera con `lambdify(..., cse=True)`, así las subexpresiones comunes a la función
+        y sus derivadas (por ejemplo exp(x) o sin(x)**2) se calculan una vez por llamada.
+        """
+        expressions = tuple(self.derivative(k) for k in range(order + 1))
+        with self._lock:
+            if order not in self._fused:
+                self._fused[order] = sp.lambdify(x_symbol, expressions, modules=["math"], cse=True)
+            return self._fused[order]
+
+
+class SymbolicCache:
+    """
+    Caché LRU, compartida por todo el proceso, de expresiones simbólicas y sus derivadas.
+
+    La llave es el texto canónico que produce `parse_expression`, así "math.sin(x)" y "sin(x)"
+    comparten entrada. Lleva la cuenta de aciertos y fallos para poder medir su efecto.
+
+    Con `disk_cache`, un fallo en memoria busca primero la expresión y sus derivadas en disco
+    antes de construirlas con SymPy.
+    """
+
+    def __init__(
+        self,
+        max_size: int = SYMBOLIC_CACHE_SIZE,
+        disk_cache: SymbolicDiskCache | None = None,
+    ):
+        self.max_size = max_size
+        self.disk_cache = disk_cache
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, function_f: str) -> SymbolicEntry:
+        """
+        Devuelve la entrada de `function_f`, construyendo la expresión de SymPy solo si no estaba en caché.
+
+        Raises:
+            SyntaxError, NameError: Si la expresión no se puede interpretar.
+        """
+        parsed_expression = parse_expression(function_f)
+        key = parsed_expression.canonical
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # La construcción simbólica se hace fuera del candado para no bloquear otras solicitudes.
+        derivatives = self.disk_cache.load(key) if self.disk_cache is not None else None
+        entry = SymbolicEntry(
+            derivatives or [parsed_expression.sympy], key=key, disk_cache=self.disk_cache
+        )
+
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores de uso de la caché.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+symbolic_cache = SymbolicCache(
+    disk_cache=(
+        SymbolicDiskCache(SYMBOLIC_DISK_CACHE_PATH, SYMBOLIC_DISK_CACHE_MAX_ENTRIES)
+        if SYMBOLIC_DISK_CACHE
+        else None
+    )
+)
@@ -0,0 +1,171 @@
+import ast
+import functools
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+import sympy as sp
+
+# Cambiar este número invalida todas las entradas guardadas (por ejemplo si cambia el formato).
+SCHEMA_VERSION = 2
+
+# Segundos que un proceso espera a que otro libere la base de datos antes de rendirse.
+BUSY_TIMEOUT = 5.0
+
+
+class SymbolicDiskCache:
+    """
+    Caché persistente en SQLite de una expresión y sus derivadas, compartida por varios procesos.
+
+    Cada fila guarda la lista de expresiones en JSON, cada una con su forma `sp.srepr`,
+    indexada por el hash SHA-256 del texto canónico de la función. Al leerlas no se usa `eval`
+    ni `pickle`: `_decode_expression` solo construye objetos de SymPy con argumentos literales,
+    así que un archivo alterado no puede ejecutar código. Las filas escritas con otra versión
+    del esquema o de SymPy se ignoran y se eliminan. Cuando se supera `max_entries` se borran
+    las menos usadas (LRU).
+
+    La caché es opcional: cualquier error de SQLite o una fila que no se puede leer se trata
+    como un fallo de caché y la derivada se calcula en memoria como siempre.
+    """
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.version = f"{SCHEMA_VERSION}:{sp.__version__}"
+        self._initialized = False
+
+    def load(self, canonical: str) -> list[sp.Expr] | None:
+        """
+        Devuelve [f, f', ...] guardadas para la función, o None si no están en disco.
+        """
+        key = self._key(canonical)
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT expressions FROM derivatives WHERE key = ? AND version = ?",
+                    (key, self.version),
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(
+                    "UPDATE derivatives SET last_used = ? WHERE key = ?", (time.time(), key)
+                )
+        except sqlite3.Error:
+            return None
+        try:
+            return [_decode_expression(text) for text in json.loads(row[0])]
+        except (ValueError, TypeError, SyntaxError, RecursionError, sp.SympifyError):
+            # Fila dañada o alterada: se recalcula y `store` la reemplaza.
+            return None
+
+    def store(self, canonical: str, expressions: list[sp.Expr]) -> None:
+        """
+        Guarda [f, f', ...] de la función y aplica el límite de entradas.
+        """
+        serialized = json.dumps([sp.srepr(expression) for expression in expressions])
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO derivatives (key, version, expressions, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self._key(canonical), self.version, serialized, time.time()),
+                )
+                connection.execute("DELETE FROM derivatives WHERE version != ?", (self.version,))
+                connection.execute(
+                    "DELETE FROM derivatives WHERE key NOT IN "
+                    "(SELECT key FROM derivatives ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error:
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        if not self._initialized:
+            try:
+                # WAL permite que varios procesos lean mientras otro escribe.
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS derivatives ("
+                    "key TEXT PRIMARY KEY, version TEXT NOT NULL, "
+                    "expressions BLOB NOT NULL, last_used REAL NOT NULL)"
+                )
+                connection.commit()
+            except BaseException:
+                connection.close()
+                raise
+            self._initialized = True
+        return connection
+
+    @staticmethod
+    def _key(canonical: str) -> str:
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _decode_expression(text: str) -> sp.Basic:
+    """
+    Reconstruye una expresión a partir de su forma `sp.srepr`, sin `eval`.
+
+    Solo acepta llamadas a clases de SymPy (Add, Symbol, Integer, sin, Function('f'), ...),
+    constantes de SymPy (pi, E, oo, ...) y argumentos literales. Los textos solo se aceptan
+    como primer argumento de las clases de `_NAMED_CLASSES`: otros constructores (Derivative,
+    Subs, ...) pasan los textos por `sympify`, que los evalúa como código.
+
+    Raises:
+        ValueError: Si el texto tiene cualquier otra cosa.
+    """
+    return _decode_node(ast.parse(text, mode="eval").body)
+
+
+# Clases cuyo primer argumento es un nombre o un número escrito como texto, que guardan o
+# interpretan sin `sympify`.
+_NAMED_CLASSES = (sp.Symbol, sp.Dummy, sp.Function, sp.Float)
+
+
+@functools.cache
+def _basic_classes() -> dict[str, type]:
+    # Todas las subclases de sp.Basic por nombre (la primera que aparece si se repite).
+    classes = {}
+    pending = [sp.Basic]
+    while pending:
+        cls = pending.pop()
+        classes.setdefault(cls.__name__, cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+def _decode_node(node: ast.AST, allow_text: bool = False):
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, bool)):
+        return node.value
+    if isinstance(node, ast.Constant) and isinstance(node.value, str) and allow_text:
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _decode_node(node.operand)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return -value
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return tuple(_decode_node(item) for item in node.elts)
+    if isinstance(node, ast.Name) and not node.id.startswith("_"):
+        value = getattr(sp, node.id, None)
+        # Clases de SymPy (Add, sin, ...) o sus constantes (pi, E, oo, true, ...).
+        if isinstance(value, sp.Basic) or (isinstance(value, type) and issubclass(value, sp.Basic)):
+            return value
+        # Clases que `sympy` no exporta, como ExprCondPair.
+        if node.id in _basic_classes():
+            return _basic_classes()[node.id]
+    if isinstance(node, ast.Call):
+        function = _decode_node(node.func)
+        if isinstance(function, type) and issubclass(function, sp.Basic):
+            named = function in _NAMED_CLASSES
+            args = [_decode_node(arg, allow_text=named and i == 0) for i, arg in enumerate(node.args)]
+            kwargs = {}
+            for keyword in node.keywords:
+                if keyword.arg is None:
+                    break
+                kwargs[keyword.arg] = _decode_node(keyword.value)
+            else:
+                return function(*args, **kwargs)
+    raise ValueError(f"Expresión guardada no válida: {ast.dump(node)[:80]}")
@@ -0,0 +1,77 @@
+import sympy as sp
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.automatic_differentiation import Taylor, taylor_evaluator
+from src.application.shared.utils.derivatives import AUTOMATIC, SYMBOLIC, derivative_evaluator, uses_variable
+from src.application.shared.utils.expression_parser import FUNCTIONS, parse_expression, x_symbol
+
+
+def _symbolic(expression: str, point: float) -> tuple[float, float, float]:
+    f = parse_expression(expression).sympy
+    return tuple(float(sp.diff(f, x_symbol, order).subs(x_symbol, point)) for order in range(3))
+
+
+class TaylorTests(SimpleTestCase):
+    def assertDerivativesEqual(self, actual, expected):
+        for order, (a, e) in enumerate(zip(actual, expected)):
+            self.assertAlmostEqual(a, e, delta=1e-9 * max(1.0, abs(e)), msg=f"derivada de orden {order}")
+
+    def test_every_function_matches_sympy(self):
+        # Cada función se compone con un polinomio para que la regla de la cadena intervenga.
+        arguments = {"atan2": "x**2, x + 2", "pow": "x**2 + 1, 3", "hypot": "x**2, x + 3"}
+        skipped = {"floor", "ceil", "trunc", "min", "max", "abs", "fabs"}
+        for name in FUNCTIONS.keys() - skipped:
+            expression = f"{name}({arguments.get(name, '0.5*x**2 + 0.25')})"
+            point = 1.5 if name == "acosh" else 0.6
+            with self.subTest(expression=expression):
+                self.assertDerivativesEqual(taylor_evaluator(expression)(point), _symbolic(expression, point))
+
+    def test_arithmetic(self):
+        for expression in ["x**3 - 2*x + 1", "1/(x - 3)", "x**x", "2**x", "x**0.5 * exp(-x)"]:
+            with self.subTest(expression=expression):
+                self.assertDerivativesEqual(taylor_evaluator(expression)(0.7), _symbolic(expression, 0.7))
+
+    def test_piecewise_functions(self):
+        self.assertEqual(taylor_evaluator("abs(x)")(-2.0), (2.0, -1.0, 0.0))
+        self.assertEqual(taylor_evaluator("floor(x) + x")(2.5), (4.5, 1.0, 0.0))
+        self.assertEqual(taylor_evaluator("(x + 1) % 2")(1.5), (0.5, 1.0, 0.0))
+        self.assertEqual(taylor_evaluator("5 % x")(2.0), (1.0, 0.0, 0.0))
+        self.assertEqual(taylor_evaluator("5 // x")(2.0), (2.0, 0.0, 0.0))
+        self.assertEqual(taylor_evaluator("max(x**2, 1)")(2.0), (4.0, 4.0, 2.0))
+        self.assertEqual(taylor_evaluator("min(x**2, 1)")(2.0), (1, 0.0, 0.0))
+
+    def test_power_rule_at_zero(self):
+        self.assertEqual(taylor_evaluator("x**2")(0.0), (0.0, 0.0, 2.0))
+        self.assertEqual(taylor_evaluator("x**1")(0.0), (0.0, 1.0, 0.0))
+
+    def test_taylor_numbers(self):
+        u = Taylor(2.0, 1.0, 0.0)
+        product = u * u
+        self.assertEqual((product.value, product.first, product.second), (4.0, 4.0, 2.0))
+        quotient = 1 / u
+        self.assertEqual((quotient.value, quotient.first, quotient.second), (0.5, -0.25, 0.25))
+
+
+class DerivativeEvaluatorTests(SimpleTestCase):
+    def test_modes_agree(self):
+        for expression in ["x**3 - 2*x - 5", "exp(x) - 3*x**2", "math.sin(x) - x/2", "log(x) + x**(1/3)"]:
+            symbolic = derivative_evaluator(expression, 2, SYMBOLIC)(1.3)
+            automatic = derivative_evaluator(expression, 2, AUTOMATIC)(1.3)
+            with self.subTest(expression=expression):
+                for s, a in zip(symbolic, automatic):
+                    self.assertAlmostEqual(s, a, places=12)
+
+    def test_order_limits_the_result(self):
+        self.assertEqual(len(derivative_evaluator("x**2", 1, AUTOMATIC)(1.0)), 2)
+
+    def test_uses_variable(self):
+        for mode in (SYMBOLIC, AUTOMATIC):
+            with self.subTest(mode=mode):
+                self.assertTrue(uses_variable("x**2 - 2", 1, mode))
+                self.assertFalse(uses_variable("2 + pi", 1, mode))
+                self.assertFalse(uses_variable("x - x + 1", 1, mode))
+                self.assertTrue(uses_variable("5 % x", 1, mode))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            derivative_evaluator("x", 1, "numeric")
@@ -0,0 +1,105 @@
+import ast
+import math
+
+import numpy as np
+import sympy as sp
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.expression_parser import (
+    FUNCTIONS,
+    _ConstantFolder,
+    _Whitelist,
+    parse_expression,
+    x_symbol,
+)
+
+
+def _fold(expression: str, exact: bool = False) -> str:
+    tree = _Whitelist().visit(ast.parse(expression, mode="eval"))
+    return ast.unparse(_ConstantFolder(exact=exact).visit(tree))
+
+
+class WhitelistTests(SimpleTestCase):
+    def test_rejects_constructions_outside_the_whitelist(self):
+        for expression in [
+            "__import__('os').system('ls')",
+            "x.__class__",
+            "(lambda y: y)(x)",
+            "[x for x in range(3)]",
+            "'texto'",
+            "x if x > 0 else -x",
+            "x < 1",
+            "x @ x",
+            "True + x",
+            "math.sin(x=x)",
+            "math.sqrt(*[x])",
+            "np.sin(x)",
+        ]:
+            with self.subTest(expression=expression), self.assertRaises(SyntaxError):
+                parse_expression(expression)
+
+    def test_rejects_unknown_names(self):
+        for expression in ["y + x", "math.factorial(x)", "open(x)", "eval(x)", "Integer(1)"]:
+            with self.subTest(expression=expression), self.assertRaises(NameError):
+                parse_expression(expression)
+
+    def test_math_prefix_and_spacing_share_the_canonical_text(self):
+        self.assertEqual(parse_expression("math.sin(x) + math.e").canonical, parse_expression("sin( x )+E").canonical)
+
+    def test_caret_is_a_power(self):
+        self.assertEqual(parse_expression("x^2 - 2").scalar(3.0), 7.0)
+
+    def test_functions_agree_in_every_representation(self):
+        # Las funciones de dos argumentos reciben una constante como segundo; el punto está en el
+        # dominio de todas (acosh necesita x > 1).
+        arguments = {"atan2": "x, 2", "pow": "x, 3", "min": "x, 0.5", "max": "x, 0.5", "hypot": "x, 3"}
+        for name in FUNCTIONS:
+            expression = f"{name}({arguments.get(name, 'x')})"
+            value = 1.75 if name == "acosh" else 0.75
+            with self.subTest(expression=expression):
+                parsed = parse_expression(expression)
+                expected = parsed.scalar(value)
+                self.assertAlmostEqual(float(parsed.vectorized(np.array([value]))[0]), expected)
+                self.assertAlmostEqual(float(parsed.sympy.subs(x_symbol, value)), expected)
+
+    def test_constants_from_the_math_module(self):
+        self.assertEqual(parse_expression("math.tau * x").scalar(1.0), math.tau)
+        self.assertEqual(parse_expression("math.inf + x").scalar(1.0), math.inf)
+        self.assertTrue(math.isnan(parse_expression("math.nan + x").scalar(1.0)))
+
+
+class ConstantFoldingTests(SimpleTestCase):
+    def test_numeric_folding(self):
+        self.assertEqual(_fold("2 * pi * x"), f"{2 * math.pi} * x")
+        self.assertEqual(_fold("math.sqrt(4) + x"), "2.0 + x")
+        self.assertEqual(_fold("1 / 4 * x"), "0.25 * x")
+
+    def test_exact_folding_only_combines_integers(self):
+        self.assertEqual(_fold("2 ** 10 * x / 3", exact=True), "1024 * x / 3")
+        self.assertEqual(_fold("2 * pi * x", exact=True), "2 * pi * x")
+        self.assertEqual(_fold("1 / 3 + x", exact=True), "1 / 3 + x")
+        self.assertEqual(_fold("2 ** (-1) + x", exact=True), "2 ** -1 + x")
+
+    def test_sympy_expression_stays_exact(self):
+        self.assertEqual(parse_expression("x/3 + 1/3").sympy, (x_symbol + 1) / 3)
+        self.assertEqual(parse_expression("2*pi*x").sympy, 2 * sp.pi * x_symbol)
+        self.assertEqual(parse_expression("math.sqrt(2)*x").sympy, sp.sqrt(2) * x_symbol)
+        self.assertEqual(parse_expression("x**-2 + 2**-1").sympy, x_symbol**-2 + sp.Rational(1, 2))
+
+    def test_numeric_functions_use_the_folded_values(self):
+        parsed = parse_expression("x/3 + 1/3")
+        self.assertEqual(parsed.scalar(2.0), 2.0 / 3 + 1 / 3)
+        self.assertEqual(parsed.vectorized(np.array([2.0]))[0], 2.0 / 3 + 1 / 3)
+
+    def test_errors_are_kept_for_evaluation(self):
+        parsed = parse_expression("1/0 + x")
+        with self.assertRaises(ZeroDivisionError):
+            parsed.scalar(1.0)
+        with self.assertRaises(ValueError):
+            parse_expression("math.log(-1) + x").scalar(1.0)
+
+    def test_huge_integer_powers_do_not_build_the_integer(self):
+        parsed = parse_expression("10**10**10 * x")
+        with self.assertRaises(OverflowError):
+            parsed.scalar(1.0)
+        self.assertEqual(parse_expression("2**65 * x").sympy, sp.Float(2.0**65) * x_symbol)
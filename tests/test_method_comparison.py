@@ -0,0 +1,84 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from src.application.numerical_method.utils import method_comparison
+from src.application.numerical_method.utils.method_comparison import (
+    ROOT_METHODS,
+    best_root_method,
+    closest_solutions,
+    compare_matrix_methods_report,
+    iter_root_methods,
+)
+from src.application.shared.utils.result_cache import ResultCache
+
+PARAMS = {"function_f": "x**2 - 2", "x0": 1.0, "interval_a": 1.0, "interval_b": 2.0}
+
+
+def _outcomes(error: Exception):
+    # Resultados de `_iter_methods` en los que el primer método termina con `error`.
+    def iter_methods(methods, std_params):
+        for i, name in enumerate(methods):
+            if i == 0:
+                yield name, error
+            else:
+                yield name, {"Método": name, "Iteraciones": 1, "Solución": 1.4142, "¿Converge?": "Sí"}
+
+    return iter_methods
+
+
+class RootComparisonCacheTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(method_comparison, "comparison_cache", ResultCache(8, 60))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_twice(self, error: Exception) -> mock.Mock:
+        iter_methods = mock.Mock(side_effect=_outcomes(error))
+        with mock.patch.object(method_comparison, "_iter_methods", iter_methods):
+            first = list(iter_root_methods(PARAMS))
+            list(iter_root_methods(PARAMS))
+        self.assertEqual(first[0]["¿Converge?"], "No")
+        self.assertEqual(len(first), len(ROOT_METHODS))
+        return iter_methods
+
+    def test_timeouts_and_dead_workers_are_not_cached(self):
+        for error in (TimeoutError("tarde"), RuntimeError("el proceso murió")):
+            with self.subTest(error=type(error).__name__):
+                method_comparison.comparison_cache.clear()
+                self.assertEqual(self._run_twice(error).call_count, 2)
+
+    def test_errors_of_the_method_are_cached(self):
+        self.assertEqual(self._run_twice(ZeroDivisionError("división por cero")).call_count, 1)
+
+
+def _row(name, solution, iterations, converges="Sí", error=1e-8):
+    return {"Método": name, "Solución": solution, "Iteraciones": iterations, "¿Converge?": converges, "Error": error}
+
+
+class BestMethodTests(SimpleTestCase):
+    def test_closest_solutions(self):
+        self.assertEqual(closest_solutions([1.5, 1.41421, 1.41422]), [1, 2])
+        self.assertEqual(closest_solutions([[1.0, 2.0], "[1.0, 2.1]", [5.0, 5.0]]), [0, 1])
+        self.assertEqual(closest_solutions([1.0]), [0])
+        self.assertEqual(closest_solutions(["no es un número", 1.0]), [])
+        self.assertEqual(closest_solutions([]), [])
+
+    def test_best_root_method_skips_the_method_that_found_another_root(self):
+        results = [
+            _row("Bisección", -1.41421, 1),
+            _row("Newton-Raphson", 1.41421356, 5),
+            _row("Secante", 1.41421357, 7),
+            _row("Punto Fijo", "-", "-", converges="No"),
+        ]
+        self.assertEqual(best_root_method(results, {})["Método"], "Newton-Raphson")
+        self.assertEqual(best_root_method(results, {"iterations": 0, "time": 1})["Método"], "Newton-Raphson")
+        self.assertIsNone(best_root_method(results[3:], {}))
+
+    def test_matrix_report_marks_the_best_method(self):
+        A = [[4.0, -1.0, 0.0], [-1.0, 4.0, -1.0], [0.0, -1.0, 4.0]]
+        csv_content, results = compare_matrix_methods_report(
+            A, [15.0, 10.0, 10.0], [0.0, 0.0, 0.0], 1e-7, 100, weights={}
+        )
+        self.assertEqual([row["¿Mejor?"] for row in results].count("Sí"), 1)
+        self.assertTrue(csv_content.startswith("Método,Iteraciones,Solución,Error,¿Converge?"))
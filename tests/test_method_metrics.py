@@ -0,0 +1,63 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.method_metrics import (
+    count_matrix_vector_products,
+    counted,
+    empty_metrics_row,
+    measure,
+)
+
+
+class MeasureTests(SimpleTestCase):
+    def test_counters_only_count_inside_a_measurement(self):
+        self.assertIs(counted(abs), abs)
+        with measure() as metrics:
+            counted(abs, derivatives=2)(-3)
+            count_matrix_vector_products(4)
+        self.assertEqual(
+            (metrics.function_evaluations, metrics.derivative_evaluations, metrics.matrix_vector_products), (1, 2, 4)
+        )
+
+    def test_peak_memory_of_the_block(self):
+        with measure() as metrics:
+            data = bytearray(2 * 1024 * 1024)
+            del data
+        self.assertGreaterEqual(metrics.peak_memory, 2 * 1024 * 1024)
+
+    def test_concurrent_measurements_do_not_mix(self):
+        # La primera medición termina (y detiene tracemalloc) mientras la segunda todavía reserva memoria.
+        peaks = {}
+        started = threading.Event()
+
+        def first():
+            with measure() as metrics:
+                data = bytearray(1024 * 1024)
+                started.set()
+                time.sleep(0.2)
+                del data
+            peaks["first"] = metrics.peak_memory
+
+        def second():
+            started.wait(10)
+            with measure() as metrics:
+                data = bytearray(2 * 1024 * 1024)
+                time.sleep(0.4)
+                del data
+            peaks["second"] = metrics.peak_memory
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertGreaterEqual(peaks["first"], 1024 * 1024)
+        self.assertLess(peaks["first"], 2 * 1024 * 1024)
+        self.assertGreaterEqual(peaks["second"], 2 * 1024 * 1024)
+
+    def test_empty_row_has_the_same_columns(self):
+        with measure() as metrics:
+            pass
+        self.assertEqual(empty_metrics_row(matrix=True).keys(), metrics.as_row(matrix=True).keys())
@@ -0,0 +1,132 @@
+import os
+import threading
+import time
+import unittest
+
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.parallel_tasks import ProcessPool, supports_process_pool
+
+# Las tareas se envían por referencia a los procesos hijos, así que están a nivel de módulo.
+
+
+def _square(value):
+    return value * value
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+def _crash():
+    os._exit(1)
+
+
+def _unpicklable_result():
+    return threading.Lock()
+
+
+def _pid():
+    return os.getpid()
+
+
+def _sleep_pid(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+
+@unittest.skipUnless(supports_process_pool(), "La plataforma no permite procesos con forkserver.")
+class ProcessPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.pool = ProcessPool(2)
+        self.addCleanup(self.pool.shutdown)
+
+    def test_results_keep_the_order_of_the_tasks(self):
+        tasks = {str(value): (_square, (value,)) for value in range(5)}
+        self.assertEqual(self.pool.run(tasks, timeout=10), {str(value): value * value for value in range(5)})
+
+    def test_exceptions_are_returned(self):
+        result = self.pool.run({"falla": (_fail, ("no",)), "bien": (_square, (3,))}, timeout=10)
+        self.assertIsInstance(result["falla"], ValueError)
+        self.assertEqual(str(result["falla"]), "no")
+        self.assertEqual(result["bien"], 9)
+
+    def _start_workers(self):
+        # El límite de tiempo cuenta desde que se envía la tarea; los procesos se crean antes para
+        # que su arranque no cuente en las pruebas con límites cortos.
+        self.pool.run({"a": (_sleep, (0.2,)), "b": (_sleep, (0.2,))}, timeout=60)
+
+    def test_slow_task_is_cancelled_and_its_worker_replaced(self):
+        self._start_workers()
+        start = time.monotonic()
+        result = self.pool.run({"lenta": (_sleep, (30,)), "rapida": (_sleep, (0,))}, timeout=0.5)
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertIsInstance(result["lenta"], TimeoutError)
+        self.assertEqual(result["rapida"], 0)
+        self.assertEqual(self.pool.run({"otra": (_square, (4,))}, timeout=10), {"otra": 16})
+
+    def test_worker_that_dies_reports_an_error(self):
+        result = self.pool.run({"muere": (_crash, ())}, timeout=10)
+        self.assertIsInstance(result["muere"], RuntimeError)
+        self.assertEqual(self.pool.run({"otra": (_square, (2,))}, timeout=10), {"otra": 4})
+
+    def test_values_that_cannot_be_pickled(self):
+        result = self.pool.run(
+            {"argumento": (_square, (threading.Lock(),)), "resultado": (_unpicklable_result, ())}, timeout=10
+        )
+        self.assertIsInstance(result["argumento"], Exception)
+        self.assertIsInstance(result["resultado"], RuntimeError)
+
+    def test_workers_are_reused(self):
+        first = self.pool.run({"a": (_pid, ())}, timeout=10)["a"]
+        second = self.pool.run({"a": (_pid, ())}, timeout=10)["a"]
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, os.getpid())
+
+    def test_abandoned_generator_kills_running_tasks(self):
+        tasks = {"rapida": (_sleep, (0,)), "lenta": (_sleep, (30,))}
+        results = self.pool.as_completed(tasks, timeout=60)
+        self.assertEqual(next(results), ("rapida", 0))
+        start = time.monotonic()
+        results.close()
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(self.pool.run({"otra": (_square, (5,))}, timeout=10), {"otra": 25})
+
+
+@unittest.skipUnless(supports_process_pool(), "La plataforma no permite procesos con forkserver.")
+class ProcessLimitTests(SimpleTestCase):
+    def setUp(self):
+        self.pool = ProcessPool(1)
+        self.addCleanup(self.pool.shutdown)
+        self.pool.run({"a": (_pid, ())}, timeout=60)
+
+    def _occupy(self, seconds: float) -> tuple[threading.Thread, list]:
+        # Otra solicitud ocupa el único proceso durante `seconds` segundos.
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(self.pool.run({"a": (_sleep_pid, (seconds,))}, timeout=60)["a"])
+        )
+        thread.start()
+        while self.pool._idle:
+            time.sleep(0.01)
+        self.addCleanup(thread.join, 10)
+        return thread, result
+
+    def test_concurrent_callers_share_the_processes(self):
+        thread, result = self._occupy(0.5)
+        pid = self.pool.run({"b": (_pid, ())}, timeout=30)["b"]
+        thread.join(10)
+        self.assertEqual(result, [pid])
+
+    def test_waiting_for_a_process_uses_the_timeout(self):
+        self._occupy(3)
+        start = time.monotonic()
+        result = self.pool.run({"b": (_square, (2,)), "c": (_square, (3,))}, timeout=0.5)
+        self.assertLess(time.monotonic() - start, 2.5)
+        self.assertIsInstance(result["b"], TimeoutError)
+        self.assertIsInstance(result["c"], TimeoutError)
@@ -0,0 +1,74 @@
+import tempfile
+from unittest import mock
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from src.application.shared.middleware.plot_context_middleware import PlotContextMiddleware
+from src.application.shared.utils import plot_context as plot_context_module
+from src.application.shared.utils.plot_context import plot_context, request_plot
+from src.application.shared.utils.plot_store import PlotStore
+
+
+def _draw(output):
+    output.write(b"<svg/>")
+
+
+def _broken_draw(output):
+    raise ValueError("no se puede dibujar")
+
+
+class PlotContextTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = PlotStore(directory.name, max_bytes=10**6, max_age=3600)
+        patcher = mock.patch.object(plot_context_module, "plot_store", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_the_last_plot_of_each_kind_is_drawn(self):
+        with plot_context():
+            request_plot("function_plot", {"f": "x"}, _broken_draw)
+            name = request_plot("function_plot", {"f": "x**2"}, _draw)
+        self.assertEqual(self.store.read(name), b"<svg/>")
+        self.assertEqual(self.store.stats()["renders"], 1)
+
+    def test_render_errors_are_logged(self):
+        with self.assertLogs(plot_context_module.logger, "ERROR"):
+            with plot_context() as context:
+                request_plot("system_plot", [1], _broken_draw)
+                name = request_plot("function_plot", [1], _draw)
+                self.assertEqual(context.flush(), [name])
+        self.assertEqual(self.store.read(name), b"<svg/>")
+
+    def test_without_render_plots_are_only_named(self):
+        with plot_context(render=False):
+            name = request_plot("function_plot", [2], _draw)
+        self.assertIsNone(self.store.read(name))
+
+    def _respond(self, response):
+        names = []
+
+        def view(request):
+            names.append(request_plot("function_plot", [3], _draw))
+            return response
+
+        PlotContextMiddleware(view)(RequestFactory().get("/"))
+        return self.store.read(names[0])
+
+    def test_middleware_draws_plots_of_html_pages(self):
+        self.assertEqual(self._respond(HttpResponse("<html></html>")), b"<svg/>")
+
+    def test_middleware_skips_reports_and_streams(self):
+        self.assertIsNone(self._respond(HttpResponse("a,b", content_type="text/csv")))
+        self.assertIsNone(self._respond(StreamingHttpResponse(iter(["<html>"]))))
+
+    def test_middleware_keeps_the_page_when_a_plot_fails(self):
+        def view(request):
+            request_plot("function_plot", [4], _broken_draw)
+            return HttpResponse("<html></html>")
+
+        with self.assertLogs(plot_context_module.logger, "ERROR"):
+            response = PlotContextMiddleware(view)(RequestFactory().get("/"))
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,65 @@
+import base64
+
+import numpy as np
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+
+def _decode(series: dict, axis: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(series[axis]), dtype="<f4")
+
+
+class PlotDataViewTests(SimpleTestCase):
+    def _url(self, kind: str) -> str:
+        return reverse("numerical_method:plot_data", args=[kind])
+
+    def test_function_data(self):
+        params = {"function": "x**2 - 2", "points": "1.4142,0", "solution": "true"}
+        response = self.client.get(self._url("function"), params)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["kind"], "function_plot")
+        series = data["series"][0]
+        x, y = _decode(series, "x"), _decode(series, "y")
+        self.assertEqual(len(x), series["length"])
+        np.testing.assert_allclose(y, x.astype(float) ** 2 - 2, atol=1e-4)
+        self.assertEqual(data["markers"][0]["x"], 1.4142)
+
+    def test_etag_revalidation(self):
+        params = {"function": "sin(x)", "points": "0,0", "solution": "true"}
+        response = self.client.get(self._url("function"), params)
+        etag = response["ETag"]
+        self.assertIn("max-age", response["Cache-Control"])
+        revalidated = self.client.get(self._url("function"), params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated["ETag"], etag)
+        self.assertEqual(revalidated.content, b"")
+        # Con otros datos el ETag cambia y la respuesta vuelve a ser completa.
+        other = self.client.get(self._url("function"), {**params, "points": "0,0.5"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(other.status_code, 200)
+        self.assertNotEqual(other["ETag"], etag)
+
+    def test_spline_data(self):
+        response = self.client.get(self._url("spline_cubic"), {"x": "3 1 2 4", "y": "1 0 2 -1"})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        x = _decode(data["series"][0], "x")
+        self.assertEqual((x[0], x[-1]), (1, 4))
+        self.assertTrue(np.all(np.diff(x) > 0))
+        self.assertEqual([(marker["x"], marker["y"]) for marker in data["markers"]], [(1, 0), (2, 2), (3, 1), (4, -1)])
+
+    def test_invalid_inputs(self):
+        cases = [
+            ("function", {"function": "import os", "points": "0,0"}),
+            ("function", {"function": "x", "points": "a,b"}),
+            ("function", {"function": "x", "points": ""}),
+            ("spline_cubic", {"x": "1 2", "y": "1 2"}),
+        ]
+        for kind, params in cases:
+            with self.subTest(kind=kind, params=params):
+                response = self.client.get(self._url(kind), params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("message_method", response.json())
+
+    def test_unknown_kind(self):
+        self.assertEqual(self.client.get(self._url("histogram")).status_code, 404)
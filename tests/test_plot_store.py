@@ -0,0 +1,135 @@
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.plot_store import PlotStore, artifact_name
+from src.application.shared.utils.render_cache import RenderCache
+
+
+class _Drawing:
+    # Dibujo que cuenta sus llamadas y, si se le pide, espera a que la prueba lo libere.
+
+    def __init__(self, content: bytes = b"<svg/>", error: Exception | None = None, blocked: bool = False):
+        self.content = content
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+        if not blocked:
+            self.release.set()
+
+    def __call__(self, output):
+        self.calls += 1
+        self.release.wait(10)
+        if self.error is not None:
+            raise self.error
+        output.write(self.content)
+
+
+class ArtifactNameTests(SimpleTestCase):
+    def test_name_depends_on_kind_and_inputs(self):
+        name = artifact_name("function_plot", {"f": "x", "points": [(1, 2)]})
+        self.assertRegex(name, r"^function_plot_[0-9a-f]{32}\.svg$")
+        self.assertEqual(name, artifact_name("function_plot", {"points": [[1, 2]], "f": "x"}))
+        self.assertNotEqual(name, artifact_name("system_plot", {"f": "x", "points": [(1, 2)]}))
+        self.assertNotEqual(name, artifact_name("function_plot", {"f": "x", "points": [(1, 3)]}))
+
+
+class PlotStoreTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.store = self._store()
+
+    def _store(self, **kwargs) -> PlotStore:
+        return PlotStore(self.directory, max_bytes=10**6, max_age=3600, render_cache=RenderCache(10**6), **kwargs)
+
+    def test_render_draws_once_and_read_returns_the_content(self):
+        draw = _Drawing()
+        name = self.store.render("function_plot", [1], draw)
+        self.assertEqual(self.store.render("function_plot", [1], draw), name)
+        self.assertEqual(draw.calls, 1)
+        self.assertEqual((self.directory / name).read_bytes(), b"<svg/>")
+        self.assertEqual(self.store.read(name), b"<svg/>")
+
+    def test_plot_on_disk_does_not_touch_the_memory_cache(self):
+        self.store.render("function_plot", [1], _Drawing())
+        self.store.render("function_plot", [1], _Drawing())
+        stats = self.store.stats()
+        self.assertEqual((stats["renders"], stats["hits"], stats["misses"]), (1, 0, 1))
+
+    def test_other_process_reads_from_disk(self):
+        name = self.store.render("function_plot", [1], _Drawing())
+        other = self._store()
+        self.assertEqual(other.read(name), b"<svg/>")
+        self.assertEqual(other.read(name), b"<svg/>")
+        self.assertEqual(other.stats()["hits"], 1)
+
+    def test_plot_in_memory_is_written_back_to_disk(self):
+        draw = _Drawing()
+        name = self.store.render("function_plot", [1], draw)
+        (self.directory / name).unlink()
+        self.store.render("function_plot", [1], draw)
+        self.assertEqual(draw.calls, 1)
+        self.assertEqual((self.directory / name).read_bytes(), b"<svg/>")
+
+    def test_read_rejects_names_outside_the_store(self):
+        for name in ["../settings.py", "function_plot_1234.svg", "function_plot_" + "0" * 32 + ".svg"]:
+            with self.subTest(name=name):
+                self.assertIsNone(self.store.read(name))
+
+    def test_failed_synchronous_draw_raises_and_leaves_nothing(self):
+        with self.assertRaises(ValueError):
+            self.store.render("function_plot", [1], _Drawing(error=ValueError("falla")))
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_evict_removes_old_plots_and_then_the_least_recently_used(self):
+        store = PlotStore(self.directory, max_bytes=10, max_age=3600)
+        names = [store.render("function_plot", [i], _Drawing(b"12345")) for i in range(4)]
+        old = time.time() - 7200
+        os.utime(self.directory / names[0], (old, old))
+        for i, name in enumerate(names[1:]):
+            os.utime(self.directory / name, (time.time() - 100 + i, time.time() - 100 + i))
+        store.evict(force=True)
+        self.assertEqual(sorted(path.name for path in self.directory.iterdir()), sorted(names[2:]))
+
+
+class BackgroundPlotStoreTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        self.store = PlotStore(
+            self.directory, max_bytes=10**6, max_age=3600, render_cache=RenderCache(10**6),
+            executor=executor, wait_timeout=10,
+        )
+
+    def test_render_returns_at_once_and_read_waits(self):
+        draw = _Drawing(blocked=True)
+        start = time.monotonic()
+        name = self.store.render("function_plot", [1], draw)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(self.store.render("function_plot", [1], draw), name)
+        threading.Timer(0.1, draw.release.set).start()
+        self.assertEqual(self.store.read(name), b"<svg/>")
+        self.assertEqual(draw.calls, 1)
+        self.assertFalse((self.directory / f"{name}.pending").exists())
+
+    def test_failed_background_draw_reads_as_missing(self):
+        name = self.store.render("function_plot", [1], _Drawing(error=ValueError("falla")))
+        self.assertIsNone(self.store.read(name))
+        self.assertFalse((self.directory / f"{name}.pending").exists())
+
+    def test_read_waits_for_another_process(self):
+        draw = _Drawing(blocked=True)
+        name = self.store.render("function_plot", [1], draw)
+        other = PlotStore(self.directory, max_bytes=10**6, max_age=3600, wait_timeout=10)
+        threading.Timer(0.1, draw.release.set).start()
+        self.assertEqual(other.read(name), b"<svg/>")
@@ -0,0 +1,72 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.polyline_simplification import (
+    simplification_mask,
+    simplification_stats,
+    simplify_for_figure,
+)
+
+
+def _max_deviation(px, py, keep) -> float:
+    # Distancia máxima de cada punto al segmento de la curva simplificada que lo reemplaza.
+    kept = np.flatnonzero(keep)
+    deviation = 0.0
+    for start, end in zip(kept[:-1], kept[1:]):
+        dx, dy = px[end] - px[start], py[end] - py[start]
+        offset_x, offset_y = px[start:end] - px[start], py[start:end] - py[start]
+        t = np.clip((offset_x * dx + offset_y * dy) / (dx * dx + dy * dy), 0, 1)
+        deviation = max(deviation, float(np.hypot(offset_x - t * dx, offset_y - t * dy).max()))
+    return deviation
+
+
+class SimplificationMaskTests(SimpleTestCase):
+    def test_straight_line_keeps_only_its_ends(self):
+        px = np.linspace(0, 100, 50)
+        keep = simplification_mask(px, 2 * px + 1, tolerance=0.25)
+        self.assertEqual(np.flatnonzero(keep).tolist(), [0, 49])
+
+    def test_deviation_stays_within_the_tolerance(self):
+        px = np.linspace(0, 600, 2000)
+        py = 150 * np.sin(px / 40)
+        for tolerance in (0.25, 1.0, 5.0):
+            with self.subTest(tolerance=tolerance):
+                keep = simplification_mask(px, py, tolerance)
+                self.assertLess(keep.sum(), len(px) / 4)
+                self.assertLessEqual(_max_deviation(px, py, keep), tolerance + 1e-9)
+
+    def test_non_finite_points_split_the_curve(self):
+        px = np.arange(9, dtype=float)
+        py = np.array([0, 1, 2, np.nan, 5, 5, 5, np.inf, 3])
+        keep = simplification_mask(px, py, tolerance=0.25)
+        self.assertEqual(np.flatnonzero(keep).tolist(), [0, 2, 3, 4, 6, 7, 8])
+
+    def test_zero_tolerance_keeps_everything(self):
+        px = np.linspace(0, 1, 10)
+        self.assertTrue(simplification_mask(px, px, tolerance=0).all())
+
+    def test_reduction_is_recorded(self):
+        simplification_stats.clear()
+        self.addCleanup(simplification_stats.clear)
+        px = np.linspace(0, 100, 50)
+        simplification_mask(px, px, tolerance=0.25)
+        self.assertEqual(simplification_stats.stats()["vertices_in"], 50)
+        self.assertEqual(simplification_stats.stats()["vertices_out"], 2)
+
+
+class SimplifyForFigureTests(SimpleTestCase):
+    def test_tolerance_is_in_pixels_of_the_figure(self):
+        # 0.001 en y son 0.0288 px en una figura de 4 pulgadas de alto con ylim (-1, 1).
+        x = np.linspace(0, 1, 200)
+        y = 0.001 * np.sin(40 * x)
+        simplified_x, _ = simplify_for_figure(x, y, figsize=(6, 4), ylim=(-1, 1), tolerance=0.25)
+        self.assertEqual(len(simplified_x), 2)
+        simplified_x, _ = simplify_for_figure(x, y, figsize=(6, 4), tolerance=0.25)
+        self.assertGreater(len(simplified_x), 2)
+
+    def test_curve_without_finite_points_is_returned_as_is(self):
+        x = np.array([0.0, 1.0])
+        y = np.array([np.nan, np.nan])
+        simplified_x, simplified_y = simplify_for_figure(x, y, figsize=(6, 4))
+        self.assertEqual(len(simplified_x), 2)
+        self.assertTrue(np.isnan(simplified_y).all())
@@ -0,0 +1,125 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from src.application.numerical_method.services.gauss_seidel_service import GaussSeidelService
+from src.application.numerical_method.services.jacobi_service import JacobiService
+from src.application.numerical_method.services.sor_service import SORService
+from src.application.shared.utils.plot_context import plot_context
+from src.application.shared.utils.prepared_system import JACOBI, SOR, PreparedSystem
+
+# Sistemas que convergen (diagonalmente dominantes) y sistemas que divergen.
+CONVERGENT = [
+    ([[4.0, -1.0, 0.0], [-1.0, 4.0, -1.0], [0.0, -1.0, 4.0]], [15.0, 10.0, 10.0], [0.0, 0.0, 0.0]),
+    ([[10.0, -1.0, 2.0, 0.0], [-1.0, 11.0, -1.0, 3.0], [2.0, -1.0, 10.0, -1.0], [0.0, 3.0, -1.0, 8.0]],
+     [6.0, 25.0, -11.0, 15.0], [0.0, 0.0, 0.0, 0.0]),
+    ([[2.0, 1.0], [5.0, 7.0]], [11.0, 13.0], [1.0, 1.0]),
+]
+DIVERGENT = [
+    ([[1.0, 0.9, 0.0], [0.9, 1.0, 0.9], [0.0, 0.9, 1.0]], [1.0, 2.0, 3.0], [0.0, 0.0, 0.0]),
+    ([[1.0, 2.0], [3.0, 1.0]], [1.0, 1.0], [0.0, 0.0]),
+]
+
+
+def _loop_jacobi_table(service: JacobiService, A, b, x0, tolerance, max_iterations, precision_type) -> dict:
+    # Iteración de Jacobi fila por fila, como se calculaba antes de vectorizarla.
+    A, b, x0 = np.array(A), np.array(b), np.array(x0)
+    n = len(b)
+    x1 = np.zeros_like(x0)
+    current_error = tolerance + 1
+    current_iteration = 0
+    table = {}
+    while current_error > tolerance and current_iteration < max_iterations:
+        for i in range(n):
+            sum_others = np.dot(A[i, :i], x0[:i]) + np.dot(A[i, i + 1 :], x0[i + 1 :])
+            x1[i] = (b[i] - sum_others) / A[i, i]
+        current_error = np.linalg.norm(x1 - x0, ord=np.inf)
+        table[current_iteration + 1] = {
+            "iteration": current_iteration + 1,
+            "X": service.apply_precision(x1.tolist(), precision_type, tolerance),
+            "Error": service.apply_precision([current_error], precision_type, tolerance)[0],
+        }
+        if current_error <= tolerance:
+            break
+        x0 = x1.copy()
+        current_iteration += 1
+    return table
+
+
+class PreparedSystemTests(SimpleTestCase):
+    def test_decomposition(self):
+        A, b, _ = CONVERGENT[1]
+        prepared = PreparedSystem(A, b)
+        np.testing.assert_array_equal(prepared.D + prepared.lower + prepared.upper, np.array(A))
+        np.testing.assert_array_equal(prepared.diagonal_inverse, 1 / np.diag(A))
+
+    def test_spectral_radius_of_each_method(self):
+        A, b, _ = CONVERGENT[1]
+        prepared = PreparedSystem(A, b)
+        D, L, U = np.diag(np.diag(A)), np.tril(A, -1), np.triu(A, 1)
+        expected = {
+            JACOBI: np.linalg.inv(D).dot(L + U),
+            SOR: np.linalg.inv(D + 1.2 * L).dot((1 - 1.2) * D - 1.2 * U),
+        }
+        for method, T in expected.items():
+            with self.subTest(method=method):
+                radius = prepared.spectral_radius(method, 1.2 if method == SOR else None)
+                self.assertAlmostEqual(radius, max(abs(np.linalg.eigvals(T))))
+
+    def test_eigenvalues_are_computed_once(self):
+        prepared = PreparedSystem(*CONVERGENT[0][:2])
+        self.assertIs(prepared.eigenvalues(JACOBI), prepared.eigenvalues(JACOBI))
+
+    def test_is_tridiagonal(self):
+        self.assertTrue(PreparedSystem(*CONVERGENT[0][:2]).is_tridiagonal())
+        self.assertFalse(PreparedSystem(*CONVERGENT[1][:2]).is_tridiagonal())
+
+
+class VectorizedJacobiTests(SimpleTestCase):
+    def _tables(self, A, b, x0, tolerance, max_iterations, precision_type) -> tuple[dict, dict]:
+        service = JacobiService()
+        with plot_context(render=False):
+            result = service.solve(A, b, x0, tolerance, max_iterations, precision_type)
+        return result["table"], _loop_jacobi_table(service, A, b, x0, tolerance, max_iterations, precision_type)
+
+    def test_table_matches_the_row_by_row_loop(self):
+        for A, b, x0 in CONVERGENT + DIVERGENT:
+            for tolerance, max_iterations in [(1e-7, 100), (0.5e-3, 10)]:
+                for precision_type in ("decimales_correctos", "cifras_significativas"):
+                    with self.subTest(A=A, tolerance=tolerance, precision_type=precision_type):
+                        table, expected = self._tables(A, b, x0, tolerance, max_iterations, precision_type)
+                        self.assertEqual(table.keys(), expected.keys())
+                        if (A, b, x0) in CONVERGENT:
+                            self.assertEqual(table, expected)
+                        # Con valores muy grandes la última cifra del producto puede quedar entre
+                        # los decimales que se muestran.
+                        for row, expected_row in zip(table.values(), expected.values()):
+                            np.testing.assert_allclose(row["X"], expected_row["X"], rtol=1e-12)
+
+    def test_prepared_system_gives_the_same_results(self):
+        A, b, x0 = CONVERGENT[1]
+        prepared = PreparedSystem(A, b)
+        solvers = [
+            lambda **kwargs: JacobiService().solve(A, b, x0, 1e-7, 100, **kwargs),
+            lambda **kwargs: GaussSeidelService().solve(A, b, x0, 1e-7, 100, 1, **kwargs),
+            lambda **kwargs: SORService().solve(A, b, x0, 1e-7, 100, 1.1, 1, **kwargs),
+        ]
+        for solve in solvers:
+            with self.subTest(solve=solve):
+                self.assertEqual(solve(prepared=prepared)["table"], solve()["table"])
+
+
+class SORIterationsTests(SimpleTestCase):
+    def test_iterations_match_the_table_of_solve(self):
+        service = SORService()
+        for A, b, x0 in CONVERGENT:
+            prepared = PreparedSystem(A, b)
+            for omega in (0.8, 1.0, 1.25):
+                with self.subTest(A=A, omega=omega), plot_context(render=False):
+                    result = service.solve(A, b, x0, 1e-6, 200, omega, 1, prepared=prepared)
+                    iterations = service.iterations_to_converge(prepared, x0, 1e-6, 200, omega, 1)
+                    self.assertEqual(iterations, len(result["table"]))
+
+    def test_divergent_system(self):
+        for A, b, x0 in DIVERGENT:
+            with self.subTest(A=A):
+                self.assertIsNone(SORService().iterations_to_converge(PreparedSystem(A, b), x0, 1e-6, 500, 1.0, 1))
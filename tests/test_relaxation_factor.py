@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from src.application.numerical_method.services.sor_service import SORService
+from src.application.numerical_method.utils.relaxation_factor import (
+    FALLBACK,
+    SWEEP,
+    YOUNG,
+    select_relaxation_factor,
+    young_relaxation_factor,
+)
+from src.application.shared.utils.plot_context import plot_context
+from src.application.shared.utils.prepared_system import PreparedSystem
+
+
+def _poisson(n: int) -> tuple[list[list[float]], list[float]]:
+    # Matriz tridiagonal (2, -1) de la ecuación de Poisson en una dimensión.
+    A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    return A.tolist(), [1.0] * n
+
+
+def _sor_iterations(A, b, omega: float) -> int:
+    with plot_context(render=False):
+        return len(SORService().solve(A, b, [0.0] * len(b), 1e-8, 10000, omega, 1)["table"])
+
+
+class YoungRelaxationFactorTests(SimpleTestCase):
+    def test_formula_for_the_poisson_matrix(self):
+        # El radio espectral de Jacobi es cos(pi / (n + 1)).
+        A, b = _poisson(8)
+        radius = math.cos(math.pi / 9)
+        self.assertAlmostEqual(young_relaxation_factor(PreparedSystem(A, b)), 2 / (1 + math.sqrt(1 - radius**2)))
+
+    def test_optimal_factor_beats_gauss_seidel(self):
+        A, b = _poisson(8)
+        omega = young_relaxation_factor(PreparedSystem(A, b))
+        best = _sor_iterations(A, b, omega)
+        self.assertLess(best, _sor_iterations(A, b, 1.0) / 2)
+        for other in (omega - 0.1, omega + 0.1):
+            with self.subTest(other=other):
+                self.assertLessEqual(best, _sor_iterations(A, b, other))
+
+    def test_theory_does_not_apply(self):
+        not_tridiagonal = [[4.0, 1.0, 1.0], [1.0, 4.0, 1.0], [1.0, 1.0, 4.0]]
+        divergent_jacobi = [[1.0, 2.0, 0.0], [2.0, 1.0, 2.0], [0.0, 2.0, 1.0]]
+        complex_eigenvalues = [[1.0, 1.0, 0.0], [-1.0, 2.0, 0.5], [0.0, -1.0, 2.0]]
+        for A in (not_tridiagonal, divergent_jacobi, complex_eigenvalues):
+            with self.subTest(A=A):
+                self.assertIsNone(young_relaxation_factor(PreparedSystem(A, [1.0, 1.0, 1.0])))
+
+
+class SelectRelaxationFactorTests(SimpleTestCase):
+    def test_young_when_the_theory_applies(self):
+        A, b = _poisson(6)
+        selection = select_relaxation_factor(A, b, [0.0] * 6, 1e-8, 1000, 1)
+        self.assertEqual(selection["selection"], YOUNG)
+        self.assertEqual(selection["sweep"], [])
+        self.assertAlmostEqual(selection["jacobi_spectral_radius"], math.cos(math.pi / 7))
+
+    def test_sweep_picks_the_factor_with_fewest_iterations(self):
+        A = [[4.0, 1.0, 1.0], [1.0, 4.0, 1.0], [1.0, 1.0, 4.0]]
+        b = [6.0, 6.0, 6.0]
+        selection = select_relaxation_factor(A, b, [0.0] * 3, 1e-8, 200, 1)
+        self.assertEqual(selection["selection"], SWEEP)
+        converged = [point for point in selection["sweep"] if point["iterations"] is not None]
+        fewest = min(point["iterations"] for point in converged)
+        self.assertEqual(_sor_iterations(A, b, selection["relaxation_factor"]), fewest)
+        omegas = [point["omega"] for point in selection["sweep"]]
+        self.assertEqual(omegas, sorted(omegas))
+
+    def test_fallback_to_gauss_seidel(self):
+        A = [[1.0, 3.0], [3.0, 1.0]]
+        selection = select_relaxation_factor(A, [1.0, 1.0], [0.0, 0.0], 1e-8, 50, 1)
+        self.assertEqual((selection["selection"], selection["relaxation_factor"]), (FALLBACK, 1.0))
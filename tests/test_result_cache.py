@@ -0,0 +1,193 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.result_cache import ResultCache, cache_key
+
+
+class _Blocked:
+    # Cálculo que no termina hasta que la prueba lo libera, y cuenta cuántas veces empezó.
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(10)
+        if isinstance(self.value, BaseException):
+            raise self.value
+        return self.value
+
+
+def _in_thread(function) -> tuple[threading.Thread, list]:
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function()))
+    thread.start()
+    return thread, result
+
+
+class CacheKeyTests(SimpleTestCase):
+    def test_equal_inputs_share_a_key(self):
+        self.assertEqual(cache_key("roots", {"a": 1, "b": [2, 3]}), cache_key("roots", {"b": [2.0, 3], "a": 1.0}))
+
+    def test_different_inputs(self):
+        self.assertNotEqual(cache_key("roots", {"a": 1}), cache_key("matrix", {"a": 1}))
+        self.assertNotEqual(cache_key(True), cache_key(1))
+
+
+class ResultCacheTests(SimpleTestCase):
+    def test_hit_and_miss(self):
+        cache = ResultCache(max_entries=2, ttl=60)
+        self.assertEqual(cache.get_or_compute("a", lambda: 1), 1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 1)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (1, 1))
+
+    def test_entries_expire(self):
+        cache = ResultCache(max_entries=2, ttl=0.05)
+        cache.get_or_compute("a", lambda: 1)
+        time.sleep(0.1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ResultCache(max_entries=2, ttl=60)
+        for key in ("a", "b"):
+            cache.get_or_compute(key, lambda: key)
+        cache.get_or_compute("a", lambda: "otro")
+        cache.get_or_compute("c", lambda: "c")
+        self.assertEqual(cache.get_or_compute("a", lambda: "otro"), "a")
+        self.assertEqual(cache.get_or_compute("b", lambda: "nuevo"), "nuevo")
+
+    def test_zero_entries_stores_nothing(self):
+        cache = ResultCache(max_entries=0, ttl=60)
+        cache.get_or_compute("a", lambda: 1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+
+    def test_none_is_cached(self):
+        cache = ResultCache(max_entries=2, ttl=60)
+        cache.get_or_compute("a", lambda: None)
+        self.assertIsNone(cache.get_or_compute("a", lambda: 1))
+
+
+class SingleFlightTests(SimpleTestCase):
+    def test_concurrent_requests_share_the_computation(self):
+        cache = ResultCache(max_entries=2, ttl=60, wait_timeout=10)
+        compute = _Blocked("valor")
+        leader, leader_result = _in_thread(lambda: cache.get_or_compute("a", compute))
+        compute.started.wait(10)
+        waiter, waiter_result = _in_thread(lambda: cache.get_or_compute("a", compute))
+        while cache.stats()["shared"] == 0:
+            time.sleep(0.01)
+        compute.release.set()
+        leader.join(10)
+        waiter.join(10)
+        self.assertEqual((leader_result, waiter_result), (["valor"], ["valor"]))
+        self.assertEqual(compute.calls, 1)
+
+    def test_waiters_retry_when_the_computation_fails(self):
+        cache = ResultCache(max_entries=2, ttl=60, wait_timeout=10)
+        failing = _Blocked(ValueError("falla"))
+        errors = []
+        leader = threading.Thread(target=lambda: self._capture(errors, lambda: cache.get_or_compute("a", failing)))
+        leader.start()
+        failing.started.wait(10)
+        waiter, waiter_result = _in_thread(lambda: cache.get_or_compute("a", lambda: "reintento"))
+        while cache.stats()["shared"] == 0:
+            time.sleep(0.01)
+        failing.release.set()
+        leader.join(10)
+        waiter.join(10)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertEqual(waiter_result, ["reintento"])
+        self.assertEqual(cache.get_or_compute("a", lambda: "otro"), "reintento")
+
+    def test_waiter_computes_itself_after_the_timeout(self):
+        cache = ResultCache(max_entries=2, ttl=60, wait_timeout=0.1)
+        slow = _Blocked("lento")
+        leader, leader_result = _in_thread(lambda: cache.get_or_compute("a", slow))
+        slow.started.wait(10)
+        start = time.monotonic()
+        self.assertEqual(cache.get_or_compute("a", lambda: "propio"), "propio")
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(cache.stats()["fallbacks"], 1)
+        slow.release.set()
+        leader.join(10)
+        self.assertEqual(leader_result, ["lento"])
+        self.assertEqual(cache.get_or_compute("a", lambda: "otro"), "lento")
+
+    @staticmethod
+    def _capture(errors, function):
+        try:
+            function()
+        except Exception as e:
+            errors.append(e)
+
+
+class StreamTests(SimpleTestCase):
+    def test_items_are_streamed_and_stored(self):
+        cache = ResultCache(max_entries=2, ttl=60)
+        produced = []
+
+        def produce():
+            for item in range(3):
+                produced.append(item)
+                yield item
+
+        stream = cache.stream("a", produce)
+        self.assertEqual(next(stream), 0)
+        self.assertEqual(produced, [0])
+        self.assertEqual(list(stream), [1, 2])
+        self.assertEqual(list(cache.stream("a", lambda: iter(["otro"]))), [0, 1, 2])
+
+    def test_waiter_receives_the_full_result(self):
+        cache = ResultCache(max_entries=2, ttl=60, wait_timeout=10)
+        release = threading.Event()
+
+        def produce():
+            yield 1
+            release.wait(10)
+            yield 2
+
+        leader = cache.stream("a", produce)
+        self.assertEqual(next(leader), 1)
+        waiter, waiter_result = _in_thread(lambda: list(cache.stream("a", lambda: iter(["otro"]))))
+        while cache.stats()["shared"] == 0:
+            time.sleep(0.01)
+        release.set()
+        self.assertEqual(list(leader), [2])
+        waiter.join(10)
+        self.assertEqual(waiter_result, [[1, 2]])
+
+    def test_abandoned_stream_releases_waiters_at_once(self):
+        cache = ResultCache(max_entries=2, ttl=60, wait_timeout=30)
+        leader = cache.stream("a", lambda: iter([1, 2, 3]))
+        self.assertEqual(next(leader), 1)
+        waiter, waiter_result = _in_thread(lambda: list(cache.stream("a", lambda: iter(["propio"]))))
+        while cache.stats()["shared"] == 0:
+            time.sleep(0.01)
+        start = time.monotonic()
+        leader.close()
+        waiter.join(10)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(waiter_result, [["propio"]])
+        self.assertEqual(cache.stats()["fallbacks"], 0)
+
+    def test_waiter_produces_itself_after_the_timeout(self):
+        cache = ResultCache(max_entries=2, ttl=60, wait_timeout=0.1)
+        leader = cache.stream("a", lambda: iter([1, 2]))
+        self.assertEqual(next(leader), 1)
+        self.assertEqual(list(cache.stream("a", lambda: iter(["propio"]))), ["propio"])
+        self.assertEqual(cache.stats()["fallbacks"], 1)
+        self.assertEqual(list(leader), [2])
+        self.assertEqual(list(cache.stream("a", lambda: iter(["otro"]))), [1, 2])
+
+    def test_result_that_is_not_cacheable(self):
+        cache = ResultCache(max_entries=2, ttl=60)
+        transient = cache.stream("a", lambda: iter([1, "transitorio"]), cacheable=lambda items: False)
+        self.assertEqual(list(transient), [1, "transitorio"])
+        self.assertEqual(list(cache.stream("a", lambda: iter([1, 2]), cacheable=lambda items: True)), [1, 2])
+        self.assertEqual(list(cache.stream("a", lambda: iter(["otro"]))), [1, 2])
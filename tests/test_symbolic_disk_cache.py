@@ -0,0 +1,94 @@
+import json
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+
+import sympy as sp
+from django.test import SimpleTestCase
+
+from src.application.shared.utils.expression_parser import parse_expression, x_symbol
+from src.application.shared.utils.symbolic_disk_cache import SymbolicDiskCache, _decode_expression
+
+
+class SymbolicDiskCacheTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "derivatives.sqlite3"
+        self.cache = SymbolicDiskCache(self.path, max_entries=3)
+
+    def _write_row(self, canonical: str, expressions: str) -> None:
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            connection.execute(
+                "UPDATE derivatives SET expressions = ? WHERE key = ?", (expressions, self.cache._key(canonical))
+            )
+
+    def test_round_trip(self):
+        f = parse_expression("x**(1/3) + 2*pi*sin(x) + trunc(x) + 0.5").sympy
+        expressions = [f, sp.diff(f, x_symbol), sp.diff(f, x_symbol, 2)]
+        self.cache.store("f", expressions)
+        self.assertEqual(self.cache.load("f"), expressions)
+
+    def test_missing_function(self):
+        self.assertIsNone(self.cache.load("f"))
+
+    def test_other_schema_version_is_a_miss(self):
+        self.cache.store("f", [x_symbol])
+        other = SymbolicDiskCache(self.path, max_entries=3)
+        other.version = "0:" + sp.__version__
+        self.assertIsNone(other.load("f"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        for name in ("a", "b", "c"):
+            self.cache.store(name, [sp.Symbol(name)])
+            time.sleep(0.01)
+        self.cache.load("a")
+        self.cache.store("d", [sp.Symbol("d")])
+        self.assertIsNone(self.cache.load("b"))
+        self.assertEqual(self.cache.load("a"), [sp.Symbol("a")])
+
+    def test_tampered_rows_are_misses(self):
+        self.cache.store("f", [x_symbol])
+        for payload in [
+            json.dumps(["__import__('os').system('false')"]),
+            json.dumps(["Symbol('x').__class__"]),
+            json.dumps(["Function('f')(Symbol('x'), **{})"]),
+            json.dumps(["Derivative(\"__import__('os').system('false')\", Symbol('x'))"]),
+            json.dumps(["Subs(Symbol('x'), Symbol('x'), \"__import__('os').system('false')\")"]),
+            json.dumps(["Symbol('x', real='__import__')"]),
+            json.dumps(["Add(" * 2000 + ")" * 2000]),
+            "no es JSON",
+            json.dumps([1]),
+        ]:
+            with self.subTest(payload=payload[:40]):
+                self._write_row("f", payload)
+                self.assertIsNone(self.cache.load("f"))
+
+    def test_file_that_is_not_a_database(self):
+        self.path.write_bytes(b"esto no es una base de datos" * 100)
+        self.assertIsNone(self.cache.load("f"))
+        self.cache.store("f", [x_symbol])
+        self.assertIsNone(self.cache.load("f"))
+
+
+class DecodeExpressionTests(SimpleTestCase):
+    def test_decodes_srepr(self):
+        for expression in [sp.Rational(1, 3) * x_symbol, sp.Piecewise((x_symbol, x_symbol > 0), (-x_symbol, True)), sp.oo]:
+            with self.subTest(expression=expression):
+                self.assertEqual(_decode_expression(sp.srepr(expression)), expression)
+
+    def test_rejects_anything_else(self):
+        for text in [
+            "os.system('false')",
+            "_basic_classes()",
+            "print('x')",
+            "Symbol(x)",
+            "lambda: 1",
+            "Symbol('x') + 1",
+            "Derivative('x', Symbol('x'))",
+            "Tuple(('x',))",
+        ]:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                _decode_expression(text)